@@ -1,6 +1,14 @@
+import sys
+from pathlib import Path
+
 from manim import *
 import numpy as np
 
+# Shared helpers live in blog_anim/ at the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from blog_anim.functions import FunctionSpec
+from blog_anim.text_cache import TextCache
+
 class UnderstandingDerivatives(Scene):
     def construct(self):
         # Title
@@ -29,14 +37,11 @@ class UnderstandingDerivatives(Scene):
         
         # Create a realistic driving curve (not constant speed)
         # Simulates: fast start, slow middle (traffic), fast end
-        def distance_func(t):
-            # Piecewise function simulating different speeds
-            if t < 20:
-                return 1.2 * t  # Fast: 72 km/h
-            elif t < 40:
-                return 24 + 0.3 * (t - 20)  # Slow: 18 km/h (traffic)
-            else:
-                return 30 + 1.0 * (t - 40)  # Medium: 60 km/h
+        # Piecewise: fast 72 km/h, slow 18 km/h (traffic), medium 60 km/h
+        distance_func = FunctionSpec(
+            "Piecewise((1.2*t, t < 20), (24 + 0.3*(t - 20), t < 40), (30 + 1.0*(t - 40), True))",
+            "t",
+        )
         
         # Create smooth curve
         curve = axes.plot(distance_func, x_range=[0, 60], color=BLUE, stroke_width=3)
@@ -53,9 +58,8 @@ class UnderstandingDerivatives(Scene):
         self.play(FadeIn(point))
         self.wait(1)
         
-        # Calculate slope at t=30 (numerical derivative)
-        dt = 0.1
-        slope = (distance_func(t_point + dt) - distance_func(t_point - dt)) / (2 * dt)
+        # Slope at t=30 (exact derivative)
+        slope = distance_func.derivative(t_point)
         
         # Draw tangent line
         tangent_length = 15
@@ -110,14 +114,26 @@ class UnderstandingDerivatives(Scene):
         slide_text.to_edge(UP).shift(DOWN * 0.8)
         self.play(Write(slide_text))
         
-        # Animate tangent line moving along curve
-        def get_tangent_at_t(t):
+        # Animate tangent line moving along curve. The line, dot and label are
+        # built once and moved every frame; the label is swapped for a cached
+        # copy only when the rounded speed actually changes
+        speed_labels = TextCache(font_size=16, color=RED)
+        
+        slide_line = Line(LEFT, RIGHT, color=RED, stroke_width=3)
+        slide_dot = Dot(color=RED, radius=0.08)
+        speed_label = speed_labels("Speed: 0 km/h").copy()
+        tangent_parts = [slide_line, slide_dot, speed_label]
+        shown_speed = None
+        
+        def update_tangent(group):
+            nonlocal shown_speed
+            t = t_tracker.get_value()
             if t < 1 or t > 59:
-                return VGroup()
+                group.submobjects = []
+                return
+            group.submobjects = list(tangent_parts)
             
-            dt = 0.1
-            slope = (distance_func(t + dt) - distance_func(t - dt)) / (2 * dt)
-            tangent_length = 15
+            slope = distance_func.derivative(t)
 
             # Ensure endpoints are computed from the actual x positions so the
             # tangent line always passes through the point (t, f(t)). When near
@@ -129,24 +145,23 @@ class UnderstandingDerivatives(Scene):
             y_left = distance_func(t) + slope * (x_left - t)
             y_right = distance_func(t) + slope * (x_right - t)
 
-            line = Line(
-                axes.c2p(x_left, y_left),
-                axes.c2p(x_right, y_right),
-                color=RED,
-                stroke_width=3
-            )
-            dot = Dot(axes.c2p(t, distance_func(t)), color=RED, radius=0.08)
+            slide_line.put_start_and_end_on(axes.c2p(x_left, y_left), axes.c2p(x_right, y_right))
+            point = axes.c2p(t, distance_func(t))
+            slide_dot.move_to(point)
             
             # Speed label
             speed_kmh = slope * 60  # Convert to km/h
-            speed_text = Text(f"Speed: {speed_kmh:.0f} km/h", font_size=16, color=RED)
-            speed_text.next_to(axes.c2p(t, distance_func(t)), UR, buff=0.3)
-            
-            return VGroup(line, dot, speed_text)
+            speed_text = f"Speed: {speed_kmh:.0f} km/h"
+            if speed_text != shown_speed:
+                speed_label.become(speed_labels(speed_text))
+                shown_speed = speed_text
+            speed_label.next_to(point, UR, buff=0.3)
         
         # Tracker for animation
         t_tracker = ValueTracker(5)
-        tangent_group = always_redraw(lambda: get_tangent_at_t(t_tracker.get_value()))
+        tangent_group = VGroup(*tangent_parts)
+        tangent_group.add_updater(update_tangent)
+        update_tangent(tangent_group)
         
         self.add(tangent_group)
         
@@ -1,6 +1,15 @@
+import sys
+from pathlib import Path
+
 from manim import *
 import numpy as np
 
+# Shared helpers live in blog_anim/ at the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from blog_anim.loss_plots import LossPlot
+from blog_anim.optim import descend
+from blog_anim.trajectory import Trajectory, TrajectoryAnimation
+
 class LearningRateTooBig(Scene):
     def construct(self):
         # Title
@@ -9,28 +18,18 @@ class LearningRateTooBig(Scene):
         self.play(Write(title))
         self.wait(1)
         
-        # Setup axes
-        axes = Axes(
-            x_range=[-5, 5, 1],
-            y_range=[0, 20, 5],
-            x_length=10,
-            y_length=5,
-            axis_config={"include_tip": True},
-        )
+        # Setup axes, the loss curve and its minimum
+        plot = LossPlot(y_max=20, y_length=5)
+        axes = plot.axes
         
         # Labels
         x_label = axes.get_x_axis_label("w", direction=DOWN)
         y_label = axes.get_y_axis_label("L", direction=LEFT)
         
-        # Function: f(x) = x^2 (simple parabola)
-        def loss_func(x):
-            return x**2
-        
-        # Plot the loss function
-        graph = axes.plot(loss_func, x_range=[-4.5, 4.5], color=BLUE, stroke_width=3)
-        
-        # Minimum point
-        min_point = Dot(axes.c2p(0, 0), color=GREEN, radius=0.12)
+        # Function: f(x) = x^2 (simple parabola), its plot and minimum point
+        loss_func = plot.loss
+        graph = plot.graph
+        min_point = plot.min_point
         min_label = Text("Minimum", font_size=20, color=GREEN).next_to(min_point, DOWN)
         
         self.play(Create(axes), Write(x_label), Write(y_label))
@@ -40,62 +39,35 @@ class LearningRateTooBig(Scene):
         
         # Starting point (far from minimum)
         start_x = 4.0
-        current_x = start_x
         
         # Learning rate (too large)
         alpha = 0.99  # Will cause oscillation
         
         # Create path
-        points = [current_x]
         path_dots = VGroup()
-        path_lines = VGroup()
         
         # Starting dot
-        current_dot = Dot(axes.c2p(current_x, loss_func(current_x)), 
+        current_dot = Dot(axes.c2p(start_x, loss_func(start_x)), 
                          color=RED, radius=0.1)
         path_dots.add(current_dot)
         self.play(FadeIn(current_dot))
         
-        # Gradient descent iterations (oscillating)
+        # Gradient descent iterations (oscillating): each update overshoots,
+        # kept within bounds for visualization
         num_iterations = 20
-        
-        for i in range(num_iterations):
-            # Compute gradient (derivative of x^2 is 2x)
-            gradient = 2 * current_x
-            
-            # Update (this will overshoot!)
-            new_x = current_x - alpha * gradient
-            
-            # Keep within bounds for visualization
-            new_x = np.clip(new_x, -4.5, 4.5)
-            
-            points.append(new_x)
-            
-            # Draw line from current to new position
-            line = Line(
-                axes.c2p(current_x, loss_func(current_x)),
-                axes.c2p(new_x, loss_func(new_x)),
-                color=YELLOW,
-                stroke_width=2
-            )
-            
-            # New dot
-            new_dot = Dot(axes.c2p(new_x, loss_func(new_x)), 
-                         color=RED, radius=0.08)
-            
-            path_lines.add(line)
-            path_dots.add(new_dot)
-            
-            self.play(
-                Create(line),
-                FadeIn(new_dot),
-                run_time=0.4
-            )
-            
-            current_x = new_x
-            
-            # Small pause
-            self.wait(0.2)
+        run = descend(loss_func.derivative, start_x, alpha, num_iterations, bounds=(-4.5, 4.5))
+        
+        # Draw every step in one play: line to the new position and new dot
+        # over 0.4s, then a small pause
+        xs = run.path()
+        trajectory = Trajectory(
+            plot.graph_points(xs),
+            color=YELLOW,
+            dot_color=RED,
+            dot_radius=0.08,
+        )
+        path_dots.add(*trajectory.dots)
+        self.play(TrajectoryAnimation(trajectory, step_time=0.4, pause=0.2))
         
         # Show oscillation text
         oscillation_text = Text(
@@ -128,23 +100,15 @@ class LearningRateTooSmall(Scene):
         self.wait(1)
         
         # Same setup
-        axes = Axes(
-            x_range=[-5, 5, 1],
-            y_range=[0, 25, 5],
-            x_length=10,
-            y_length=5,
-            axis_config={"include_tip": True},
-        )
+        plot = LossPlot(y_max=25, y_length=5)
+        axes = plot.axes
         
         x_label = axes.get_x_axis_label("w", direction=DOWN)
         y_label = axes.get_y_axis_label("L", direction=LEFT)
         
-        def loss_func(x):
-            return x**2
-        
-        graph = axes.plot(loss_func, x_range=[-4.5, 4.5], color=BLUE, stroke_width=3)
-        
-        min_point = Dot(axes.c2p(0, 0), color=GREEN, radius=0.12)
+        loss_func = plot.loss
+        graph = plot.graph
+        min_point = plot.min_point
         min_label = Text("Minimum", font_size=20, color=GREEN).next_to(min_point, DOWN)
         
         self.play(Create(axes), Write(x_label), Write(y_label))
@@ -154,48 +118,31 @@ class LearningRateTooSmall(Scene):
         
         # Starting point
         start_x = 4.0
-        current_x = start_x
         
         # Learning rate (too small)
         alpha = 0.005  # Tiny steps
         
         path_dots = VGroup()
-        path_lines = VGroup()
         
-        current_dot = Dot(axes.c2p(current_x, loss_func(current_x)), 
+        current_dot = Dot(axes.c2p(start_x, loss_func(start_x)), 
                          color=ORANGE, radius=0.1)
         path_dots.add(current_dot)
         self.play(FadeIn(current_dot))
         
         # Many iterations, slow progress
         num_iterations = 50
-        
-        for i in range(num_iterations):
-            gradient = 2 * current_x
-            new_x = current_x - alpha * gradient
-            
-            line = Line(
-                axes.c2p(current_x, loss_func(current_x)),
-                axes.c2p(new_x, loss_func(new_x)),
-                color=YELLOW,
-                stroke_width=2
-            )
-            
-            new_dot = Dot(axes.c2p(new_x, loss_func(new_x)), 
-                         color=ORANGE, radius=0.06)
-            
-            path_lines.add(line)
-            path_dots.add(new_dot)
-            
-            self.play(
-                Create(line),
-                FadeIn(new_dot),
-                run_time=0.2
-            )
-            
-            current_x = new_x
-            
-            self.wait(0.1)
+        run = descend(loss_func.derivative, start_x, alpha, num_iterations)
+        
+        # All 50 steps in one play, 0.2s each plus a 0.1s pause
+        xs = run.path()
+        trajectory = Trajectory(
+            plot.graph_points(xs),
+            color=YELLOW,
+            dot_color=ORANGE,
+            dot_radius=0.06,
+        )
+        path_dots.add(*trajectory.dots)
+        self.play(TrajectoryAnimation(trajectory, step_time=0.2, pause=0.1))
         
         slow_text = Text(
             "Tiny steps, painfully slow!\nStill far from minimum after 50 iterations",
@@ -215,23 +162,15 @@ class LearningRateJustRight(Scene):
         self.play(Write(title))
         self.wait(1)
         
-        axes = Axes(
-            x_range=[-5, 5, 1],
-            y_range=[0, 25, 5],
-            x_length=10,
-            y_length=6,
-            axis_config={"include_tip": True},
-        )
+        plot = LossPlot(y_max=25, y_length=6)
+        axes = plot.axes
         
         x_label = axes.get_x_axis_label("w", direction=DOWN)
         y_label = axes.get_y_axis_label("L", direction=LEFT)
         
-        def loss_func(x):
-            return x**2
-        
-        graph = axes.plot(loss_func, x_range=[-4.5, 4.5], color=BLUE, stroke_width=3)
-        
-        min_point = Dot(axes.c2p(0, 0), color=GREEN, radius=0.12)
+        loss_func = plot.loss
+        graph = plot.graph
+        min_point = plot.min_point
         min_label = Text("Minimum", font_size=20, color=GREEN).next_to(min_point, DOWN)
         
         self.play(Create(axes), Write(x_label), Write(y_label))
@@ -241,52 +180,35 @@ class LearningRateJustRight(Scene):
         
         # Starting point
         start_x = 4.0
-        current_x = start_x
         
         # Learning rate (just right)
         alpha = 0.1  # Good balance
         
         path_dots = VGroup()
-        path_lines = VGroup()
         
-        current_dot = Dot(axes.c2p(current_x, loss_func(current_x)), 
+        current_dot = Dot(axes.c2p(start_x, loss_func(start_x)), 
                          color=GREEN, radius=0.1)
         path_dots.add(current_dot)
         self.play(FadeIn(current_dot))
         
         # Efficient convergence
         num_iterations = 20
-        
-        for i in range(num_iterations):
-            gradient = 2 * current_x
-            new_x = current_x - alpha * gradient
-            
-            # Stop if very close to minimum
-            if abs(new_x) < 0.05:
-                break
-            
-            line = Line(
-                axes.c2p(current_x, loss_func(current_x)),
-                axes.c2p(new_x, loss_func(new_x)),
-                color=YELLOW,
-                stroke_width=2
-            )
-            
-            new_dot = Dot(axes.c2p(new_x, loss_func(new_x)), 
-                         color=GREEN, radius=0.08)
-            
-            path_lines.add(line)
-            path_dots.add(new_dot)
-            
-            self.play(
-                Create(line),
-                FadeIn(new_dot),
-                run_time=0.3
-            )
-            
-            current_x = new_x
-            
-            self.wait(0.15)
+        run = descend(loss_func.derivative, start_x, alpha, num_iterations, target=0.0, tol=0.05)
+        
+        # Stop just before it gets very close to minimum
+        xs = run.path()
+        if run.converged:
+            xs = xs[:-1]
+        
+        # The whole descent in one play, 0.3s per step plus a 0.15s pause
+        trajectory = Trajectory(
+            plot.graph_points(xs),
+            color=YELLOW,
+            dot_color=GREEN,
+            dot_radius=0.08,
+        )
+        path_dots.add(*trajectory.dots)
+        self.play(TrajectoryAnimation(trajectory, step_time=0.3, pause=0.15))
         
         good_text = Text(
             "Smooth convergence!\nReaches minimum efficiently",
@@ -0,0 +1,73 @@
+import sys
+from pathlib import Path
+
+from manim import *
+import numpy as np
+
+# Shared helpers live in blog_anim/ at the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from blog_anim.loss_plots import LOSS, LossPlot
+from blog_anim.optim import descend
+from blog_anim.trajectory import TrajectoryAnimation, TrajectoryBundle
+
+class LearningRateSweep(Scene):
+    def construct(self):
+        # Title
+        title = Text("Learning Rate Sweep", font_size=32)
+        title.to_edge(UP, buff=0.3)
+        self.play(Write(title))
+
+        # 24 learning rates, log-spaced from far too small to too large
+        rows, cols = 4, 6
+        alphas = np.geomspace(0.005, 1.1, rows * cols)
+        start_x = 4.0
+        num_iterations = 40
+
+        # One small loss plot per learning rate (same parabola as the
+        # LearningRate scenes, without tips or axis labels)
+        panels = VGroup(*[
+            LossPlot(y_max=25, x_length=1.9, y_length=1.0, include_tip=False, stroke_width=2, min_radius=0.04)
+            for _ in alphas
+        ])
+        panels.arrange_in_grid(rows, cols, buff=(0.4, 0.45))
+        panels.next_to(title, DOWN, buff=0.5)
+
+        labels = VGroup(*[
+            Text(f"α = {alpha:.3g}", font_size=14).next_to(panel, UP, buff=0.08)
+            for alpha, panel in zip(alphas, panels)
+        ])
+
+        self.play(Create(panels), run_time=2)
+        self.play(Write(labels))
+        self.wait(1)
+
+        # Every descent in one vectorized run; a trajectory that leaves the
+        # plot counts as diverged
+        run = descend(LOSS.derivative, start_x, alphas, num_iterations, target=0.0, tol=0.05, diverge_above=5.0)
+
+        # Iterates onto each panel's curve, held at the edge once they leave it
+        xs = np.clip(run.iterates, -4.75, 4.75)
+        points = np.stack([panel.graph_points(xs[:, k]) for k, panel in enumerate(panels)], axis=1)
+
+        # All panels step together: two paths per frame for all 24 trails
+        trails = TrajectoryBundle(points, color=YELLOW, stroke_width=1.5, head_color=RED, head_radius=0.05)
+        self.play(TrajectoryAnimation(trails, step_time=0.15, pause=0.05))
+        self.wait(1)
+
+        # Color each learning rate by how its descent ended
+        outcome_colors = [
+            GREEN if converged else RED if diverged else ORANGE
+            for converged, diverged in zip(run.converged, run.diverged)
+        ]
+        legend = VGroup(
+            Text("converges", font_size=18, color=GREEN),
+            Text(f"not there after {num_iterations} steps", font_size=18, color=ORANGE),
+            Text("diverges", font_size=18, color=RED),
+        ).arrange(RIGHT, buff=0.8)
+        legend.to_edge(DOWN, buff=0.25)
+
+        self.play(
+            *[label.animate.set_color(color) for label, color in zip(labels, outcome_colors)],
+            FadeIn(legend),
+        )
+        self.wait(3)
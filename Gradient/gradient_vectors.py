@@ -1,6 +1,15 @@
+import sys
+from pathlib import Path
+
 from manim import *
 import numpy as np
 
+# Shared helpers live in blog_anim/ at the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from blog_anim.fields import gradient_field
+from blog_anim.functions import FunctionSpec
+from blog_anim.surfaces import graph_surface
+
 class GradientVectors(ThreeDScene):
     def construct(self):
         # Title
@@ -25,17 +34,14 @@ class GradientVectors(ThreeDScene):
         y_label = MathTex("y", font_size=28).next_to(axes.y_axis, UP)
         z_label = MathTex("f", font_size=28).next_to(axes.z_axis, OUT)
         
-        # Function: f(x,y) = x^2 + y^2
-        def func(x, y):
-            return x**2 + y**2
-        
-        # Gradient function
-        def gradient(x, y):
-            return np.array([2*x, 2*y, 0])
+        # Function: f(x,y) = x^2 + y^2, and its gradient [df/dx, df/dy]
+        func = FunctionSpec("x**2 + y**2", "x y")
+        gradient = func.gradient
         
         # Create surface
-        surface = Surface(
-            lambda u, v: axes.c2p(u, v, func(u, v)),
+        surface = graph_surface(
+            axes,
+            func,
             u_range=[-3, 3],
             v_range=[-3, 3],
             resolution=(30, 30),
@@ -168,13 +174,11 @@ class GradientVectors(ThreeDScene):
         ]
         
         dots = VGroup()
-        arrows = VGroup()
         
         scale = 0.4  # Scale for arrows
         
         for x_p, y_p in points_list:
             z_p = func(x_p, y_p)
-            grad = gradient(x_p, y_p)
             
             # Dot
             dot = Dot3D(
@@ -183,17 +187,22 @@ class GradientVectors(ThreeDScene):
                 radius=0.08
             )
             dots.add(dot)
-            
-            # Arrow
-            arrow = Arrow3D(
-                start=axes.c2p(x_p, y_p, z_p),
-                end=axes.c2p(x_p + scale*grad[0], y_p + scale*grad[1], z_p),
-                color=YELLOW,
-                thickness=0.015,
-                height=0.25,
-                base_radius=0.06,
-            )
-            arrows.add(arrow)
+        
+        # Arrows: all gradients at once, posed from one shared arrow mesh
+        x_points, y_points = np.array(points_list).T
+        arrows = gradient_field(
+            axes,
+            func,
+            gradient,
+            x_points,
+            y_points,
+            scale=scale,
+            color=YELLOW,
+            thickness=0.015,
+            height=0.25,
+            base_radius=0.06,
+            resolution=16,
+        )
         
         # Show all dots
         self.play(LaggedStart(*[FadeIn(dot, scale=0.5) for dot in dots], lag_ratio=0.15))
@@ -1,7 +1,17 @@
+import sys
+from pathlib import Path
+
 from manim import *
 import numpy as np
 
-class PartialDerivatives3D(ThreeDScene):
+# Shared helpers live in blog_anim/ at the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from blog_anim.functions import FunctionSpec
+from blog_anim.geometry import SliceFactory
+from blog_anim.orbit import OrbitMixin
+from blog_anim.surfaces import graph_surface
+
+class PartialDerivatives3D(OrbitMixin, ThreeDScene):
     def construct(self):
         # Title
         title = Text("Partial Derivatives Visualization", font_size=32)
@@ -26,12 +36,16 @@ class PartialDerivatives3D(ThreeDScene):
         z_label = MathTex("f(x,y)", font_size=28).next_to(axes.z_axis, OUT)
         
         # Function: f(x,y) = x^2 + y^2
-        def func(x, y):
-            return x**2 + y**2
+        func = FunctionSpec("x**2 + y**2", "x y")
+        
+        # Slice planes, nets and curves are built once and copied when the
+        # same geometry is asked for again in part 3
+        slices = SliceFactory(axes)
         
         # Create surface with better visibility
-        surface = Surface(
-            lambda u, v: axes.c2p(u, v, func(u, v)),
+        surface = graph_surface(
+            axes,
+            func,
             u_range=[-3, 3],
             v_range=[-3, 3],
             resolution=(25, 25),
@@ -70,36 +84,29 @@ class PartialDerivatives3D(ThreeDScene):
         y_fixed = 1.0
         
         # Semi-transparent plane showing the slice
-        plane_x = Surface(
-            lambda u, v: axes.c2p(u, y_fixed, v),
+        plane_x = slices.plane(
+            "y", y_fixed,
             u_range=[-3, 3],
             v_range=[0, 10],
-            resolution=(25, 25),
             fill_opacity=0.1,
             color=YELLOW,
             stroke_opacity=0.1,
         )
         
         # Netted wall: grid lines on the plane
-        grid_lines_x = VGroup()
-        for i in range(-3, 4):
-            grid_lines_x.add(Line(
-                axes.c2p(i, y_fixed, 0),
-                axes.c2p(i, y_fixed, 10),
-                color=YELLOW,
-                stroke_width=2,
-            ))
-        for j in range(0, 11, 2):
-            grid_lines_x.add(Line(
-                axes.c2p(-3, y_fixed, j),
-                axes.c2p(3, y_fixed, j),
-                color=YELLOW,
-                stroke_width=2,
-            ))
+        grid_lines_x = slices.grid(
+            "y", y_fixed,
+            u_ticks=range(-3, 4),
+            v_ticks=range(0, 11, 2),
+            u_range=[-3, 3],
+            v_range=[0, 10],
+            color=YELLOW,
+            stroke_width=2,
+        )
         
         # Just the curve
-        curve_x = ParametricFunction(
-            lambda t: axes.c2p(t, y_fixed, func(t, y_fixed)),
+        curve_x = slices.graph_slice(
+            func, "y", y_fixed,
             t_range=[-3, 3],
             color=YELLOW,
             stroke_width=8,
@@ -149,36 +156,29 @@ class PartialDerivatives3D(ThreeDScene):
         x_fixed = 1.0
         
         # Semi-transparent plane showing the slice
-        plane_y = Surface(
-            lambda u, v: axes.c2p(x_fixed, u, v),
+        plane_y = slices.plane(
+            "x", x_fixed,
             u_range=[-3, 3],
             v_range=[0, 10],
-            resolution=(25, 25),
             fill_opacity=0.1,
             color=GREEN,
             stroke_opacity=0.1,
         )
         
         # Netted wall: grid lines on the plane
-        grid_lines_y = VGroup()
-        for i in range(-3, 4):
-            grid_lines_y.add(Line(
-                axes.c2p(x_fixed, i, 0),
-                axes.c2p(x_fixed, i, 10),
-                color=GREEN,
-                stroke_width=2,
-            ))
-        for j in range(0, 11, 2):
-            grid_lines_y.add(Line(
-                axes.c2p(x_fixed, -3, j),
-                axes.c2p(x_fixed, 3, j),
-                color=GREEN,
-                stroke_width=2,
-            ))
+        grid_lines_y = slices.grid(
+            "x", x_fixed,
+            u_ticks=range(-3, 4),
+            v_ticks=range(0, 11, 2),
+            u_range=[-3, 3],
+            v_range=[0, 10],
+            color=GREEN,
+            stroke_width=2,
+        )
         
         # Just the curve
-        curve_y = ParametricFunction(
-            lambda t: axes.c2p(x_fixed, t, func(x_fixed, t)),
+        curve_y = slices.graph_slice(
+            func, "x", x_fixed,
             t_range=[-3, 3],
             color=GREEN,
             stroke_width=8,
@@ -226,69 +226,55 @@ class PartialDerivatives3D(ThreeDScene):
         self.play(Write(title_both))
         
         # Recreate both planes
-        plane_x_final = Surface(
-            lambda u, v: axes.c2p(u, y_fixed, v),
+        plane_x_final = slices.plane(
+            "y", y_fixed,
             u_range=[-3, 3],
             v_range=[0, 10],
-            resolution=(25, 25),
             fill_opacity=0.1,
             color=YELLOW,
             stroke_opacity=0.1,
         )
         
-        plane_y_final = Surface(
-            lambda u, v: axes.c2p(x_fixed, u, v),
+        plane_y_final = slices.plane(
+            "x", x_fixed,
             u_range=[-3, 3],
             v_range=[0, 10],
-            resolution=(25, 25),
             fill_opacity=0.1,
             color=GREEN,
             stroke_opacity=0.1,
         )
         
         # Netted walls: grid lines on the planes
-        grid_lines_x_final = VGroup()
-        for i in range(-3, 4):
-            grid_lines_x_final.add(Line(
-                axes.c2p(i, y_fixed, 0),
-                axes.c2p(i, y_fixed, 10),
-                color=YELLOW,
-                stroke_width=2,
-            ))
-        for j in range(0, 11, 2):
-            grid_lines_x_final.add(Line(
-                axes.c2p(-3, y_fixed, j),
-                axes.c2p(3, y_fixed, j),
-                color=YELLOW,
-                stroke_width=2,
-            ))
-        
-        grid_lines_y_final = VGroup()
-        for i in range(-3, 4):
-            grid_lines_y_final.add(Line(
-                axes.c2p(x_fixed, i, 0),
-                axes.c2p(x_fixed, i, 10),
-                color=GREEN,
-                stroke_width=2,
-            ))
-        for j in range(0, 11, 2):
-            grid_lines_y_final.add(Line(
-                axes.c2p(x_fixed, -3, j),
-                axes.c2p(x_fixed, 3, j),
-                color=GREEN,
-                stroke_width=2,
-            ))
+        grid_lines_x_final = slices.grid(
+            "y", y_fixed,
+            u_ticks=range(-3, 4),
+            v_ticks=range(0, 11, 2),
+            u_range=[-3, 3],
+            v_range=[0, 10],
+            color=YELLOW,
+            stroke_width=2,
+        )
+        
+        grid_lines_y_final = slices.grid(
+            "x", x_fixed,
+            u_ticks=range(-3, 4),
+            v_ticks=range(0, 11, 2),
+            u_range=[-3, 3],
+            v_range=[0, 10],
+            color=GREEN,
+            stroke_width=2,
+        )
         
         # Recreate both curves
-        curve_x_final = ParametricFunction(
-            lambda t: axes.c2p(t, y_fixed, func(t, y_fixed)),
+        curve_x_final = slices.graph_slice(
+            func, "y", y_fixed,
             t_range=[-3, 3],
             color=YELLOW,
             stroke_width=7,
         )
         
-        curve_y_final = ParametricFunction(
-            lambda t: axes.c2p(x_fixed, t, func(x_fixed, t)),
+        curve_y_final = slices.graph_slice(
+            func, "x", x_fixed,
             t_range=[-3, 3],
             color=GREEN,
             stroke_width=7,
@@ -329,8 +315,6 @@ class PartialDerivatives3D(ThreeDScene):
         self.play(Write(formulas_both))
         
         # Gentle rotation to see both curves
-        self.begin_ambient_camera_rotation(rate=0.12)
-        self.wait(8)
-        self.stop_ambient_camera_rotation()
+        self.orbit(rate=0.12, run_time=8)
         
         self.wait(2)
\ No newline at end of file
@@ -1,8 +1,33 @@
+import sys
+from pathlib import Path
+
 from manim import *
 import numpy as np
 
+# Shared helpers live in blog_anim/ at the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from blog_anim.coords import coords_to_points
+from blog_anim.distributions import Bernoulli, Dice, Exponential, Pareto
+from blog_anim.histogram import IncrementalHistogram
+from blog_anim.polyline import GrowingPolyline
+
 class LLNandCLT(Scene):
+    # What is being averaged: a fair die by default
+    distribution = Dice(6)
+    
+    # Simulation - FEWER draws per sample for more variance!
+    num_samples = 300
+    sample_size = 20  # REDUCED to get more spread
+    seed = 123  # Different seed for better variance
+
     def construct(self):
+        num_samples = self.num_samples
+        dist = self.distribution
+        
+        # Axis ranges and bins follow from the distribution of the sample mean
+        low, high, step = dist.mean_range(self.sample_size)
+        bins = dist.bins(self.sample_size, low, high)
+        
         # Title
         title = Paragraph("Law of Large Numbers vs Central Limit Theorem", font_size=32).to_edge(UP)
         self.play(Write(title))
@@ -15,12 +40,12 @@ class LLNandCLT(Scene):
         self.wait(1)
         
         # Expected value
-        expected_value = 3.5
+        expected_value = dist.mean
         
         # Left side: WIDER Y-RANGE to see early variance
         lln_axes = Axes(
-            x_range=[0, 300, 20],
-            y_range=[2.8, 4.2, 0.4],  # Even more zoomed in!
+            x_range=[0, num_samples, num_samples // 15],
+            y_range=[low, high, 2 * step],  # Even more zoomed in!
             x_length=5.5,
             y_length=4,
             axis_config={"include_tip": False},
@@ -34,19 +59,19 @@ class LLNandCLT(Scene):
         # Expected value line - DASHED so blue line is visible
         expected_line = DashedLine(
             lln_axes.c2p(0, expected_value),
-            lln_axes.c2p(300, expected_value),
+            lln_axes.c2p(num_samples, expected_value),
             color=YELLOW,
             stroke_width=2,
             length=0.1
         )
-        expected_label = Paragraph("Expected: 3.5", font_size=12, color=YELLOW).next_to(
-            lln_axes.c2p(80, 3.5), UP, buff=0.1
+        expected_label = Paragraph(f"Expected: {expected_value:g}", font_size=12, color=YELLOW).next_to(
+            lln_axes.c2p(num_samples * 4 // 15, expected_value), UP, buff=0.1
         )
         self.play(Create(expected_line), Write(expected_label))
         
         # Right side: WIDER HISTOGRAM RANGE
         clt_axes = Axes(
-            x_range=[2.8, 4.2, 0.2],  # Show more extremes
+            x_range=[low, high, step],  # Show more extremes
             y_range=[0, 20, 5],
             x_length=5.5,
             y_length=4,
@@ -58,29 +83,16 @@ class LLNandCLT(Scene):
         
         self.play(Create(clt_axes), Write(clt_x_label), Write(clt_y_label))
         
-        # Simulation - FEWER dice per sample for more variance!
-        num_samples = 300
-        dice_per_sample = 20  # REDUCED to get more spread
-        
-        # Generate samples
-        np.random.seed(123)  # Different seed for better variance
-        averages = []
-        running_averages = []
-        
-        for i in range(num_samples):
-            dice_rolls = np.random.randint(1, 7, dice_per_sample)
-            sample_avg = np.mean(dice_rolls)
-            averages.append(sample_avg)
-            
-            running_avg = np.mean(averages)
-            running_averages.append(running_avg)
+        # Generate samples: all draws made in chunks, running average by cumsum
+        averages, running_averages = dist.simulate(
+            num_samples, self.sample_size, seed=self.seed
+        )
         
-        # Points for LLN line
-        points = [lln_axes.c2p(i, running_averages[i]) for i in range(num_samples)]
+        # Points for LLN line, mapped through the axes in one NumPy call
+        points = coords_to_points(lln_axes, np.arange(num_samples), running_averages)
         
         # Initial line - THICKER and BRIGHTER
-        running_avg_line = VMobject(color=BLUE, stroke_width=4)  # Thicker!
-        running_avg_line.set_points_as_corners([points[0], points[0]])
+        running_avg_line = GrowingPolyline(points, color=BLUE, stroke_width=4)  # Thicker!
         self.play(Create(running_avg_line))
         
         # Current value display
@@ -94,54 +106,30 @@ class LLNandCLT(Scene):
         
         self.play(Write(current_label), Write(current_value))
         
-        # Histogram bars
-        histogram_bars = VGroup()
+        # Histogram bars: one persistent bar per bin, resized as samples arrive
+        histogram_bars = IncrementalHistogram(
+            clt_axes,
+            averages,
+            bins,
+            max_height=15,
+            color=GREEN,
+            fill_opacity=0.7,
+            stroke_width=1
+        )
         self.add(histogram_bars)
         
-        # Bins for histogram - WIDER RANGE
-        bins = np.linspace(2.8, 4.2, 12)
-        
         # Tracker
         tracker = ValueTracker(1)
 
         def update_line(mob):
             i = int(tracker.get_value())
             if i > 0 and i < len(points):
-                new_points = [points[j] for j in range(min(i + 1, len(points)))]
-                if len(new_points) > 1:
-                    mob.set_points_as_corners(new_points)
+                mob.set_count(i + 1)
 
         def update_histogram(mob):
             i = int(tracker.get_value())
             if i > 5 and i <= len(averages):
-                hist, bin_edges = np.histogram(averages[:i], bins=bins, density=False)
-                
-                # Clear and rebuild
-                mob.become(VGroup())
-                max_count = max(hist) if max(hist) > 0 else 1
-                
-                for j in range(len(hist)):
-                    if hist[j] > 0:
-                        # Scale height
-                        bar_height = (hist[j] / max_count) * 15  # Max height
-                        bar_width = (bin_edges[j + 1] - bin_edges[j]) * 0.9
-                        bar_x = (bin_edges[j] + bin_edges[j + 1]) / 2
-                        
-                        # Position bar
-                        bar_bottom = clt_axes.c2p(bar_x, 0)
-                        bar_top = clt_axes.c2p(bar_x, bar_height)
-                        actual_height = bar_top[1] - bar_bottom[1]
-                        
-                        bar = Rectangle(
-                            width=clt_axes.x_length * bar_width / (4.2 - 2.8),
-                            height=actual_height,
-                            color=GREEN,
-                            fill_opacity=0.7,
-                            stroke_width=1
-                        )
-                        bar.move_to([bar_bottom[0], (bar_bottom[1] + bar_top[1]) / 2, 0])
-                        
-                        mob.add(bar)
+                mob.set_count(i)
         
         def update_value(mob):
             i = int(tracker.get_value())
@@ -165,7 +153,7 @@ class LLNandCLT(Scene):
         
         # Final annotations
         lln_conclusion = Paragraph(
-            "Converges to 3.5",
+            f"Converges to {expected_value:g}",
             font_size=16,
             color=BLUE
         ).next_to(lln_axes, DOWN, buff=0.8)
@@ -178,4 +166,20 @@ class LLNandCLT(Scene):
         
         self.play(Write(lln_conclusion), Write(clt_conclusion))
 
-        self.wait(3)
\ No newline at end of file
+        self.wait(3)
+
+
+class LLNandCLTExponential(LLNandCLT):
+    # Skewed: the bell curve still appears, just more slowly
+    distribution = Exponential(scale=1.0)
+
+
+class LLNandCLTBernoulli(LLNandCLT):
+    # Coin flips with a biased coin
+    distribution = Bernoulli(p=0.3)
+
+
+class LLNandCLTPareto(LLNandCLT):
+    # Heavy tailed: rare huge draws jolt the running average
+    distribution = Pareto(alpha=2.5)
+    num_samples = 600
@@ -1,126 +1,162 @@
+import re
+import sys
+from pathlib import Path
+
 from manim import *
+import numpy as np
+import sympy as sp
+
+# Shared helpers live in blog_anim/ at the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from blog_anim.functions import FunctionSpec
+
+SUPERSCRIPTS = str.maketrans("0123456789", "⁰¹²³⁴⁵⁶⁷⁸⁹")
+
+
+def plain_formula(expression):
+    """x**2 + 2 as "x² + 2", for Text titles."""
+    text = re.sub(r"\*\*(\d+)", lambda m: m.group(1).translate(SUPERSCRIPTS), str(expression))
+    return text.replace("*", "")
+
+
+class BowlFigure:
+    """A still figure of f(x) at one critical point, with the second derivative test.
+
+    Mix into a Scene and set `function` (in x) and `critical_x`; everything
+    else is worked out from f: the kind of extremum, the colours, the
+    formulas and, if `y_range` is None, the axis range. `title` and
+    `formula` override the text of f when sympy's ordering reads badly.
+    """
+
+    function = "2 + x**2"
+    critical_x = 0
+    title = None
+    formula = None
+    x_range = [-3, 3, 1]
+    y_range = None
+    plot_range = [-2.5, 2.5]
+    # (curve, second derivative, critical point) colours for a minimum and a maximum
+    min_colors = (BLUE, GREEN, RED)
+    max_colors = (RED, ORANGE, YELLOW)
+    # The figure never animates: render its one frame straight to an image
+    still = True
 
-class UpwardBowl(Scene):
     def construct(self):
+        f = FunctionSpec(self.function)
+        x = f.variables[0]
+        c = sp.sympify(self.critical_x)
+        f_c = sp.simplify(f.expression.subs(x, c))
+        df = sp.diff(f.expression, x)
+        d2f = sp.diff(df, x)
+        curvature = sp.simplify(d2f.subs(x, c))
+        if sp.simplify(df.subs(x, c)) != 0:
+            raise ValueError(f"f'({c}) is not 0 for f(x) = {f.expression}")
+        if curvature == 0:
+            raise ValueError(f"f''({c}) = 0 for f(x) = {f.expression}: the test is inconclusive")
+        is_min = curvature > 0
+        color, test_color, point_color = self.min_colors if is_min else self.max_colors
+
         # Title
-        title = Text("f(x) = 2 + x²", font_size=36, color=BLUE)
+        title = Text(self.title or f"f(x) = {plain_formula(f.expression)}", font_size=36, color=color)
         title.to_edge(DOWN)
         self.add(title)
-        
-        subtitle = Text("Minimum at x = 0", font_size=24, color=GREEN)
+
+        subtitle = Text(f"{'Minimum' if is_min else 'Maximum'} at x = {sp.pretty(c)}", font_size=24, color=test_color)
         subtitle.next_to(title, DOWN)
         self.add(subtitle)
-        
+
         # Setup 2D axes
         axes = Axes(
-            x_range=[-3, 3, 1],
-            y_range=[0, 12, 2],
+            x_range=self.x_range,
+            y_range=self.y_range or self.auto_y_range(f, float(f_c)),
             x_length=8,
             y_length=5,
             axis_config={"include_tip": True},
         )
-        
+
         # Labels
         x_label = axes.get_x_axis_label("x")
         y_label = axes.get_y_axis_label("f(x)", edge=UP, direction=UP)
-        
+
         # Function curve
         curve = axes.plot(
-            lambda x: 2 + x**2,
-            x_range=[-2.5, 2.5],
-            color=BLUE,
+            f,
+            x_range=self.plot_range,
+            color=color,
             stroke_width=4,
         )
-        
+
         # Critical point
         critical_point = Dot(
-            axes.c2p(0, 2),
-            color=RED,
+            axes.c2p(float(c), float(f_c)),
+            color=point_color,
             radius=0.12
         )
-        
-        # Label for critical point
-        point_label = MathTex("(0, 2)", font_size=24, color=RED)
-        point_label.next_to(critical_point, DOWN, buff=0.3)
-        
+
+        # Label for critical point, below a minimum and above a maximum
+        point_label = MathTex(f"({sp.latex(c)}, {sp.latex(f_c)})", font_size=24, color=point_color)
+        point_label.next_to(critical_point, DOWN if is_min else UP, buff=0.3)
+
         # Add everything
         self.add(axes, x_label, y_label)
         self.add(curve)
         self.add(critical_point, point_label)
-        
+
         # Formula box
+        sign = ">" if is_min else "<"
+        if d2f.free_symbols:
+            second = f"f''({sp.latex(c)}) = {sp.latex(curvature)} {sign} 0"
+        else:
+            second = f"f''(x) = {sp.latex(d2f)} {sign} 0"
+        concavity = "Concave up → Minimum" if is_min else "Concave down → Maximum"
         formula_box = VGroup(
-            MathTex("f(x) = 2 + x^2", font_size=28, color=BLUE),
-            MathTex("f'(x) = 2x", font_size=24),
-            MathTex("f''(x) = 2 > 0", font_size=24, color=GREEN),
-            Text("Concave up → Minimum", font_size=20, color=GREEN)
+            MathTex(f"f(x) = {self.formula or f.latex}", font_size=28, color=color),
+            MathTex(f"f'(x) = {sp.latex(df)}", font_size=24),
+            MathTex(second, font_size=24, color=test_color),
+            Text(concavity, font_size=20, color=test_color)
         ).arrange(DOWN, aligned_edge=LEFT, buff=0.2)
-        
+
         formula_box.to_corner(UR).shift(LEFT * 0.5 + DOWN * 0.5)
-        
+
         # Background for formula box
         box_bg = BackgroundRectangle(formula_box, fill_opacity=0.9, buff=0.2)
         self.add(box_bg, formula_box)
 
+    def auto_y_range(self, f, f_c):
+        """Axis range covering the plotted curve, in steps of 1, 2 or 5 (times 10^k)."""
+        ys = f(np.linspace(*self.plot_range, 101))
+        low, high = min(ys.min(), f_c), max(ys.max(), f_c)
+        rough = max(high - low, 1.0) / 6
+        magnitude = 10 ** np.floor(np.log10(rough))
+        step = next(m * magnitude for m in (1, 2, 5, 10) if m * magnitude >= rough)
+        return [float(step * np.floor(low / step)), float(step * np.ceil(high / step)), float(step)]
 
-class DownwardBowl(Scene):
-    def construct(self):
-        # Title
-        title = Text("f(x) = 2 - x²", font_size=36, color=RED)
-        title.to_edge(DOWN)
-        self.add(title)
-        
-        subtitle = Text("Maximum at x = 0", font_size=24, color=ORANGE)
-        subtitle.next_to(title, DOWN)
-        self.add(subtitle)
-        
-        # Setup 2D axes
-        axes = Axes(
-            x_range=[-3, 3, 1],
-            y_range=[-8, 4, 2],
-            x_length=8,
-            y_length=5,
-            axis_config={"include_tip": True},
-        )
-        
-        # Labels
-        x_label = axes.get_x_axis_label("x")
-        y_label = axes.get_y_axis_label("f(x)", edge=UP, direction=UP)
-        
-        # Function curve
-        curve = axes.plot(
-            lambda x: 2 - x**2,
-            x_range=[-2.5, 2.5],
-            color=RED,
-            stroke_width=4,
-        )
-        
-        # Critical point
-        critical_point = Dot(
-            axes.c2p(0, 2),
-            color=YELLOW,
-            radius=0.12
-        )
-        
-        # Label for critical point
-        point_label = MathTex("(0, 2)", font_size=24, color=YELLOW)
-        point_label.next_to(critical_point, UP, buff=0.3)
-        
-        # Add everything
-        self.add(axes, x_label, y_label)
-        self.add(curve)
-        self.add(critical_point, point_label)
-        
-        # Formula box
-        formula_box = VGroup(
-            MathTex("f(x) = 2 - x^2", font_size=28, color=RED),
-            MathTex("f'(x) = -2x", font_size=24),
-            MathTex("f''(x) = -2 < 0", font_size=24, color=ORANGE),
-            Text("Concave down → Maximum", font_size=20, color=ORANGE)
-        ).arrange(DOWN, aligned_edge=LEFT, buff=0.2)
-        
-        formula_box.to_corner(UR).shift(LEFT * 0.5 + DOWN * 0.5)
-        
-        # Background for formula box
-        box_bg = BackgroundRectangle(formula_box, fill_opacity=0.9, buff=0.2)
-        self.add(box_bg, formula_box)
\ No newline at end of file
+
+class UpwardBowl(BowlFigure, Scene):
+    function = "2 + x**2"
+    title = "f(x) = 2 + x²"
+    formula = "2 + x^2"
+    y_range = [0, 12, 2]
+
+
+class DownwardBowl(BowlFigure, Scene):
+    function = "2 - x**2"
+    title = "f(x) = 2 - x²"
+    formula = "2 - x^2"
+    y_range = [-8, 4, 2]
+
+
+def bowl_variant(name, function, critical_x, **attributes):
+    """A BowlFigure scene class for another f(x) and critical point."""
+    return type(name, (BowlFigure, Scene), dict(function=function, critical_x=critical_x, **attributes))
+
+
+# Other functions and critical points, rendered to images in one parallel
+# batch by `python -m blog_anim.stills Maxima-minima/bowl_shapes.py`
+VARIANTS = [
+    bowl_variant("ShiftedBowl", "(x - 1)**2 + 1", 1),
+    bowl_variant("WideDome", "3 - x**2/4", 0),
+    bowl_variant("QuarticWell", "x**4 - 4*x**2 + 5", "sqrt(2)", x_range=[-2, 2, 1], plot_range=[-2, 2]),
+    bowl_variant("CubicPeak", "x**3 - 3*x + 1", -1),
+    bowl_variant("CubicValley", "x**3 - 3*x + 1", 1),
+]
@@ -1,7 +1,16 @@
+import sys
+from pathlib import Path
+
 from manim import *
 import numpy as np
 
-class SaddlePoint(ThreeDScene):
+# Shared helpers live in blog_anim/ at the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from blog_anim.functions import FunctionSpec
+from blog_anim.orbit import OrbitMixin
+from blog_anim.surfaces import graph_surface
+
+class SaddlePoint(OrbitMixin, ThreeDScene):
     def construct(self):
         # Title
         title = Text("Saddle Point: f(x,y) = x² - y²", font_size=32)
@@ -26,12 +35,12 @@ class SaddlePoint(ThreeDScene):
         z_label = MathTex("f", font_size=28, color=WHITE).next_to(axes.z_axis, OUT)
         
         # Saddle function: f(x,y) = x^2 - y^2
-        def saddle_func(x, y):
-            return x**2 - y**2
+        saddle_func = FunctionSpec("x**2 - y**2", "x y")
         
         # Create saddle surface
-        saddle_surface = Surface(
-            lambda u, v: axes.c2p(u, v, saddle_func(u, v)),
+        saddle_surface = graph_surface(
+            axes,
+            saddle_func,
             u_range=[-2.5, 2.5],
             v_range=[-2.5, 2.5],
             resolution=(35, 35),
@@ -165,8 +174,6 @@ class SaddlePoint(ThreeDScene):
         self.play(Write(rotate_title))
         
         # Slow rotation to appreciate the shape
-        self.begin_ambient_camera_rotation(rate=0.15)
-        self.wait(8)
-        self.stop_ambient_camera_rotation()
+        self.orbit(rate=0.15, run_time=8)
         
         self.wait(2)
\ No newline at end of file
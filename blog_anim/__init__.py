@@ -0,0 +1,10 @@
+"""Shared helpers and render tooling for the blog animations.
+
+The scenes themselves live in the topic folders (Derivatives/, Gradient/, ...);
+this package holds the code they share and the command line tools used to
+render them, e.g. ``python -m blog_anim.render``.
+"""
+
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
@@ -0,0 +1,165 @@
+"""Per-scene render benchmarks with a stored JSON baseline.
+
+    python -m blog_anim.bench run                 # write benchmarks/baseline.json
+    python -m blog_anim.bench run LLNandCLT       # refresh one scene's entry
+    python -m blog_anim.bench compare             # re-run and flag regressions
+    python -m blog_anim.bench compare --threshold 0.05
+
+Every scene is rendered at low quality with manim's partial movie cache
+disabled, one scene at a time in a fresh process so peak RSS and timings are
+not polluted by other renders. Wall time is split into scene code
+(construct, animation interpolation, updaters), Cairo rasterization and
+encoding (see blog_anim.instrument).
+"""
+
+import argparse
+import json
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+from . import REPO_ROOT
+from .cache import manim_version
+from .discovery import find_scenes, select_scenes
+from .instrument import PhaseTimer
+from .render import RenderOptions, render_scene
+
+DEFAULT_BASELINE = REPO_ROOT / "benchmarks" / "baseline.json"
+
+# Metrics where a larger value is a regression; fps is the other way round
+LOWER_IS_BETTER = ("wall", "construct", "rasterize", "encode", "peak_rss_mb")
+
+
+def _peak_rss_mb():
+    # ru_maxrss is in KiB on Linux; encoders run as children on older manims
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return max(own, children) / 1024
+
+
+def _bench_job(scene, media_dir):
+    options = RenderOptions(
+        quality="l",
+        media_dir=media_dir,
+        overrides=(("disable_caching", True),),
+    )
+    timer = PhaseTimer().install()
+    start = time.perf_counter()
+    try:
+        rendered = render_scene(scene.path, scene.name, options)
+    finally:
+        timer.uninstall()
+    wall = time.perf_counter() - start
+
+    renderer = rendered.renderer
+    frames = round(renderer.time * renderer.camera.frame_rate)
+    rasterize = timer.totals["rasterize"]
+    encode = timer.totals["encode"]
+    return scene.label, {
+        "wall": round(wall, 3),
+        "construct": round(wall - rasterize - encode, 3),
+        "rasterize": round(rasterize, 3),
+        "encode": round(encode, 3),
+        "frames": frames,
+        "fps": round(frames / wall, 2) if wall else 0.0,
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+    }
+
+
+def run_benchmarks(scenes, repeat=1, log=print):
+    """Benchmark `scenes`, keeping the fastest of `repeat` runs of each."""
+    results = {}
+    media_dir = tempfile.mkdtemp(prefix="blog_anim_bench_")
+    try:
+        # One worker, recycled after every scene: timings stay comparable
+        with ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=get_context("spawn"),
+            max_tasks_per_child=1,
+        ) as pool:
+            for scene in scenes:
+                runs = [pool.submit(_bench_job, scene, media_dir).result()[1] for _ in range(repeat)]
+                best = min(runs, key=lambda run: run["wall"])
+                results[scene.label] = best
+                log(_format_row(scene.label, best))
+    finally:
+        shutil.rmtree(media_dir, ignore_errors=True)
+    return results
+
+
+def _format_row(label, metrics):
+    return (
+        f"{metrics['wall']:8.2f}s wall  {metrics['construct']:7.2f}s scene  "
+        f"{metrics['rasterize']:7.2f}s raster  {metrics['encode']:7.2f}s encode  "
+        f"{metrics['fps']:7.1f} fps  {metrics['peak_rss_mb']:7.0f} MB  {label}"
+    )
+
+
+def load_baseline(path):
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {"manim": manim_version(), "scenes": {}}
+
+
+def save_baseline(path, baseline):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def regressions(baseline, current, threshold):
+    """(label, metric, old, new) for every metric worse by more than `threshold`."""
+    found = []
+    for label, new in current.items():
+        old = baseline.get(label)
+        if not old:
+            continue
+        for metric in LOWER_IS_BETTER:
+            if old.get(metric) and new[metric] > old[metric] * (1 + threshold):
+                found.append((label, metric, old[metric], new[metric]))
+        if old.get("fps") and new["fps"] < old["fps"] / (1 + threshold):
+            found.append((label, "fps", old["fps"], new["fps"]))
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m blog_anim.bench", description=__doc__.splitlines()[0])
+    parser.add_argument("mode", choices=("run", "compare"))
+    parser.add_argument("scenes", nargs="*", help="scene names, scene files or topic folders (default: all)")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE))
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed slowdown before flagging (default: 0.10)")
+    parser.add_argument("--repeat", type=int, default=1, help="runs per scene, fastest is kept")
+    args = parser.parse_args(argv)
+
+    scenes = select_scenes(find_scenes(), args.scenes)
+    if not scenes:
+        parser.error(f"no scenes match {' '.join(args.scenes)}")
+
+    baseline = load_baseline(args.baseline)
+    current = run_benchmarks(scenes, repeat=args.repeat)
+
+    if args.mode == "run":
+        baseline["manim"] = manim_version()
+        baseline["scenes"].update(current)
+        save_baseline(args.baseline, baseline)
+        print(f"baseline written to {args.baseline}")
+        return 0
+
+    if baseline.get("manim") != manim_version():
+        print(f"warning: baseline was recorded with manim {baseline.get('manim')}, running {manim_version()}")
+    found = regressions(baseline["scenes"], current, args.threshold)
+    for label, metric, old, new in found:
+        print(f"REGRESSION  {label}  {metric}: {old} -> {new} ({(new / old - 1) * 100:+.0f}%)")
+    if not found:
+        print(f"no regressions above {args.threshold:.0%}")
+    return 1 if found else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
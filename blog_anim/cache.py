@@ -0,0 +1,151 @@
+"""Content-addressed cache of rendered scenes.
+
+A scene's key hashes everything that can change its output: the scene's own
+source (its class plus the module-level code around it), the repo modules it
+imports, the installed manim version and the render config. The key and the
+files it produced are kept in a JSON manifest inside the media folder; when a
+rebuild computes the same key and the files are still there, the scene is
+not rendered at all.
+"""
+
+import ast
+import hashlib
+import json
+from importlib import metadata
+from pathlib import Path
+
+from . import REPO_ROOT
+
+MANIFEST_NAME = "render_manifest.json"
+
+# Config values that only affect logging, not the rendered file
+IGNORED_CONFIG = {"input_file", "progress_bar", "verbosity", "max_files_cached"}
+
+
+def _scene_source(tree, source, scene_name):
+    """Module-level code plus the class bodies `scene_name` is built from."""
+    classes = {node.name: node for node in tree.body if isinstance(node, ast.ClassDef)}
+
+    # The scene class and any local classes it inherits from
+    needed = set()
+    pending = [scene_name]
+    while pending:
+        name = pending.pop()
+        if name in needed or name not in classes:
+            continue
+        needed.add(name)
+        for base in classes[name].bases:
+            if isinstance(base, ast.Name):
+                pending.append(base.id)
+
+    parts = []
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and node.name not in needed:
+            continue
+        parts.append(ast.get_source_segment(source, node) or "")
+    return "\n".join(parts)
+
+
+def _resolve_import(node, path):
+    """Repo files a single import statement can refer to."""
+    candidates = []
+    if isinstance(node, ast.Import):
+        names = [alias.name for alias in node.names]
+        bases = [REPO_ROOT, path.parent]
+    else:
+        if node.level:
+            # Relative import inside blog_anim
+            package = path.parent
+            for _ in range(node.level - 1):
+                package = package.parent
+            bases = [package]
+            prefix = node.module.split(".") if node.module else []
+        else:
+            bases = [REPO_ROOT, path.parent]
+            prefix = node.module.split(".")
+        # `from pkg import mod` may name a submodule rather than an attribute
+        names = [".".join(prefix)] + [".".join(prefix + [alias.name]) for alias in node.names]
+    for base in bases:
+        for name in names:
+            if not name:
+                continue
+            target = base.joinpath(*name.split("."))
+            for candidate in (target.with_suffix(".py"), target / "__init__.py"):
+                if candidate.is_file():
+                    candidates.append(candidate.resolve())
+    return candidates
+
+
+def module_dependencies(path, _seen=None):
+    """All repo source files imported, directly or not, by `path`."""
+    path = Path(path).resolve()
+    seen = set() if _seen is None else _seen
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    for node in ast.walk(tree):
+        if not isinstance(node, (ast.Import, ast.ImportFrom)):
+            continue
+        for dependency in _resolve_import(node, path):
+            if dependency != path and dependency not in seen:
+                seen.add(dependency)
+                module_dependencies(dependency, seen)
+    return seen
+
+
+def manim_version():
+    try:
+        return metadata.version("manim")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def scene_key(scene, config):
+    """Hex digest identifying one render of `scene` with manim `config`."""
+    source = scene.path.read_text(encoding="utf-8")
+    tree = ast.parse(source, filename=str(scene.path))
+
+    digest = hashlib.sha256()
+    digest.update(scene.name.encode())
+    digest.update(_scene_source(tree, source, scene.name).encode())
+    for dependency in sorted(module_dependencies(scene.path)):
+        digest.update(str(dependency.relative_to(REPO_ROOT)).encode())
+        digest.update(dependency.read_bytes())
+    digest.update(manim_version().encode())
+    relevant = {k: v for k, v in config.items() if k not in IGNORED_CONFIG}
+    digest.update(json.dumps(relevant, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """The manifest of rendered scenes in one media folder."""
+
+    def __init__(self, media_dir):
+        self.path = Path(media_dir) / MANIFEST_NAME
+        try:
+            self.entries = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def lookup(self, label, key):
+        """Output files of a previous render with the same key, or None."""
+        entry = self.entries.get(label)
+        if not entry or entry["key"] != key or not entry["outputs"]:
+            return None
+        outputs = [REPO_ROOT / output for output in entry["outputs"]]
+        if not all(output.exists() for output in outputs):
+            return None
+        return [str(output) for output in outputs]
+
+    def store(self, label, key, outputs, seconds):
+        def relative(output):
+            output = Path(output).resolve()
+            return str(output.relative_to(REPO_ROOT)) if output.is_relative_to(REPO_ROOT) else str(output)
+
+        self.entries[label] = {
+            "key": key,
+            "outputs": [relative(output) for output in outputs],
+            "seconds": round(seconds, 2),
+        }
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.entries, indent=2, sort_keys=True) + "\n", encoding="utf-8")
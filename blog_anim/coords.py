@@ -0,0 +1,30 @@
+"""Vectorized coordinate mapping for linear manim axes.
+
+``axes.c2p`` is a Python call per point. For linear number lines the map is
+affine, so it can be read off once (origin plus one basis vector per axis)
+and applied to whole arrays of coordinates with a single matrix product.
+Axes with a logarithmic scaling are not affine and must keep using c2p.
+"""
+
+import numpy as np
+
+
+def axes_affine(axes):
+    """(origin, basis) with c2p(x, y[, z]) == origin + [x, y, z] @ basis."""
+    dims = len(axes.get_axes())
+    zeros = [0] * dims
+    origin = np.asarray(axes.c2p(*zeros), dtype=float)
+    basis = np.zeros((3, 3))
+    for k in range(dims):
+        unit = list(zeros)
+        unit[k] = 1
+        basis[k] = np.asarray(axes.c2p(*unit), dtype=float) - origin
+    return origin, basis
+
+
+def coords_to_points(axes, *coords):
+    """Scene points for arrays of axis coordinates, shape (..., 3)."""
+    origin, basis = axes_affine(axes)
+    arrays = list(np.broadcast_arrays(*[np.asarray(c, dtype=float) for c in coords]))
+    stacked = np.stack(arrays + [np.zeros_like(arrays[0])] * (3 - len(arrays)), axis=-1)
+    return origin + stacked @ basis
@@ -0,0 +1,257 @@
+"""Find the Scene classes in the topic folders without importing manim.
+
+Scene files are parsed with ``ast`` so listing and scheduling stay instant;
+only the worker that actually renders a scene imports its module.
+"""
+
+import ast
+import importlib.util
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+from . import REPO_ROOT
+
+SCENE_DIRS = ("Derivatives", "Gradient", "Gradient-Descent", "LLM-CLT", "Maxima-minima")
+
+SCENE_BASES = {
+    "Scene",
+    "ThreeDScene",
+    "SpecialThreeDScene",
+    "MovingCameraScene",
+    "ZoomedScene",
+    "VectorSpaceScene",
+    "LinearTransformationScene",
+}
+THREE_D_BASES = {"ThreeDScene", "SpecialThreeDScene"}
+
+# 3D frames are depth sorted and shaded face by face, so a second of a
+# ThreeDScene costs a lot more than a second of a flat Scene
+THREE_D_COST_FACTOR = 4.0
+
+# Scene methods that put frames on the timeline; a scene that calls none of
+# them is a single still frame
+TIMELINE_METHODS = {"play", "wait", "wait_until", "pause", "move_camera"}
+
+
+@dataclass(frozen=True)
+class SceneInfo:
+    path: Path
+    name: str
+    is_3d: bool
+    # Estimated length of the animation in seconds (scaled up for 3D)
+    cost: float
+    # Rendered as its last frame only: the scene never animates, or sets
+    # `still = True`
+    still: bool = False
+
+    @property
+    def label(self):
+        return f"{self.path.parent.name}/{self.path.name}:{self.name}"
+
+
+def _base_names(node):
+    names = []
+    for base in node.bases:
+        if isinstance(base, ast.Name):
+            names.append(base.id)
+        elif isinstance(base, ast.Attribute):
+            names.append(base.attr)
+    return names
+
+
+def _number(node, constants):
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return float(node.value)
+    if isinstance(node, ast.Name) and node.id in constants:
+        return constants[node.id]
+    return None
+
+
+def _kwarg(call, name):
+    for keyword in call.keywords:
+        if keyword.arg == name:
+            return keyword.value
+    return None
+
+
+def _seconds(node, constants, default=1.0):
+    value = _number(node, constants) if node is not None else None
+    return default if value is None else value
+
+
+def _loop_count(node, constants):
+    # Only `for _ in range(n)` with a literal (or literal-assigned) bound counts
+    it = node.iter
+    if isinstance(it, ast.Call) and isinstance(it.func, ast.Name) and it.func.id == "range":
+        bounds = [_number(arg, constants) for arg in it.args]
+        if bounds and all(b is not None for b in bounds):
+            if len(bounds) == 1:
+                return max(bounds[0], 0)
+            step = bounds[2] if len(bounds) == 3 else 1
+            return max((bounds[1] - bounds[0]) / step, 0)
+    return 1
+
+
+def _timeline_seconds(body, constants):
+    """Rough run time of a list of statements, following literal loops."""
+    total = 0.0
+    for stmt in body:
+        if isinstance(stmt, ast.Assign) and len(stmt.targets) == 1:
+            target = stmt.targets[0]
+            value = _number(stmt.value, constants)
+            if isinstance(target, ast.Name) and value is not None:
+                constants[target.id] = value
+        if isinstance(stmt, ast.For):
+            total += _loop_count(stmt, constants) * _timeline_seconds(stmt.body, constants)
+            continue
+        if isinstance(stmt, (ast.If, ast.While, ast.With, ast.Try)):
+            total += _timeline_seconds(stmt.body, constants)
+            continue
+        if not isinstance(stmt, ast.Expr) or not isinstance(stmt.value, ast.Call):
+            continue
+        call = stmt.value
+        func = call.func
+        if not (isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name) and func.value.id == "self"):
+            continue
+        if func.attr in ("play", "move_camera"):
+            total += _seconds(_kwarg(call, "run_time"), constants)
+        elif func.attr == "wait":
+            total += _seconds(call.args[0] if call.args else _kwarg(call, "duration"), constants)
+    return total
+
+
+def _construct(node):
+    for item in node.body:
+        if isinstance(item, ast.FunctionDef) and item.name == "construct":
+            return item
+    return None
+
+
+def _still_flag(node):
+    """The class's own `still = True/False`, or None if it does not set one."""
+    for item in node.body:
+        if (
+            isinstance(item, ast.Assign)
+            and any(isinstance(target, ast.Name) and target.id == "still" for target in item.targets)
+            and isinstance(item.value, ast.Constant)
+        ):
+            return bool(item.value.value)
+    return None
+
+
+def _animates(node):
+    """Whether any method of the class calls self.play, self.wait, ..."""
+    for call in ast.walk(node):
+        if (
+            isinstance(call, ast.Call)
+            and isinstance(call.func, ast.Attribute)
+            and call.func.attr in TIMELINE_METHODS
+            and isinstance(call.func.value, ast.Name)
+            and call.func.value.id == "self"
+        ):
+            return True
+    return False
+
+
+def _lineage(name, classes):
+    """`name` and its local ancestors, nearest first (depth-first, like a simple MRO)."""
+    order = []
+    pending = [name]
+    while pending:
+        current = pending.pop(0)
+        if current in order or current not in classes:
+            continue
+        order.append(current)
+        pending[:0] = _base_names(classes[current])
+    return order
+
+
+def scenes_in_file(path):
+    """Return a SceneInfo for every Scene subclass defined in `path`."""
+    path = Path(path).resolve()
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+
+    # Classes defined earlier in the file count as bases too, so
+    # `class UpwardBowl(BowlFigure, Scene)` or a local Scene subclass works;
+    # a mixin that is not a Scene itself can still provide construct
+    classes = {}
+    scene_classes = set()
+    three_d = set()
+    infos = []
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        classes[node.name] = node
+        bases = _base_names(node)
+        if not any(b in SCENE_BASES or b in scene_classes for b in bases):
+            continue
+        scene_classes.add(node.name)
+        is_3d = any(b in THREE_D_BASES or b in three_d for b in bases)
+        if is_3d:
+            three_d.add(node.name)
+        lineage = [classes[name] for name in _lineage(node.name, classes)]
+        # The nearest local construct is the one that runs
+        construct = next((c for c in map(_construct, lineage) if c is not None), None)
+        seconds = _timeline_seconds(construct.body, {}) if construct is not None else 0.0
+        cost = seconds * (THREE_D_COST_FACTOR if is_3d else 1.0)
+        flag = next((f for f in map(_still_flag, lineage) if f is not None), None)
+        if flag is None:
+            # A construct inherited from outside the file could animate
+            flag = construct is not None and not any(map(_animates, lineage))
+        infos.append(SceneInfo(path=path, name=node.name, is_3d=is_3d, cost=cost, still=flag))
+    return infos
+
+
+def scene_files(root=REPO_ROOT):
+    root = Path(root)
+    for folder in SCENE_DIRS:
+        yield from sorted((root / folder).glob("*.py"))
+
+
+def find_scenes(root=REPO_ROOT):
+    """Every scene in the topic folders, in file order."""
+    scenes = []
+    for path in scene_files(root):
+        scenes.extend(scenes_in_file(path))
+    return scenes
+
+
+def select_scenes(scenes, selectors):
+    """Filter scenes by class name, file path or folder name."""
+    if not selectors:
+        return list(scenes)
+    chosen = []
+    for scene in scenes:
+        for selector in selectors:
+            candidate = Path(selector)
+            if (
+                selector == scene.name
+                or (candidate.exists() and candidate.resolve() in (scene.path, scene.path.parent))
+            ):
+                chosen.append(scene)
+                break
+    return chosen
+
+
+def load_scene_module(path):
+    """Import a scene file the way the manim CLI does.
+
+    The file names contain dashes, so they are loaded by path, and the file's
+    folder is put on sys.path so it can import its neighbours.
+    """
+    path = Path(path).resolve()
+    if path.is_relative_to(REPO_ROOT):
+        module_name = ".".join(path.relative_to(REPO_ROOT).with_suffix("").parts)
+    else:
+        module_name = path.stem
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    for folder in (str(REPO_ROOT), str(path.parent)):
+        if folder not in sys.path:
+            sys.path.insert(0, folder)
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,203 @@
+"""Distributions for the LLN / CLT demo.
+
+Each distribution knows how to draw a block of samples with NumPy and what
+its sample means look like: the expected value, a plotting range for the
+running average and histogram bins that line up with the lattice of
+possible means for discrete distributions. Scenes pick a distribution and
+get their axis ranges and bins from it instead of hand-tuning them.
+
+    dist = Exponential(scale=2)
+    averages, running = dist.simulate(num_samples=5000, sample_size=20, seed=1)
+    lo, hi, step = dist.mean_range(sample_size=20)
+"""
+
+import math
+
+import numpy as np
+
+from .montecarlo import running_mean, sample_means, stream_sample_means
+
+# Half-width of the plotted range, in standard errors of the mean
+DEFAULT_SPREAD = 1.8
+
+
+def nice_step(span, target_ticks):
+    """A 1, 2 or 5 times power-of-ten step giving about `target_ticks` ticks."""
+    raw = span / target_ticks
+    magnitude = 10 ** math.floor(math.log10(raw))
+    for factor in (1, 2, 5, 10):
+        if factor * magnitude >= raw * (1 - 1e-9):
+            return factor * magnitude
+    return 10 * magnitude
+
+
+class Distribution:
+    name = "distribution"
+    # Spacing of the support for discrete distributions, None if continuous,
+    # and the smallest value the grid starts from
+    lattice = None
+    support_min = 0
+
+    @property
+    def mean(self):
+        raise NotImplementedError
+
+    @property
+    def std(self):
+        raise NotImplementedError
+
+    def draw(self, rng, shape):
+        raise NotImplementedError
+
+    def stream(self, sample_size, num_samples=None, seed=None):
+        """Lazily yield batches of sample means."""
+        return stream_sample_means(sample_size, num_samples, seed, draw=self.draw)
+
+    def simulate(self, num_samples, sample_size, seed=None):
+        """(sample means, running averages of the sample means)."""
+        averages = sample_means(num_samples, sample_size, seed=seed, draw=self.draw)
+        return averages, running_mean(averages)
+
+    def mean_range(self, sample_size, spread=DEFAULT_SPREAD, target_ticks=7, seed=0):
+        """(low, high, tick step) covering the sample means of `sample_size`."""
+        if math.isfinite(self.std):
+            half = spread * self.std / math.sqrt(sample_size)
+            low, high = self.mean - half, self.mean + half
+        else:
+            # No finite variance (heavy tails): use a pilot run's quantiles
+            pilot = next(self.stream(sample_size, num_samples=4000, seed=seed))
+            low, high = np.quantile(pilot, [0.01, 0.99])
+        step = nice_step(high - low, target_ticks)
+        # Rounding keeps 2.8 from coming out as 2.8000000000000003
+        return round(math.floor(low / step) * step, 12), round(math.ceil(high / step) * step, 12), step
+
+    def bins(self, sample_size, low, high, num_bins=11):
+        """Histogram edges over [low, high] for means of `sample_size` draws."""
+        if self.lattice is None:
+            return np.linspace(low, high, num_bins + 1)
+        # Means of discrete draws sit on a grid of `cell` spacing. Bins made of
+        # whole cells with every edge halfway between grid points avoid
+        # comb-shaped histograms; the bin around the mean is centred on the
+        # nearest grid point (odd widths) or between two (even widths)
+        cell = self.lattice / sample_size
+        cells = math.ceil((high - low) / num_bins / cell - 1e-9)
+        width = cells * cell
+        anchor = self.support_min + round((self.mean - self.support_min) / cell) * cell
+        if cells % 2 == 0:
+            anchor += cell / 2
+        below = math.floor((anchor - width / 2 - (low - cell / 2)) / width + 1e-9)
+        above = math.floor((high + cell / 2 - (anchor + width / 2)) / width + 1e-9)
+        return anchor - width / 2 + width * np.arange(-below, above + 2)
+
+
+class Dice(Distribution):
+    lattice = 1
+    support_min = 1
+
+    def __init__(self, faces=6):
+        self.faces = faces
+        self.name = f"d{faces}"
+
+    @property
+    def mean(self):
+        return (self.faces + 1) / 2
+
+    @property
+    def std(self):
+        return math.sqrt((self.faces ** 2 - 1) / 12)
+
+    def draw(self, rng, shape):
+        return rng.integers(1, self.faces + 1, size=shape, dtype=np.int8)
+
+
+class Bernoulli(Distribution):
+    lattice = 1
+
+    def __init__(self, p=0.5):
+        if not 0 < p < 1:
+            raise ValueError(f"p must be in (0, 1), got {p}")
+        self.p = p
+        self.name = f"Bernoulli({p:g})"
+
+    @property
+    def mean(self):
+        return self.p
+
+    @property
+    def std(self):
+        return math.sqrt(self.p * (1 - self.p))
+
+    def draw(self, rng, shape):
+        return (rng.random(shape) < self.p).astype(np.int8)
+
+
+class Exponential(Distribution):
+    def __init__(self, scale=1.0):
+        self.scale = scale
+        self.name = f"Exponential({scale:g})"
+
+    @property
+    def mean(self):
+        return self.scale
+
+    @property
+    def std(self):
+        return self.scale
+
+    def draw(self, rng, shape):
+        return rng.exponential(self.scale, size=shape)
+
+
+class Pareto(Distribution):
+    """Classic Pareto with minimum `xm`; the mean needs alpha > 1."""
+
+    def __init__(self, alpha=3.0, xm=1.0):
+        if alpha <= 1:
+            raise ValueError(f"alpha must be > 1 for a finite mean, got {alpha}")
+        self.alpha = alpha
+        self.xm = xm
+        self.name = f"Pareto({alpha:g})"
+
+    @property
+    def mean(self):
+        return self.alpha * self.xm / (self.alpha - 1)
+
+    @property
+    def std(self):
+        if self.alpha <= 2:
+            return math.inf
+        a = self.alpha
+        return self.xm / (a - 1) * math.sqrt(a / (a - 2))
+
+    def draw(self, rng, shape):
+        # numpy's pareto is the Lomax (shifted) form
+        return (rng.pareto(self.alpha, size=shape) + 1) * self.xm
+
+
+class PMF(Distribution):
+    """A user supplied probability mass function over `values`."""
+
+    def __init__(self, values, probs, name="PMF"):
+        self.values = np.asarray(values, dtype=float)
+        probs = np.asarray(probs, dtype=float)
+        if self.values.shape != probs.shape or np.any(probs < 0) or probs.sum() <= 0:
+            raise ValueError("values and probs must match and probs must be non-negative")
+        self.probs = probs / probs.sum()
+        self._cdf = np.cumsum(self.probs)
+        self._cdf[-1] = 1.0
+        self.name = name
+        self.support_min = float(self.values.min())
+        if np.allclose(self.values, np.round(self.values)) and len(self.values) > 1:
+            self.lattice = int(np.gcd.reduce(np.diff(np.sort(self.values)).astype(int))) or None
+
+    @property
+    def mean(self):
+        return float(self.values @ self.probs)
+
+    @property
+    def std(self):
+        return float(np.sqrt(((self.values - self.mean) ** 2) @ self.probs))
+
+    def draw(self, rng, shape):
+        # Inverse CDF lookup is vectorized, unlike rng.choice per row
+        return self.values[np.searchsorted(self._cdf, rng.random(shape), side="right")]
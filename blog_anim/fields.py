@@ -0,0 +1,199 @@
+"""Dense arrow fields from one template, posed for every arrow at once.
+
+An ``Arrow3D`` is a cylinder plus a cone, each a Surface built face by face
+(the cone alone has 32 x 32 faces), so a field of a few hundred of them
+takes seconds to build and as long again to move. ``ArrowField3D`` builds
+one shaft and one tip mesh, pointing up the z axis, and places every arrow
+with a single ``einsum`` of per-arrow frames against the template points.
+Each arrow is one ThreeDVMobject holding all of its faces, so the 3D camera
+depth-sorts arrows rather than faces. ``ArrowField2D`` is the flat
+counterpart: every arrow is a filled polygon in one VMobject, a single path
+for Cairo. Both move with ``put_arrows(starts, ends)``, cheap enough to
+call from an updater.
+
+    field = gradient_field(axes, func, gradient, x, y, scale=0.4, color=YELLOW)
+    self.play(LaggedStart(*[Create(arrow) for arrow in field], lag_ratio=0.15))
+"""
+
+import numpy as np
+from manim import OUT, WHITE, Cone, Cylinder, ThreeDVMobject, VGroup, VMobject
+
+from .coords import coords_to_points
+from .geometry import fast_copy
+from .polyline import corners_to_bezier
+
+
+def _as_points(points):
+    return np.asarray(points, dtype=float).reshape(-1, 3)
+
+
+def _directions(starts, ends):
+    """Unit vectors from `starts` to `ends` (zero where they coincide) and lengths."""
+    vects = ends - starts
+    lengths = np.linalg.norm(vects, axis=1)
+    return vects / np.where(lengths > 0, lengths, 1)[:, None], lengths
+
+
+def _frames(directions):
+    """Rotations taking the z axis to each direction, shape (n, 3, 3)."""
+    helper = np.where(np.abs(directions[:, 2:]) < 0.9, OUT, [1.0, 0.0, 0.0])
+    side = np.cross(helper, directions)
+    side /= np.maximum(np.linalg.norm(side, axis=1), 1e-12)[:, None]
+    return np.stack([side, np.cross(directions, side), directions], axis=-1)
+
+
+def _mesh_points(surface):
+    return np.concatenate([mob.points for mob in surface.family_members_with_points()])
+
+
+class ArrowField3D(VGroup):
+    """Arrow3D-like arrows from `starts` to `ends`, one submobject each.
+
+    `thickness`, `height` and `base_radius` are as for Arrow3D; `resolution`
+    is the number of faces around the shaft and the tip. Arrows shorter than
+    their tip are drawn as a tip scaled down to their length, and arrows of
+    zero length are left empty.
+    """
+
+    def __init__(
+        self,
+        starts,
+        ends,
+        thickness=0.02,
+        height=0.3,
+        base_radius=0.08,
+        resolution=8,
+        color=WHITE,
+        fill_opacity=1.0,
+        stroke_width=0.5,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.tip_height = height
+        # Shaft from z = 0 to 1, scaled to length per arrow; tip with its
+        # apex at the origin, like Arrow3D's cone before it is shifted
+        shaft = Cylinder(radius=thickness, height=1, direction=OUT, resolution=(2, resolution), show_ends=False)
+        shaft.shift(0.5 * OUT)
+        tip = Cone(direction=OUT, base_radius=base_radius, height=height, resolution=(1, resolution))
+        self._shaft = _mesh_points(shaft)
+        self._tip = _mesh_points(tip)
+
+        starts = _as_points(starts)
+        template = ThreeDVMobject()
+        template.set_style(
+            fill_color=color,
+            fill_opacity=fill_opacity,
+            stroke_color=color,
+            stroke_width=stroke_width,
+        )
+        self.add(*[fast_copy(template) for _ in range(len(starts))])
+        self.put_arrows(starts, ends)
+
+    def put_arrows(self, starts, ends):
+        """Move the arrows to run from `starts` to `ends`, shape (n, 3)."""
+        self.starts, self.ends = _as_points(starts), _as_points(ends)
+        directions, lengths = _directions(self.starts, self.ends)
+        tips = np.minimum(self.tip_height, lengths)
+        frames = _frames(directions)
+
+        shaft_frames = frames.copy()
+        shaft_frames[:, :, 2] *= (lengths - tips)[:, None]
+        tip_frames = frames * (tips / self.tip_height)[:, None, None]
+        points = np.concatenate([
+            np.einsum("nij,pj->npi", shaft_frames, self._shaft) + self.starts[:, None],
+            np.einsum("nij,pj->npi", tip_frames, self._tip) + self.ends[:, None],
+        ], axis=1)
+
+        for arrow, arrow_points, length in zip(self.submobjects, points, lengths):
+            arrow.points = arrow_points if length > 0 else np.zeros((0, 3))
+        return self
+
+
+class ArrowField2D(VMobject):
+    """Flat filled arrows from `starts` to `ends`, all in one VMobject.
+
+    The arrows lie in the xy plane. `thickness` is the shaft width and
+    `tip_length`/`tip_width` the head's size, all in scene units; like
+    Arrow, an arrow's head is at most `max_tip_length_to_length_ratio` of its
+    length, shrinking shaft and head together on short arrows.
+    """
+
+    def __init__(
+        self,
+        starts,
+        ends,
+        thickness=0.04,
+        tip_length=0.2,
+        tip_width=0.16,
+        max_tip_length_to_length_ratio=0.5,
+        color=WHITE,
+        **kwargs,
+    ):
+        kwargs.setdefault("fill_opacity", 1.0)
+        kwargs.setdefault("stroke_width", 0)
+        super().__init__(color=color, **kwargs)
+        self.thickness = thickness
+        self.tip_length = tip_length
+        self.tip_width = tip_width
+        self.max_tip_length_to_length_ratio = max_tip_length_to_length_ratio
+        self.put_arrows(starts, ends)
+
+    def put_arrows(self, starts, ends):
+        """Move the arrows to run from `starts` to `ends`, shape (n, 3)."""
+        self.starts, self.ends = _as_points(starts), _as_points(ends)
+        directions, lengths = _directions(self.starts, self.ends)
+        keep = lengths > 0
+        starts, directions, lengths = self.starts[keep], directions[keep], lengths[keep]
+        sides = np.cross(OUT, directions)
+
+        tip = np.minimum(self.tip_length, lengths * self.max_tip_length_to_length_ratio)
+        shrink = tip / self.tip_length
+        half_shaft = self.thickness / 2 * shrink
+        half_tip = self.tip_width / 2 * shrink
+        neck = lengths - tip
+        zero = np.zeros_like(lengths)
+        # Outline of each arrow along its own axis: (along, across) pairs
+        along = np.stack([zero, neck, neck, lengths, neck, neck, zero, zero], axis=1)
+        across = np.stack([-half_shaft, -half_shaft, -half_tip, zero, half_tip, half_shaft, half_shaft, -half_shaft], axis=1)
+        corners = (
+            starts[:, None]
+            + along[..., None] * directions[:, None]
+            + across[..., None] * sides[:, None]
+        )
+        self.points = corners_to_bezier(corners).reshape(-1, 3)
+        return self
+
+
+def _field_coords(gradient, x, y, scale):
+    """Flattened (x, y) and the ends of `scale` times the gradient there."""
+    x, y = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+    x, y = x.ravel(), y.ravel()
+    gx, gy = gradient(x, y)[:2]
+    return x, y, x + scale * np.asarray(gx), y + scale * np.asarray(gy)
+
+
+def gradient_field(axes, func, gradient, x, y, scale=1.0, **kwargs):
+    """ArrowField3D of `gradient` at points (x, y) of the graph of `func`.
+
+    `func(x, y)` and `gradient(x, y)` take arrays; `gradient` returns the
+    x and y components (anything further is ignored). Each arrow starts on
+    the graph and runs `scale` times the gradient across the xy plane at
+    the same height, in axis coordinates.
+    """
+    x, y, x_end, y_end = _field_coords(gradient, x, y, scale)
+    z = np.broadcast_to(func(x, y), x.shape)
+    return ArrowField3D(
+        coords_to_points(axes, x, y, z),
+        coords_to_points(axes, x_end, y_end, z),
+        **kwargs,
+    )
+
+
+def gradient_field_2d(axes, gradient, x, y, scale=1.0, **kwargs):
+    """ArrowField2D of `gradient` at points (x, y) of 2D `axes`."""
+    x, y, x_end, y_end = _field_coords(gradient, x, y, scale)
+    return ArrowField2D(
+        coords_to_points(axes, x, y),
+        coords_to_points(axes, x_end, y_end),
+        **kwargs,
+    )
@@ -0,0 +1,97 @@
+"""Functions declared once, symbolically, with compiled NumPy kernels.
+
+Scenes used to write f by hand and then its derivative again, either
+derived by hand (``gradient = 2 * current_x``) or as a central difference
+evaluated twice per frame in an updater. A ``FunctionSpec`` parses f once
+with sympy, differentiates it exactly, and compiles f, its gradient and its
+Hessian with ``lambdify`` into NumPy kernels that take scalars or arrays.
+Kernels are compiled on first use and shared between specs of the same
+expression, so re-running ``construct`` or declaring f in several scenes
+compiles it once.
+
+    bowl = FunctionSpec("x**2 + y**2", "x y")
+    bowl(2, 1)                  # 5.0
+    bowl.gradient(2, 1)         # array([4., 2.])
+    bowl.hessian(x, y)          # shape (2, 2) + x.shape
+
+    distance = FunctionSpec("Piecewise((1.2*t, t < 20), (0.3*t + 18, True))", "t")
+    distance.derivative(30)     # 0.3
+"""
+
+from functools import cached_property, lru_cache
+
+import numpy as np
+import sympy as sp
+
+
+@lru_cache(maxsize=None)
+def _compile(variables, expressions):
+    return sp.lambdify(variables, list(expressions), modules="numpy")
+
+
+class FunctionSpec:
+    """f(`variables`) from a sympy expression or a string sympy can parse.
+
+    `variables` are names separated by spaces or commas, or sympy symbols,
+    in the order the kernels take their arguments.
+    """
+
+    def __init__(self, expression, variables="x"):
+        if isinstance(variables, str):
+            variables = sp.symbols(variables, seq=True)
+        self.variables = tuple(variables)
+        if isinstance(expression, str):
+            names = {symbol.name: symbol for symbol in self.variables}
+            expression = sp.sympify(expression, locals=names)
+        self.expression = expression
+
+    def __repr__(self):
+        names = ", ".join(symbol.name for symbol in self.variables)
+        return f"FunctionSpec(f({names}) = {self.expression})"
+
+    @property
+    def latex(self):
+        return sp.latex(self.expression)
+
+    @cached_property
+    def gradient_expressions(self):
+        return tuple(sp.diff(self.expression, symbol) for symbol in self.variables)
+
+    @cached_property
+    def hessian_expressions(self):
+        return tuple(
+            sp.diff(partial, symbol)
+            for partial in self.gradient_expressions
+            for symbol in self.variables
+        )
+
+    def _evaluate(self, expressions, args):
+        if len(args) != len(self.variables):
+            raise TypeError(f"{self!r} takes {len(self.variables)} arguments, got {len(args)}")
+        values = _compile(self.variables, expressions)(*args)
+        # Constant terms come back as Python scalars; broadcast them so
+        # every kernel returns the shape of its arguments
+        out = np.empty((len(expressions),) + np.broadcast(*args).shape)
+        for k, value in enumerate(values):
+            out[k] = value
+        return out
+
+    def __call__(self, *args):
+        """f at `args`: a float for scalars, an array of their broadcast shape otherwise."""
+        return self._evaluate((self.expression,), args)[0][()]
+
+    def gradient(self, *args):
+        """Partial derivatives stacked on a leading axis, shape (n,) + args shape."""
+        return self._evaluate(self.gradient_expressions, args)
+
+    def hessian(self, *args):
+        """Second partials, shape (n, n) + args shape."""
+        n = len(self.variables)
+        values = self._evaluate(self.hessian_expressions, args)
+        return values.reshape((n, n) + values.shape[1:])
+
+    def derivative(self, *args):
+        """f' at `args`, for a function of one variable."""
+        if len(self.variables) != 1:
+            raise TypeError(f"{self!r} has more than one variable; use gradient()")
+        return self.gradient(*args)[0][()]
@@ -0,0 +1,161 @@
+"""Build repeated geometry once and hand out copies.
+
+Scenes that show the same plane, grid or curve twice (a slice in one part
+and again in the summary) pay for sampling it twice. A ``GeometryCache``
+keys each piece on everything that determines its points and style, builds
+it on the first request and afterwards returns a copy of the cached
+mobject. ``SliceFactory`` builds the slices of a graph over 3D axes through
+such a cache; its keys include the axes' affine map, so moving or rescaling
+the axes never returns stale geometry.
+
+    slices = SliceFactory(axes)
+    plane = slices.plane("y", 1.0, u_range=[-3, 3], v_range=[0, 10], color=YELLOW)
+    again = slices.plane("y", 1.0, u_range=[-3, 3], v_range=[0, 10], color=YELLOW)  # copied
+"""
+
+import numpy as np
+from manim import Line, Mobject, ParametricFunction, VGroup
+
+from .coords import axes_affine, coords_to_points
+from .surfaces import VectorizedSurface
+
+AXES = "xyz"
+
+# Attribute types fast_copy gives each copy its own instance of
+COPIED_TYPES = {np.ndarray, list, dict}
+
+
+def fast_copy(mobject):
+    """An independent copy of `mobject` and its family.
+
+    Mobject.copy() deep-copies every attribute recursively, which for a
+    surface of a few hundred faces costs more than rebuilding it. Points,
+    colours and other arrays, lists and dicts are copied per family member;
+    everything else is shared, and a parent's references into its own
+    subtree (an arrow's tip, say) are pointed at the new members.
+    """
+    clones = {}
+
+    def clone(mob):
+        new = object.__new__(type(mob))
+        new.__dict__ = {
+            name: value.copy() if type(value) in COPIED_TYPES else value
+            for name, value in mob.__dict__.items()
+        }
+        clones[id(mob)] = new
+        new.submobjects = [clone(sub) for sub in mob.submobjects]
+        new.original_id = str(id(mob))
+        return new
+
+    result = clone(mobject)
+    for new in clones.values():
+        if not new.submobjects:
+            continue
+        state = vars(new)
+        for name, value in list(state.items()):
+            if name != "submobjects" and isinstance(value, Mobject) and id(value) in clones:
+                state[name] = clones[id(value)]
+    return result
+
+
+def _freeze(value):
+    """A hashable stand-in for a keyword argument value."""
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if hasattr(value, "to_hex"):
+        return value.to_hex(with_alpha=True)
+    return value
+
+
+class GeometryCache:
+    def __init__(self):
+        self._mobjects = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, build):
+        """A copy of the mobject cached under `key`, built by `build()` once."""
+        mobject = self._mobjects.get(key)
+        if mobject is None:
+            mobject = self._mobjects[key] = build()
+            self.misses += 1
+        else:
+            self.hits += 1
+        return fast_copy(mobject)
+
+    def __len__(self):
+        return len(self._mobjects)
+
+
+class SliceFactory:
+    """Planes, grids and curves where one coordinate of `axes` is fixed."""
+
+    def __init__(self, axes, cache=None):
+        self.axes = axes
+        self.cache = GeometryCache() if cache is None else cache
+
+    def _key(self, kind, *params, **style):
+        origin, basis = axes_affine(self.axes)
+        signature = tuple(np.round(np.concatenate([origin, basis.ravel()]), 12))
+        return (kind, signature, _freeze(params), _freeze(style))
+
+    def _coords(self, fixed, value, u, v):
+        """Axis coordinates with `fixed` held at `value`, free axes in order."""
+        index = AXES.index(fixed)
+        free = iter((u, v))
+        return [value if k == index else next(free) for k in range(3)]
+
+    def plane(self, fixed, value, u_range, v_range, resolution=(25, 25), **kwargs):
+        """A surface over the two free axes, in increasing axis order."""
+        def build():
+            return VectorizedSurface(
+                lambda u, v: coords_to_points(self.axes, *self._coords(fixed, value, u, v)),
+                u_range=u_range,
+                v_range=v_range,
+                resolution=resolution,
+                **kwargs,
+            )
+
+        return self.cache.get(self._key("plane", fixed, value, u_range, v_range, resolution, **kwargs), build)
+
+    def grid(self, fixed, value, u_ticks, v_ticks, u_range, v_range, **kwargs):
+        """Lines at each u tick across `v_range`, then at each v tick across `u_range`."""
+        def build():
+            c2p = self.axes.c2p
+            lines = VGroup()
+            for u in u_ticks:
+                lines.add(Line(
+                    c2p(*self._coords(fixed, value, u, v_range[0])),
+                    c2p(*self._coords(fixed, value, u, v_range[1])),
+                    **kwargs,
+                ))
+            for v in v_ticks:
+                lines.add(Line(
+                    c2p(*self._coords(fixed, value, u_range[0], v)),
+                    c2p(*self._coords(fixed, value, u_range[1], v)),
+                    **kwargs,
+                ))
+            return lines
+
+        key = self._key("grid", fixed, value, tuple(u_ticks), tuple(v_ticks), u_range, v_range, **kwargs)
+        return self.cache.get(key, build)
+
+    def graph_slice(self, func, fixed, value, t_range, stroke_width=None, **kwargs):
+        """The curve z = func(x, y) with `fixed` ("x" or "y") held at `value`.
+
+        The stroke width is set on the copy, so slices that differ only in
+        width share one sampled curve.
+        """
+        def point(t):
+            x, y, _ = self._coords(fixed, value, t, 0)
+            return self.axes.c2p(x, y, func(x, y))
+
+        def build():
+            return ParametricFunction(point, t_range=t_range, **kwargs)
+
+        curve = self.cache.get(self._key("graph_slice", func, fixed, value, t_range, **kwargs), build)
+        if stroke_width is not None:
+            curve.set_stroke(width=stroke_width)
+        return curve
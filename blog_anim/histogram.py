@@ -0,0 +1,96 @@
+"""A histogram mobject that grows sample by sample.
+
+Every bin gets one Rectangle up front. Moving the sample count forward (or
+back) only bins the samples that were added (or removed), and only the bars
+whose height actually changed get new points, so a frame costs O(bins) no
+matter how many samples have been drawn.
+"""
+
+import numpy as np
+from manim import VGroup, Rectangle, GREEN
+
+
+def bin_indices(values, edges):
+    """Bin index of every value, matching np.histogram (-1 when out of range)."""
+    values = np.asarray(values, dtype=float)
+    indices = np.searchsorted(edges, values, side="right") - 1
+    # np.histogram puts the right edge into the last bin
+    indices[values == edges[-1]] = len(edges) - 2
+    indices[(values < edges[0]) | (values > edges[-1])] = -1
+    return indices
+
+
+class IncrementalHistogram(VGroup):
+    def __init__(
+        self,
+        axes,
+        values,
+        bins,
+        max_height=15,
+        bar_width_ratio=0.9,
+        color=GREEN,
+        fill_opacity=0.7,
+        stroke_width=1,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.edges = np.asarray(bins, dtype=float)
+        self.max_height = max_height
+        self.fill_opacity = fill_opacity
+        self.bar_stroke_width = stroke_width
+
+        num_bins = len(self.edges) - 1
+        self._indices = bin_indices(values, self.edges)
+        self.counts = np.zeros(num_bins, dtype=np.int64)
+        self.num_values = 0
+        self._heights = np.zeros(num_bins)
+
+        # Bar corners in scene space; only the top edge moves
+        centers = (self.edges[:-1] + self.edges[1:]) / 2
+        half_widths = np.diff(self.edges) * bar_width_ratio / 2
+        self._left = np.array([axes.c2p(x, 0)[0] for x in centers - half_widths])
+        self._right = np.array([axes.c2p(x, 0)[0] for x in centers + half_widths])
+        origin = axes.c2p(0, 0)
+        self._y0 = origin[1]
+        self._y_unit = axes.c2p(0, 1)[1] - origin[1]
+
+        for _ in range(num_bins):
+            bar = Rectangle(color=color, fill_opacity=0, stroke_opacity=0, stroke_width=stroke_width)
+            self.add(bar)
+
+    def set_count(self, n):
+        """Show the histogram of the first `n` values."""
+        n = int(np.clip(n, 0, len(self._indices)))
+        if n > self.num_values:
+            added = self._indices[self.num_values:n]
+            self.counts += np.bincount(added[added >= 0], minlength=len(self.counts))
+        elif n < self.num_values:
+            removed = self._indices[n:self.num_values]
+            self.counts -= np.bincount(removed[removed >= 0], minlength=len(self.counts))
+        self.num_values = n
+
+        # Bars are scaled so the tallest one is always `max_height`
+        max_count = max(self.counts.max(), 1)
+        heights = self.counts / max_count * self.max_height
+        for j in np.flatnonzero(heights != self._heights):
+            self._resize_bar(j, heights[j])
+        self._heights = heights
+        return self
+
+    def _resize_bar(self, j, height):
+        bar = self.submobjects[j]
+        if height <= 0:
+            # Empty bins are not drawn at all
+            bar.set_fill(opacity=0).set_stroke(opacity=0)
+            return
+        if self._heights[j] <= 0:
+            bar.set_fill(opacity=self.fill_opacity).set_stroke(opacity=1)
+        top = self._y0 + height * self._y_unit
+        left, right = self._left[j], self._right[j]
+        bar.set_points_as_corners([
+            [right, top, 0],
+            [left, top, 0],
+            [left, self._y0, 0],
+            [right, self._y0, 0],
+            [right, top, 0],
+        ])
@@ -0,0 +1,217 @@
+"""Split a render's wall time into phases by patching manim's hot paths.
+
+Time is charged to the innermost active phase, so nested calls are not
+counted twice. Whatever is not inside a named phase is scene code: building
+mobjects, interpolating animations and running updaters.
+
+    timer = PhaseTimer().install()
+    try:
+        scene.render()
+    finally:
+        timer.uninstall()
+    timer.totals  # {"rasterize": 3.1, "encode": 1.2}
+
+Profiler goes further for hot-spot hunting (see blog_anim.profiling): it
+also times every updater call, every play and the animation interpolation
+inside it, and keeps the time of each stack of phases, e.g.
+``LLNandCLT;play 9: ValueTracker.animate.set_value;updater update_histogram``,
+which is the collapsed-stack format flame graph viewers read.
+"""
+
+import functools
+import inspect
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+
+
+class PhaseTimer:
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.totals = defaultdict(float)
+        self.counts = Counter()
+        # Calls per patched function, e.g. "SceneFileWriter.write_frame"
+        self.calls = Counter()
+        # Self time per stack of phases, outermost first
+        self.stacks = defaultdict(float)
+        self._stack = []
+        self._mark = 0.0
+        self._patches = []
+
+    def _charge(self, now):
+        elapsed = now - self._mark
+        self.totals[self._stack[-1]] += elapsed
+        self.stacks[tuple(self._stack)] += elapsed
+        self._mark = now
+
+    def enter(self, name):
+        now = self.clock()
+        if self._stack:
+            self._charge(now)
+        self._stack.append(name)
+        self.counts[name] += 1
+        self._mark = now
+
+    def exit(self):
+        self._charge(self.clock())
+        self._stack.pop()
+
+    def patch(self, owner, attr, replacement):
+        """Replace `owner.attr` until uninstall()."""
+        self._patches.append((owner, attr, getattr(owner, attr)))
+        setattr(owner, attr, replacement)
+
+    def wrap(self, owner, attr, name):
+        """Charge every call of `owner.attr` to phase `name`."""
+        original = getattr(owner, attr)
+        key = f"{owner.__name__}.{attr}"
+
+        @functools.wraps(original)
+        def timed(*args, **kwargs):
+            self.calls[key] += 1
+            self.enter(name)
+            try:
+                return original(*args, **kwargs)
+            finally:
+                self.exit()
+
+        self.patch(owner, attr, timed)
+
+    def install(self):
+        from manim.renderer.cairo_renderer import CairoRenderer
+        from manim.scene.scene_file_writer import SceneFileWriter
+
+        # Cairo drawing of the frame, including the static background copy
+        self.wrap(CairoRenderer, "update_frame", "rasterize")
+        # Frames pushed to the encoder, partial movies closed and concatenated
+        self.wrap(SceneFileWriter, "write_frame", "encode")
+        self.wrap(SceneFileWriter, "end_animation", "encode")
+        self.wrap(SceneFileWriter, "combine_to_movie", "encode")
+        return self
+
+    def uninstall(self):
+        while self._patches:
+            owner, attr, original = self._patches.pop()
+            setattr(owner, attr, original)
+
+
+def _short_name(function, located=True):
+    name = getattr(function, "__qualname__", None) or type(function).__name__
+    name = name.replace("<locals>.", "")
+    code = getattr(function, "__code__", None)
+    if located and "<lambda>" in name and code is not None:
+        name += f"@{Path(code.co_filename).name}:{code.co_firstlineno}"
+    return name
+
+
+def updater_name(updater):
+    """Readable name of an updater; manim's wrappers are named after what they wrap.
+
+    ``always_redraw(lambda: ...)`` adds an updater lambda of its own, so it
+    shows up as ``always_redraw.<lambda>(MyScene.construct.<lambda>@my_scene.py:57)``.
+    """
+    function = getattr(updater, "func", updater)
+    if not (getattr(function, "__module__", "").startswith("manim.") and getattr(function, "__closure__", None)):
+        return _short_name(function)
+    inner = [cell.cell_contents for cell in function.__closure__ if inspect.isfunction(cell.cell_contents)]
+    name = _short_name(function, located=False)
+    return f"{name}({', '.join(map(_short_name, inner))})" if inner else name
+
+
+def animation_name(animation):
+    """`tracker.animate.set_value(...)` as "ValueTracker.animate.set_value", else the class."""
+    methods = getattr(animation, "methods", None)
+    if methods:
+        calls = ".".join(method.__name__ for method, _, _ in methods)
+        return f"{type(animation.mobject).__name__}.animate.{calls}"
+    return type(animation).__name__
+
+
+class Profiler(PhaseTimer):
+    """PhaseTimer that also times each play, interpolation and updater call.
+
+    Phases nest as the scene's root phase (entered by the caller), then
+    ``play N: <animations>``, then ``interpolate`` (Scene.update_to_time,
+    i.e. the animations' interpolation) with ``updater <name>`` inside it,
+    and ``rasterize`` and ``encode`` next to it. Time in the root phase
+    itself is construct code outside any play.
+    """
+
+    def __init__(self, clock=time.perf_counter):
+        super().__init__(clock)
+        # Play index -> (phase name, animated seconds)
+        self.plays = {}
+        self._names = {}
+
+    def _updater_phase(self, updater):
+        try:
+            return self._names[updater]
+        except KeyError:
+            name = self._names[updater] = "updater " + updater_name(updater)
+            return name
+        except TypeError:
+            return "updater " + updater_name(updater)
+
+    def install(self):
+        super().install()
+        from manim.mobject.mobject import Mobject
+        from manim.renderer.cairo_renderer import CairoRenderer
+        from manim.scene.scene import Scene
+
+        profiler = self
+        play = CairoRenderer.play
+        compile_animation_data = Scene.compile_animation_data
+
+        def profiled_play(renderer, scene, *args, **kwargs):
+            index, depth = renderer.num_plays, len(profiler._stack)
+            try:
+                return play(renderer, scene, *args, **kwargs)
+            finally:
+                # The play's phase is entered once its animations are known
+                if len(profiler._stack) > depth:
+                    profiler.exit()
+                    profiler.plays[index] = (profiler.plays[index][0], scene.duration)
+
+        def profiled_compile(scene, *args, **kwargs):
+            result = compile_animation_data(scene, *args, **kwargs)
+            if scene.animations:
+                index = scene.renderer.num_plays
+                names = dict.fromkeys(animation_name(animation) for animation in scene.animations)
+                name = f"play {index}: {', '.join(names)}"
+                profiler.plays[index] = (name, 0.0)
+                profiler.enter(name)
+            return result
+
+        # Mobject.update, with each updater call in a phase of its own
+        def profiled_update(mobject, dt=0, recursive=True):
+            if mobject.updating_suspended:
+                return mobject
+            for updater in mobject.updaters:
+                takes_dt = "dt" in inspect.signature(updater).parameters
+                profiler.enter(profiler._updater_phase(updater))
+                try:
+                    if takes_dt:
+                        updater(mobject, dt)
+                    else:
+                        updater(mobject)
+                finally:
+                    profiler.exit()
+            if recursive:
+                for submob in mobject.submobjects:
+                    submob.update(dt, recursive)
+            return mobject
+
+        self.patch(CairoRenderer, "play", profiled_play)
+        self.patch(Scene, "compile_animation_data", profiled_compile)
+        self.patch(Mobject, "update", profiled_update)
+        self.wrap(Scene, "update_to_time", "interpolate")
+        return self
+
+    def collapsed(self):
+        """Lines of "phase;phase;phase microseconds", for flamegraph.pl or speedscope."""
+        lines = []
+        for stack, seconds in sorted(self.stacks.items()):
+            microseconds = round(seconds * 1e6)
+            if microseconds:
+                lines.append(";".join(name.replace(";", ",") for name in stack) + f" {microseconds}")
+        return lines
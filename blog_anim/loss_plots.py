@@ -0,0 +1,51 @@
+"""The loss parabola the learning-rate scenes descend on.
+
+LearningRateTooBig, TooSmall, JustRight and the sweep all draw the same
+picture: axes over w in [-5, 5], the loss L(w) = w^2 and its minimum. The
+sweep draws it a few dozen times at panel size.
+"""
+
+import numpy as np
+from manim import BLUE, GREEN, Axes, Dot, VGroup
+
+from .coords import coords_to_points
+from .functions import FunctionSpec
+
+LOSS = FunctionSpec("x**2")
+
+
+class LossPlot(VGroup):
+    """Axes, the graph of `loss` over [-4.5, 4.5] and its minimum dot.
+
+    The parts are ``axes``, ``graph`` and ``min_point``; ``loss`` is the
+    FunctionSpec plotted.
+    """
+
+    def __init__(
+        self,
+        loss=LOSS,
+        y_max=25,
+        x_length=10,
+        y_length=5,
+        include_tip=True,
+        stroke_width=3,
+        min_radius=0.12,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.loss = loss
+        self.axes = Axes(
+            x_range=[-5, 5, 1],
+            y_range=[0, y_max, 5],
+            x_length=x_length,
+            y_length=y_length,
+            axis_config={"include_tip": include_tip},
+        )
+        self.graph = self.axes.plot(loss, x_range=[-4.5, 4.5], color=BLUE, stroke_width=stroke_width)
+        self.min_point = Dot(self.axes.c2p(0, 0), color=GREEN, radius=min_radius)
+        self.add(self.axes, self.graph, self.min_point)
+
+    def graph_points(self, xs):
+        """Scene points on the graph above the iterates `xs`, shape xs.shape + (3,)."""
+        xs = np.asarray(xs, dtype=float)
+        return coords_to_points(self.axes, xs, self.loss(xs))
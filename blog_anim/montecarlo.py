@@ -0,0 +1,52 @@
+"""Vectorized sample-mean simulation for the LLN / CLT scene.
+
+Samples are drawn as a (rows, sample_size) block per chunk from a seeded
+``numpy.random.Generator`` and reduced to their means straight away, so the
+memory used by the raw draws stays bounded by the chunk size no matter how
+many samples are simulated. Running averages are one cumulative sum at the
+end instead of a mean over the whole prefix per sample.
+"""
+
+import numpy as np
+
+# Upper bound on draws held in memory at once (about 8 MB of int8)
+CHUNK_ELEMENTS = 8_000_000
+
+
+def roll_dice(rng, shape, faces=6):
+    return rng.integers(1, faces + 1, size=shape, dtype=np.int8)
+
+
+def stream_sample_means(sample_size, num_samples=None, seed=None, draw=roll_dice, chunk_elements=CHUNK_ELEMENTS):
+    """Yield batches of sample means, forever if `num_samples` is None.
+
+    `draw(rng, shape)` returns an array of independent draws; the default
+    rolls fair six-sided dice. The same seed yields the same means however
+    the batches are consumed.
+    """
+    rng = np.random.default_rng(seed)
+    rows = max(1, chunk_elements // sample_size)
+    produced = 0
+    while num_samples is None or produced < num_samples:
+        count = rows if num_samples is None else min(rows, num_samples - produced)
+        block = draw(rng, (count, sample_size))
+        yield block.mean(axis=1, dtype=np.float64)
+        produced += count
+
+
+def sample_means(num_samples, sample_size, seed=None, draw=roll_dice, chunk_elements=CHUNK_ELEMENTS):
+    """Mean of each of `num_samples` samples of `sample_size` draws."""
+    means = np.empty(num_samples, dtype=np.float64)
+    start = 0
+    for batch in stream_sample_means(sample_size, num_samples, seed, draw, chunk_elements):
+        means[start:start + len(batch)] = batch
+        start += len(batch)
+    return means
+
+
+def running_mean(values):
+    """Average of values[:i + 1] for every i, in one pass."""
+    running = np.cumsum(values, dtype=np.float64)
+    running /= np.arange(1, len(values) + 1)
+    return running
+
@@ -0,0 +1,124 @@
+"""Gradient descent for many learning rates and starting points at once.
+
+The learning-rate scenes each ran their own scalar loop of
+``x - alpha * gradient``. ``descend`` runs a whole batch of trajectories in
+one loop over steps, every step a handful of array operations across the
+batch: the starting points and learning rates broadcast against each other,
+so a sweep of 40 learning rates from one start is a single call. Each
+trajectory stops on its own once it converges or diverges and holds its
+last iterate from then on.
+
+    run = descend(loss.derivative, 4.0, np.geomspace(0.001, 1.1, 40), steps=50,
+                  target=0.0, tol=0.05)
+    run.converged      # (40,) bool
+    run.path(7)        # iterates of the 8th learning rate, up to its stop
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+METHODS = ("gd", "momentum", "adam")
+
+
+@dataclass(frozen=True)
+class Descent:
+    """Iterates of a batch of trajectories, shape (steps + 1, *batch, *point).
+
+    `stops` is the index of each trajectory's last iterate: where it
+    converged or diverged, or the final step. Iterates after a stop repeat
+    the stopped value.
+    """
+
+    iterates: np.ndarray
+    stops: np.ndarray
+    converged: np.ndarray
+    diverged: np.ndarray
+
+    def path(self, index=()):
+        """Iterates of the trajectory at batch `index`, up to and including its stop."""
+        index = np.index_exp[index]
+        return self.iterates[(slice(0, self.stops[index] + 1),) + index]
+
+
+def descend(
+    gradient,
+    x0,
+    learning_rate,
+    steps,
+    method="gd",
+    momentum=0.9,
+    betas=(0.9, 0.999),
+    eps=1e-8,
+    bounds=None,
+    target=None,
+    tol=None,
+    diverge_above=1e6,
+    ndim=0,
+):
+    """Run `steps` steps of `method` ("gd", "momentum" or "adam") on a batch.
+
+    `gradient(x)` maps an array of points to their gradients, elementwise
+    over the batch. Points are scalars, or have `ndim` trailing axes. `x0`
+    and `learning_rate` broadcast to the batch shape. `bounds` (low, high)
+    clips every iterate. A trajectory converges when it comes within `tol`
+    of `target`, or, without a target, when a step is shorter than `tol`; it
+    diverges when it leaves `diverge_above` in norm or stops being finite.
+    """
+    if method not in METHODS:
+        raise ValueError(f"method must be one of {METHODS}, got {method!r}")
+    x = np.asarray(x0, dtype=float)
+    rates = np.asarray(learning_rate, dtype=float)
+    point_shape = x.shape[x.ndim - ndim:]
+    batch = np.broadcast_shapes(x.shape[:x.ndim - ndim], rates.shape)
+    x = np.broadcast_to(x, batch + point_shape).copy()
+    rates = np.broadcast_to(rates, batch).reshape(batch + (1,) * ndim)
+    point_axes = tuple(range(-ndim, 0))
+
+    def norm(a):
+        return np.sqrt(np.sum(a * a, axis=point_axes)) if ndim else np.abs(a)
+
+    def per_point(mask):
+        return mask.reshape(batch + (1,) * ndim)
+
+    velocity = np.zeros_like(x)
+    second = np.zeros_like(x)
+    converged = np.zeros(batch, dtype=bool)
+    diverged = np.zeros(batch, dtype=bool)
+    stops = np.zeros(batch, dtype=int)
+    iterates = [x.copy()]
+
+    for step in range(1, steps + 1):
+        active = ~(converged | diverged)
+        if not active.any():
+            break
+        g = np.asarray(gradient(x), dtype=float)
+        if method == "gd":
+            update = g
+        elif method == "momentum":
+            velocity = momentum * velocity + g
+            update = velocity
+        else:
+            velocity = betas[0] * velocity + (1 - betas[0]) * g
+            second = betas[1] * second + (1 - betas[1]) * g * g
+            corrected = velocity / (1 - betas[0] ** step)
+            update = corrected / (np.sqrt(second / (1 - betas[1] ** step)) + eps)
+        new_x = x - rates * update
+        if bounds is not None:
+            new_x = np.clip(new_x, *bounds)
+
+        finite = np.all(np.isfinite(new_x), axis=point_axes) if ndim else np.isfinite(new_x)
+        moved = active & finite
+        step_length = norm(new_x - x)
+        x = np.where(per_point(moved), new_x, x)
+        stops[moved] = step
+
+        diverged |= active & (~finite | (norm(x) > diverge_above))
+        if tol is not None:
+            close = norm(x - target) < tol if target is not None else step_length < tol
+            converged |= moved & ~diverged & close
+        iterates.append(x.copy())
+
+    # Everything stopped early: the rest of the steps hold their last iterate
+    iterates.extend([x] * (steps + 1 - len(iterates)))
+    return Descent(np.stack(iterates), stops, converged, diverged)
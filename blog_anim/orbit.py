@@ -0,0 +1,257 @@
+"""Fast rendering of camera-only moves in ThreeDScenes.
+
+During ``begin_ambient_camera_rotation(); self.wait(8)`` nothing moves but
+the camera, yet ThreeDCamera redoes everything per frame: it walks every
+mobject family, sorts the faces by a depth key that recomputes each face's
+bounding box, projects each face separately and recomputes its shading
+(the light source is fixed in scene space, so the shading never changes).
+
+``OrbitCamera`` takes the mobjects as fixed for the duration of a
+``static_mobjects()`` block and keeps, from the first frame on:
+
+* the points of all shaded (3D) vmobjects in one array, projected with a
+  single call per frame;
+* their depth-key centres, so the depth order is one matrix product and a
+  stable re-sort of the previous frame's (nearly sorted) order;
+* their shaded fill and stroke colours;
+* the fixed-in-frame mobjects drawn last (titles, formulas), rasterized
+  once into a transparent layer that cairo paints over each frame.
+
+Everything else (axes, curves, labels) is drawn the usual way. Mix
+``OrbitMixin`` into a ThreeDScene and call ``self.orbit(rate, run_time)``
+in place of begin/wait/stop; ``move_camera`` without added animations takes
+the same path. Both fall back to the plain path when anything other than
+the camera has updaters.
+
+    class SaddlePoint(OrbitMixin, ThreeDScene):
+        def construct(self):
+            ...
+            self.orbit(rate=0.15, run_time=8)
+"""
+
+import itertools as it
+from contextlib import contextmanager
+
+import cairo
+import numpy as np
+from manim import ThreeDCamera, VMobject
+from manim.camera.camera import CAP_STYLE_MAP, LINE_JOIN_MAP, Camera
+from manim.constants import CapStyleType, LineJointType
+
+# VMobject.consider_points_equals_2d's relative tolerance
+RTOL = 1.0e-5
+
+
+def _close_2d(p0, p1, atol):
+    """VMobject.consider_points_equals_2d, for arrays of point pairs."""
+    atol = np.asarray(atol)[..., None]
+    return np.all(np.abs(p0[..., :2] - p1[..., :2]) <= atol + RTOL * np.abs(p1[..., :2]), axis=-1)
+
+
+class _StaticGeometry:
+    """What stays fixed about a scene while only the camera moves."""
+
+    def __init__(self, camera, mobjects):
+        self.key = [id(mob) for mob in mobjects]
+        family = Camera.get_mobjects_to_display(camera, mobjects)
+        solid = [mob for mob in family if getattr(mob, "shade_in_3d", False)]
+        flat = [mob for mob in family if not getattr(mob, "shade_in_3d", False)]
+        self.supported = all(self._is_plain(camera, mob) for mob in solid)
+        if not self.supported:
+            return
+
+        # ThreeDCamera draws shaded mobjects by depth, then the rest in
+        # order; the fixed-in-frame run at the end becomes the overlay
+        split = len(flat)
+        while split and flat[split - 1] in camera.fixed_in_frame_mobjects and self._is_vector(flat[split - 1]):
+            split -= 1
+        self.flat, self.overlay_mobjects = flat[:split], flat[split:]
+        self.solid = solid
+        self.order = np.arange(len(solid))
+        self.overlay = None
+
+        lengths = np.array([len(mob.points) for mob in solid], dtype=int)
+        self.offsets = np.concatenate([[0], np.cumsum(lengths)])
+        self.points = np.concatenate([mob.points for mob in solid]) if solid else np.zeros((0, 3))
+        self.centers = np.array([mob.get_z_index_reference_point() for mob in solid]).reshape(-1, 3)
+        # Curve boundaries where a subpath may break, and their tolerance
+        self.boundaries = np.concatenate([
+            np.arange(start + 4, start + length, 4)
+            for start, length in zip(self.offsets[:-1], lengths)
+        ] + [np.zeros(0, dtype=int)])
+        self.boundary_owner = np.searchsorted(self.offsets, self.boundaries, side="right") - 1
+        self.atol = np.array([mob.tolerance_for_point_equality for mob in solid])
+        # Shaded gradients run from the start corner to the end corner
+        self.gradient_index = np.stack([
+            self.offsets[:-1],
+            self.offsets[:-1] + (lengths - 1) // 6 * 3,
+        ], axis=1)
+        self.fills = [camera.get_fill_rgbas(mob) for mob in solid]
+        self.strokes = [camera.get_stroke_rgbas(mob) for mob in solid]
+        self.background_strokes = [camera.get_stroke_rgbas(mob, background=True) for mob in solid]
+
+    @staticmethod
+    def _is_vector(mob):
+        return isinstance(mob, VMobject) and not mob.get_background_image()
+
+    @classmethod
+    def _is_plain(cls, camera, mob):
+        return (
+            cls._is_vector(mob)
+            and mob not in camera.fixed_in_frame_mobjects
+            and mob not in camera.fixed_orientation_mobjects
+            and len(mob.points) >= 4
+            and np.all(np.isfinite(mob.points))
+        )
+
+    def draw(self, camera):
+        ctx = camera.get_cairo_context(camera.pixel_array)
+        if self.solid:
+            self._draw_solid(camera, ctx)
+        for group_type, group in it.groupby(self.flat, camera.type_or_raise):
+            camera.display_funcs[group_type](list(group), camera.pixel_array)
+        if self.overlay_mobjects:
+            self._paint_overlay(camera, ctx)
+
+    def _draw_solid(self, camera, ctx):
+        projected = camera.project_points(self.points)
+
+        # Same order as sorted(..., key=depth): re-sorting last frame's order
+        # is nearly linear, and only exact ties need the original order
+        depth = self.centers @ camera.get_rotation_matrix()[2]
+        order = self.order[np.argsort(depth[self.order], kind="stable")]
+        if np.any(depth[order][1:] == depth[order][:-1]):
+            order = np.argsort(depth, kind="stable")
+        self.order = order
+
+        apart = ~_close_2d(projected[self.boundaries - 1], projected[self.boundaries], self.atol[self.boundary_owner])
+        breaks = {}
+        for owner, index in zip(self.boundary_owner[apart], self.boundaries[apart]):
+            breaks.setdefault(owner, []).append(index)
+
+        for k in order:
+            mob = self.solid[k]
+            start, stop = self.offsets[k], self.offsets[k + 1]
+            cuts = [start, *breaks.get(k, ()), stop]
+            ctx.new_path()
+            for i1, i2 in zip(cuts, cuts[1:]):
+                if i2 - i1 < 4:
+                    continue
+                sub = projected[i1:i2]
+                ctx.new_sub_path()
+                ctx.move_to(sub[0, 0], sub[0, 1])
+                for p1, p2, p3 in zip(sub[1::4], sub[2::4], sub[3::4]):
+                    ctx.curve_to(p1[0], p1[1], p2[0], p2[1], p3[0], p3[1])
+                if _close_2d(sub[0], sub[-1], mob.tolerance_for_point_equality):
+                    ctx.close_path()
+
+            gradient = projected[self.gradient_index[k]]
+            self._stroke(camera, ctx, mob, self.background_strokes[k], gradient, background=True)
+            self._set_color(ctx, self.fills[k], gradient)
+            ctx.fill_preserve()
+            self._stroke(camera, ctx, mob, self.strokes[k], gradient)
+
+    @staticmethod
+    def _set_color(ctx, rgbas, gradient):
+        # As Camera.set_cairo_context_color, with the gradient ends projected
+        if len(rgbas) == 1:
+            ctx.set_source_rgba(*rgbas[0][2::-1], rgbas[0][3])
+            return
+        pattern = cairo.LinearGradient(*gradient[0, :2], *gradient[1, :2])
+        step = 1.0 / (len(rgbas) - 1)
+        for rgba, offset in zip(rgbas, np.arange(0, 1 + step, step)):
+            pattern.add_color_stop_rgba(offset, *rgba[2::-1], rgba[3])
+        ctx.set_source(pattern)
+
+    def _stroke(self, camera, ctx, mob, rgbas, gradient, background=False):
+        width = mob.get_stroke_width(background)
+        if width == 0:
+            return
+        self._set_color(ctx, rgbas, gradient)
+        ctx.set_line_width(width * camera.cairo_line_width_multiple)
+        if mob.joint_type != LineJointType.AUTO:
+            ctx.set_line_join(LINE_JOIN_MAP[mob.joint_type])
+        if mob.cap_style != CapStyleType.AUTO:
+            ctx.set_line_cap(CAP_STYLE_MAP[mob.cap_style])
+        ctx.stroke_preserve()
+
+    def _paint_overlay(self, camera, ctx):
+        if self.overlay is None:
+            layer = np.zeros_like(camera.pixel_array)
+            camera.display_multiple_vectorized_mobjects(self.overlay_mobjects, layer)
+            camera.pixel_array_to_cairo_context.pop(id(layer), None)
+            height, width = layer.shape[:2]
+            self.overlay = (layer, cairo.ImageSurface.create_for_data(layer, cairo.FORMAT_ARGB32, width, height))
+        ctx.save()
+        ctx.identity_matrix()
+        ctx.set_source_surface(self.overlay[1], 0, 0)
+        ctx.paint()
+        ctx.restore()
+
+
+class OrbitCamera(ThreeDCamera):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.mobjects_static = False
+        self._geometry = None
+
+    @contextmanager
+    def static_mobjects(self):
+        """Within the block the camera may move but no mobject may change."""
+        self.mobjects_static = True
+        try:
+            yield self
+        finally:
+            self.mobjects_static = False
+            self._geometry = None
+
+    def capture_mobjects(self, mobjects, **kwargs):
+        fast = (
+            self.mobjects_static
+            and kwargs.get("include_submobjects", True)
+            and not kwargs.get("excluded_mobjects")
+        )
+        if not fast:
+            return super().capture_mobjects(mobjects, **kwargs)
+        mobjects = list(mobjects)
+        if self._geometry is None or self._geometry.key != [id(mob) for mob in mobjects]:
+            self._geometry = _StaticGeometry(self, mobjects)
+        if not self._geometry.supported:
+            return super().capture_mobjects(mobjects)
+        self.reset_rotation_matrix()
+        self._geometry.draw(self)
+
+
+class OrbitMixin:
+    """Give a ThreeDScene an OrbitCamera and fast camera-only moves."""
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("camera_class", OrbitCamera)
+        super().__init__(*args, **kwargs)
+
+    @contextmanager
+    def camera_only(self):
+        """Use the fast path in the block if nothing but the camera updates."""
+        camera = self.renderer.camera
+        if not isinstance(camera, OrbitCamera):
+            yield
+            return
+        trackers = camera.get_value_trackers()
+        if any(mob.get_family_updaters() for mob in self.mobjects if mob not in trackers):
+            yield
+            return
+        with camera.static_mobjects():
+            yield
+
+    def orbit(self, rate=0.1, run_time=8, about="theta"):
+        """Ambient camera rotation for `run_time` seconds, then stop."""
+        self.begin_ambient_camera_rotation(rate=rate, about=about)
+        with self.camera_only():
+            self.wait(run_time)
+        self.stop_ambient_camera_rotation(about=about)
+
+    def move_camera(self, *args, added_anims=(), **kwargs):
+        if added_anims:
+            return super().move_camera(*args, added_anims=list(added_anims), **kwargs)
+        with self.camera_only():
+            return super().move_camera(*args, **kwargs)
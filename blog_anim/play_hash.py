@@ -0,0 +1,140 @@
+"""Deterministic play-call hashes that cover updaters, for manim's partial movie cache.
+
+manim names each partial movie file after a hash of the play call: the
+camera, the animations and every mobject on screen, serialized to JSON. For
+tracker plays driven by updaters (LLNandCLT's ``update_histogram``, the
+tangent in UnderstandingDerivatives) its encoder is unreliable:
+
+* an updater is hashed by its source text, so editing a comment invalidates
+  it, while default argument values and ``functools.partial`` arguments are
+  not hashed at all;
+* arrays over 1000 values are hashed by the repr of a resized copy, which
+  prints only its corners, so an updater reading ``running_averages`` can be
+  served a stale movie after the data changes (and those reprs take most of
+  the hashing time);
+* objects without a ``__dict__``, such as a NumPy random generator, are
+  hashed by their type only.
+
+``install()`` makes the Cairo renderer use ``PlayCallEncoder`` instead. A
+function is hashed by its code object (bytecode, constants and names, not
+line numbers), its defaults, and the globals and closure cells it reads. An
+array is hashed by a digest of its bytes, and a random generator by its
+state. A ValueTracker is a mobject whose value is kept in its points, so an
+updater that reads a tracker is hashed together with the tracker's value.
+The same play call then gives the same file name on every run, and it
+changes whenever the updaters would compute something different.
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import random
+from types import CodeType, FunctionType, MethodType, ModuleType
+
+import numpy as np
+from manim.utils.hashing import _CustomEncoder, _Memoizer
+
+
+# Objects built while encoding one play call. manim's memo of what it has
+# already encoded goes by id() for unhashable objects, so a temporary freed
+# mid-hash could hand its id to a new one that is then skipped as "already
+# processed"; keeping them alive until the hash is done prevents that.
+_temporaries = []
+
+
+def _digest(data):
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def _constant(value):
+    """repr of a code constant, with frozenset members in a fixed order."""
+    if isinstance(value, CodeType):
+        return code_digest(value)
+    if isinstance(value, frozenset):
+        return "frozenset(" + ",".join(sorted(map(_constant, value))) + ")"
+    if isinstance(value, tuple):
+        return "(" + ",".join(map(_constant, value)) + ")"
+    return repr(value)
+
+
+def code_digest(code):
+    """Digest of what `code` does, independent of its file and line numbers."""
+    parts = [
+        code.co_code,
+        repr((code.co_argcount, code.co_kwonlyargcount, code.co_flags)).encode(),
+        repr((code.co_names, code.co_varnames, code.co_freevars, code.co_cellvars)).encode(),
+        *(_constant(value).encode() for value in code.co_consts),
+    ]
+    return _digest(b"\0".join(parts))
+
+
+class PlayCallEncoder(_CustomEncoder):
+    """manim's play-call encoder with exact arrays and code-based functions."""
+
+    def _cleaned_iterable(self, iterable):
+        _temporaries.append(iterable)
+        return super()._cleaned_iterable(iterable)
+
+    def default(self, obj):
+        if isinstance(obj, (FunctionType, MethodType)):
+            function = getattr(obj, "__func__", obj)
+            variables = inspect.getclosurevars(function)
+            captured = {
+                name: value
+                for name, value in {**variables.globals, **variables.nonlocals}.items()
+                if not isinstance(value, ModuleType)
+            }
+            state = {
+                "code": code_digest(function.__code__),
+                "defaults": function.__defaults__,
+                "kwdefaults": function.__kwdefaults__,
+                "captured": captured,
+            }
+            if isinstance(obj, MethodType):
+                state["self"] = obj.__self__
+            return self._cleaned_iterable(state)
+        if isinstance(obj, functools.partial):
+            return self._cleaned_iterable({"func": obj.func, "args": obj.args, "keywords": obj.keywords})
+        if isinstance(obj, np.ndarray):
+            if obj.dtype.hasobject:
+                return self._cleaned_iterable(obj.tolist())
+            data = np.ascontiguousarray(obj).tobytes()
+            return f"ndarray {obj.dtype.str} {obj.shape} {_digest(data)}"
+        if isinstance(obj, np.generic):
+            return obj.item()
+        if isinstance(obj, np.random.Generator):
+            return self._cleaned_iterable(obj.bit_generator.state)
+        if isinstance(obj, np.random.RandomState):
+            return self._cleaned_iterable(obj.get_state(legacy=False))
+        if isinstance(obj, random.Random):
+            return self._cleaned_iterable(obj.getstate())
+        if isinstance(obj, (set, frozenset)):
+            return sorted(map(repr, obj))
+        return super().default(obj)
+
+
+def _json(obj):
+    return json.dumps(obj, cls=PlayCallEncoder)
+
+
+def get_hash_from_play_call(scene_object, camera_object, animations_list, current_mobjects_list):
+    """Drop-in for manim.utils.hashing.get_hash_from_play_call."""
+    _Memoizer.mark_as_processed(scene_object)
+    try:
+        parts = (
+            _json(camera_object),
+            [_json(animation) for animation in sorted(animations_list, key=str)],
+            [_json(mobject) for mobject in current_mobjects_list],
+        )
+    finally:
+        _Memoizer.reset_already_processed()
+        _temporaries.clear()
+    return "_".join(_digest(repr(part).encode()) for part in parts)
+
+
+def install():
+    """Hash play calls with PlayCallEncoder in this process."""
+    import manim.renderer.cairo_renderer as cairo_renderer
+
+    cairo_renderer.get_hash_from_play_call = get_hash_from_play_call
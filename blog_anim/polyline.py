@@ -0,0 +1,108 @@
+"""A polyline that grows along a precomputed array of points.
+
+The Bezier control points for the whole path are built once with NumPy.
+Showing the first n points is then a slice of that array, so a frame does not
+touch the points that are already on screen. Once the visible prefix holds
+more points than the screen has pixels for, its oldest part is folded into a
+downsampled head (Largest-Triangle-Three-Buckets), which keeps both the
+per-frame cost and the Cairo path length bounded at 100k+ points.
+"""
+
+import numpy as np
+from manim import VMobject, config
+
+
+def lttb(points, n_out):
+    """Indices of `n_out` points that keep the shape of a 2D series.
+
+    Largest-Triangle-Three-Buckets: the first and last points are kept, and
+    from each bucket in between the point spanning the largest triangle with
+    the previously kept point and the mean of the next bucket.
+    """
+    n = len(points)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x, y = points[:, 0], points[:, 1]
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    kept = np.empty(n_out, dtype=int)
+    kept[0] = 0
+    kept[-1] = n - 1
+    previous = 0
+    for b in range(n_out - 2):
+        start, stop = edges[b], edges[b + 1]
+        next_start, next_stop = stop, edges[b + 2] if b + 2 < len(edges) else n
+        mean_x = x[next_start:next_stop].mean()
+        mean_y = y[next_start:next_stop].mean()
+        area = np.abs(
+            (x[previous] - mean_x) * (y[start:stop] - y[previous])
+            - (x[previous] - x[start:stop]) * (mean_y - y[previous])
+        )
+        previous = start + int(np.argmax(area))
+        kept[b + 1] = previous
+    return kept
+
+
+def corners_to_bezier(corners):
+    """Control points of straight cubic segments through `corners`.
+
+    `corners` is (n, 3), or (..., n, 3) for a batch of polylines, which
+    gives (..., 4 * (n - 1), 3).
+    """
+    starts, ends = corners[..., :-1, :], corners[..., 1:, :]
+    bezier = np.empty(starts.shape[:-1] + (4, 3))
+    bezier[..., 0, :] = starts
+    bezier[..., 1, :] = starts + (ends - starts) / 3
+    bezier[..., 2, :] = starts + 2 * (ends - starts) / 3
+    bezier[..., 3, :] = ends
+    return bezier.reshape(corners.shape[:-2] + (-1, 3))
+
+
+class GrowingPolyline(VMobject):
+    def __init__(self, points, points_per_pixel=2, **kwargs):
+        super().__init__(**kwargs)
+        self.corners = np.asarray(points, dtype=float)
+        self._bezier = corners_to_bezier(self.corners)
+
+        # How many corners the line's horizontal extent can show
+        span = np.ptp(self.corners[:, 0]) / config.frame_width * config.pixel_width
+        self.budget = max(int(span * points_per_pixel), 16)
+
+        # Corners [0, head_end] replaced by a decimated head
+        self._head_end = 0
+        self._head_corners = self.corners[:1]
+        self._head_bezier = np.zeros((0, 3))
+        self.count = 0
+        self.set_points_as_corners([self.corners[0], self.corners[0]])
+
+    def set_count(self, n):
+        """Draw the line through the first `n` points."""
+        n = int(np.clip(n, 1, len(self.corners)))
+        if n < self._head_end + 1:
+            # Rewound into the decimated part: start over from raw points
+            self._head_end = 0
+            self._head_corners = self.corners[:1]
+            self._head_bezier = np.zeros((0, 3))
+
+        if n - self._head_end > self.budget:
+            self._fold_into_head(n)
+
+        tail = self._bezier[4 * self._head_end:4 * (n - 1)]
+        if n == 1:
+            self.set_points_as_corners([self.corners[0], self.corners[0]])
+        elif self._head_end == 0:
+            # A copy: shift, scale and rotate work on the points in place
+            # and would otherwise write into the precomputed path
+            self.points = tail.copy()
+        else:
+            self.points = np.concatenate([self._head_bezier, tail])
+        self.count = n
+        return self
+
+    def _fold_into_head(self, n):
+        # Keep half the budget of raw points at the end so the newest part of
+        # the line is exact; everything before it is downsampled
+        new_end = n - 1 - self.budget // 2
+        merged = np.concatenate([self._head_corners, self.corners[self._head_end + 1:new_end + 1]])
+        self._head_corners = merged[lttb(merged, self.budget // 2)]
+        self._head_bezier = corners_to_bezier(self._head_corners)
+        self._head_end = new_end
@@ -0,0 +1,179 @@
+"""Profile scenes down to single updaters, with flame graph output.
+
+    python -m blog_anim.profiling LLNandCLT
+    python -m blog_anim.profiling -q m UnderstandingDerivatives --out /tmp/profiles
+
+Each scene is rendered in a fresh process, with manim's partial movie cache
+off so every play is really drawn, under blog_anim.instrument.Profiler. For
+every scene two files are written to ``media/profiles``, named after its
+label (``LLM-CLT_animation.py.LLNandCLT``) since scene names repeat across
+files:
+
+* ``<label>.txt``: where the wall time went (scene code, interpolation,
+  updaters, rasterization, encoding), each updater's calls and time, and
+  the same split for every play;
+* ``<label>.collapsed``: the time of every stack of phases in the collapsed
+  format of flamegraph.pl (``flamegraph.pl <label>.collapsed > out.svg``),
+  also readable by speedscope.app.
+"""
+
+import argparse
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+from . import REPO_ROOT
+from .discovery import find_scenes, select_scenes
+from .instrument import Profiler
+from .render import QUALITIES, RenderOptions, render_scene
+
+DEFAULT_OUT = REPO_ROOT / "media" / "profiles"
+
+# How the innermost phase of a stack is reported
+CATEGORIES = ("interpolate", "updaters", "rasterize", "encode")
+
+
+def _category(phase):
+    if phase.startswith("updater "):
+        return "updaters"
+    return phase if phase in CATEGORIES else "other"
+
+
+def report_name(scene):
+    """File name stem for `scene`'s reports, e.g. "LLM-CLT_animation.py.LLNandCLT"."""
+    return scene.label.replace("/", "_").replace(":", ".")
+
+
+def _profile_job(scene, quality, media_dir):
+    options = RenderOptions(
+        quality=quality,
+        media_dir=media_dir,
+        overrides=(("disable_caching", True),),
+    )
+    profiler = Profiler().install()
+    start = time.perf_counter()
+    profiler.enter(scene.name)
+    try:
+        rendered = render_scene(scene.path, scene.name, options)
+    finally:
+        profiler.exit()
+        profiler.uninstall()
+    wall = time.perf_counter() - start
+
+    renderer = rendered.renderer
+    return {
+        "label": scene.label,
+        "root": scene.name,
+        "wall": wall,
+        "frames": round(renderer.time * renderer.camera.frame_rate),
+        "frames_written": profiler.calls["SceneFileWriter.write_frame"],
+        "totals": dict(profiler.totals),
+        "counts": dict(profiler.counts),
+        "stacks": dict(profiler.stacks),
+        "plays": profiler.plays,
+        "collapsed": profiler.collapsed(),
+    }
+
+
+def format_report(profile):
+    wall, totals, counts = profile["wall"], profile["totals"], profile["counts"]
+
+    def share(seconds):
+        return f"{seconds / wall:6.1%}" if wall else "     -"
+
+    updaters = {name: seconds for name, seconds in totals.items() if name.startswith("updater ")}
+    phases = {
+        "scene code": totals.get(profile["root"], 0.0),
+        "interpolate": totals.get("interpolate", 0.0),
+        "updaters": sum(updaters.values()),
+        "rasterize": totals.get("rasterize", 0.0),
+        "encode": totals.get("encode", 0.0),
+    }
+    frames = profile["frames"]
+    lines = [
+        profile["label"],
+        f"  wall {wall:.2f}s, {frames} frames" + (f", {wall / frames * 1000:.1f} ms per frame" if frames else ""),
+        "",
+        f"  {'phase':<14}{'self s':>9}  {'share':>6}",
+    ]
+    for phase, seconds in phases.items():
+        line = f"  {phase:<14}{seconds:9.3f}  {share(seconds)}"
+        if phase == "encode" and profile["frames_written"]:
+            line += f"  ({seconds / profile['frames_written'] * 1000:.2f} ms per frame written)"
+        lines.append(line)
+
+    if updaters:
+        width = max(len(name) for name in updaters) - len("updater ") + 2
+        lines += ["", f"  {'updater':<{width}}{'calls':>8}{'total s':>10}{'ms/call':>9}  {'share':>6}"]
+        for name, seconds in sorted(updaters.items(), key=lambda item: item[1], reverse=True):
+            calls = counts.get(name, 0)
+            per_call = seconds / calls * 1000 if calls else 0.0
+            lines.append(
+                f"  {name[len('updater '):]:<{width}}{calls:8d}{seconds:10.3f}{per_call:9.2f}  {share(seconds)}"
+            )
+
+    by_play = {}
+    for stack, seconds in profile["stacks"].items():
+        if len(stack) > 1 and stack[1].startswith("play "):
+            split = by_play.setdefault(stack[1], dict.fromkeys((*CATEGORIES, "other"), 0.0))
+            split[_category(stack[-1])] += seconds
+    if by_play:
+        width = max(len(name) for name, _ in profile["plays"].values()) + 2
+        header = "".join(f"{category:>12}" for category in (*CATEGORIES, "other"))
+        lines += ["", f"  {'play':<{width}}{'anim s':>7}{header}{'total':>9}"]
+        for index in sorted(profile["plays"]):
+            name, duration = profile["plays"][index]
+            split = by_play.get(name)
+            if split is None:
+                continue
+            cells = "".join(f"{split[category]:12.3f}" for category in (*CATEGORIES, "other"))
+            lines.append(f"  {name:<{width}}{duration:7.1f}{cells}{sum(split.values()):9.3f}")
+    return "\n".join(lines) + "\n"
+
+
+def profile_scenes(scenes, quality="l", out_dir=DEFAULT_OUT, log=print):
+    """Profile `scenes` one at a time and write their reports to `out_dir`."""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    media_dir = tempfile.mkdtemp(prefix="blog_anim_profile_")
+    try:
+        # One worker, recycled after every scene, as in blog_anim.bench
+        with ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=get_context("spawn"),
+            max_tasks_per_child=1,
+        ) as pool:
+            for scene in scenes:
+                profile = pool.submit(_profile_job, scene, quality, media_dir).result()
+                report = format_report(profile)
+                name = report_name(scene)
+                (out_dir / f"{name}.txt").write_text(report, encoding="utf-8")
+                (out_dir / f"{name}.collapsed").write_text(
+                    "\n".join(profile["collapsed"]) + "\n", encoding="utf-8"
+                )
+                log(report)
+    finally:
+        shutil.rmtree(media_dir, ignore_errors=True)
+    log(f"reports and collapsed stacks written to {out_dir}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m blog_anim.profiling", description=__doc__.splitlines()[0])
+    parser.add_argument("scenes", nargs="+", help="scene names, scene files or topic folders")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="l")
+    parser.add_argument("--out", default=str(DEFAULT_OUT), help=f"report folder (default: {DEFAULT_OUT})")
+    args = parser.parse_args(argv)
+
+    scenes = select_scenes(find_scenes(), args.scenes)
+    if not scenes:
+        parser.error(f"no scenes match {' '.join(args.scenes)}")
+    profile_scenes(scenes, args.quality, args.out)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,233 @@
+"""Render every Scene in the repo in a process pool.
+
+    python -m blog_anim.render                 # all scenes, low quality
+    python -m blog_anim.render -q h LLNandCLT  # one scene by name
+    python -m blog_anim.render Gradient/       # every scene in a folder
+    python -m blog_anim.render --list          # show the schedule only
+    python -m blog_anim.render --force         # ignore the render cache
+
+Jobs are started longest first (3D scenes and long tracker plays), so the
+pool does not end up waiting on one slow scene that started last. Scenes
+whose source, helpers, manim version and config are unchanged since the
+last build are served from the render cache (see blog_anim.cache). Still
+scenes (no play or wait, or ``still = True``) are written straight to a PNG
+of their last frame, without a movie writer or ffmpeg.
+"""
+
+import argparse
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from multiprocessing import get_context
+from pathlib import Path
+
+from . import REPO_ROOT
+from .cache import RenderCache, scene_key
+from .discovery import find_scenes, load_scene_module, select_scenes
+
+# What a still scene is written as: a PNG of the last frame, or an SVG of the
+# final mobjects (see blog_anim.svg_export)
+STILL_FORMATS = ("png", "svg")
+
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+
+@dataclass(frozen=True)
+class RenderOptions:
+    quality: str = "l"
+    media_dir: str = str(REPO_ROOT / "media")
+    # Extra manim config values, e.g. {"disable_caching": True}
+    overrides: tuple = ()
+    still_format: str = "png"
+
+    def manim_config(self, path, still=False):
+        config = {
+            "quality": QUALITIES[self.quality],
+            "media_dir": self.media_dir,
+            "input_file": str(path),
+            # Several workers share one terminal
+            "progress_bar": "none",
+            "verbosity": "WARNING",
+        }
+        if still:
+            # Skip every animation and write the last frame only; with no
+            # movie to write, no partial movie files or ffmpeg either
+            config.update(save_last_frame=True, write_to_movie=False)
+            # Not a manim setting (tempconfig drops it) but part of the cache key
+            config["still_format"] = self.still_format
+        config.update(dict(self.overrides))
+        return config
+
+    def cache_label(self, scene, still=False):
+        """`scene`'s entry in the render manifest.
+
+        A still gets an entry of its own per format, so rendering a scene's
+        movie, PNG and SVG in turn does not evict the others.
+        """
+        return f"{scene.label}@still.{self.still_format}" if still else scene.label
+
+
+@dataclass
+class RenderResult:
+    label: str
+    seconds: float
+    outputs: list = field(default_factory=list)
+    error: str = ""
+    cached: bool = False
+
+
+def scene_outputs(scene):
+    """Paths of the files the scene's file writer produced."""
+    writer = scene.renderer.file_writer
+    outputs = []
+    for attr in ("movie_file_path", "image_file_path", "gif_file_path", "svg_file_path"):
+        path = getattr(writer, attr, None)
+        if path and Path(path).exists():
+            outputs.append(str(path))
+    return outputs
+
+
+def build_scene(scene_cls, options, still=False):
+    """Instantiate `scene_cls` with the renderer its output format needs.
+
+    Call inside the scene's tempconfig.
+    """
+    if still and options.still_format == "svg":
+        from .svg_export import SVGRenderer
+
+        return scene_cls(renderer=SVGRenderer())
+    return scene_cls()
+
+
+def render_scene(path, name, options, still=False):
+    """Render one scene in this process and return the finished Scene.
+
+    With `still`, only the end state is rendered, to a PNG or an SVG.
+    """
+    from manim import tempconfig
+
+    from . import play_hash
+
+    # Tracker plays with updaters get reliable partial movie file names too
+    play_hash.install()
+    module = load_scene_module(path)
+    scene_cls = getattr(module, name)
+    with tempconfig(options.manim_config(path, still)):
+        scene = build_scene(scene_cls, options, still)
+        scene.render()
+    return scene
+
+
+def _render_job(scene, options):
+    # Runs in a worker process; errors are reported, not raised, so one broken
+    # scene does not take the rest of the batch down with it
+    start = time.perf_counter()
+    try:
+        outputs = scene_outputs(render_scene(scene.path, scene.name, options, scene.still))
+    except Exception:
+        return RenderResult(scene.label, time.perf_counter() - start, error=traceback.format_exc())
+    return RenderResult(scene.label, time.perf_counter() - start, outputs)
+
+
+def schedule(scenes):
+    """Longest estimated job first."""
+    return sorted(scenes, key=lambda s: s.cost, reverse=True)
+
+
+def _log_result(result, log):
+    status = "FAILED" if result.error else "cached" if result.cached else "ok"
+    log(f"{result.seconds:8.1f}s  {status:6}  {result.label}")
+    if result.error:
+        log(result.error)
+
+
+def render_all(scenes, options, jobs=None, log=print, use_cache=True, tex_prepass=True):
+    jobs = jobs or os.cpu_count() or 1
+    start = time.perf_counter()
+    cache = RenderCache(options.media_dir)
+    results = []
+
+    # Scene label -> (manifest label, key)
+    entries = {}
+    pending = []
+    for scene in schedule(scenes):
+        key = scene_key(scene, options.manim_config(scene.path, scene.still))
+        label = options.cache_label(scene, scene.still)
+        entries[scene.label] = (label, key)
+        outputs = cache.lookup(label, key) if use_cache else None
+        if outputs is None:
+            pending.append(scene)
+            continue
+        result = RenderResult(scene.label, 0.0, outputs, cached=True)
+        results.append(result)
+        _log_result(result, log)
+
+    # Scenes never rendered into this media folder most likely have none of
+    # their LaTeX cached either: typeset it for all of them in a few batches
+    fresh = [scene for scene in pending if entries[scene.label][0] not in cache.entries]
+    if tex_prepass and fresh:
+        from .texbatch import prepare_tex
+
+        prepare_tex(fresh, options, jobs=jobs, log=log)
+
+    if pending:
+        # A fresh process per scene: manim's config and caches are global state
+        with ProcessPoolExecutor(
+            max_workers=min(jobs, len(pending)),
+            mp_context=get_context("spawn"),
+            max_tasks_per_child=1,
+        ) as pool:
+            futures = [pool.submit(_render_job, scene, options) for scene in pending]
+            for future in as_completed(futures):
+                result = future.result()
+                results.append(result)
+                _log_result(result, log)
+                if not result.error:
+                    cache.store(*entries[result.label], result.outputs, result.seconds)
+                    # Save as we go so an interrupted build keeps its progress
+                    cache.save()
+
+    log(f"{time.perf_counter() - start:8.1f}s  total ({len(pending)} rendered, "
+        f"{len(results) - len(pending)} cached, {jobs} workers)")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m blog_anim.render", description=__doc__.splitlines()[0])
+    parser.add_argument("scenes", nargs="*", help="scene names, scene files or topic folders (default: all)")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="l")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="worker processes (default: all cores)")
+    parser.add_argument("--media-dir", default=str(REPO_ROOT / "media"))
+    parser.add_argument("--list", action="store_true", help="print the schedule and exit")
+    parser.add_argument("--force", action="store_true", help="re-render scenes even if they are cached")
+    parser.add_argument("--no-tex-batch", action="store_true", help="skip the batched LaTeX pre-pass for new scenes")
+    args = parser.parse_args(argv)
+
+    scenes = select_scenes(find_scenes(), args.scenes)
+    if not scenes:
+        parser.error(f"no scenes match {' '.join(args.scenes)}")
+
+    if args.list:
+        for scene in schedule(scenes):
+            kind = "still" if scene.still else "3D" if scene.is_3d else "2D"
+            print(f"{scene.cost:8.1f}  {kind:5}  {scene.label}")
+        return 0
+
+    options = RenderOptions(quality=args.quality, media_dir=args.media_dir)
+    results = render_all(
+        scenes, options, jobs=args.jobs, use_cache=not args.force, tex_prepass=not args.no_tex_batch
+    )
+    return 1 if any(r.error for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,228 @@
+"""Render one long play of a scene in parallel time ranges.
+
+    python -m blog_anim.segments LLM-CLT/animation.py LLNandCLT
+    python -m blog_anim.segments Derivatives/derivative-slope-animation.py \\
+        UnderstandingDerivatives --play 12 -j 4
+
+Tracker-driven plays (``tracker.animate.set_value(...)`` with updaters) give
+a frame that only depends on the animation time, so the frames of one play
+can be split into contiguous ranges and rendered by separate processes:
+
+* a probe run (no frames drawn) finds the play's index and duration, by
+  default the longest play in the scene;
+* worker 0 renders the whole scene but only the first range of that play;
+* workers 1..k-1 fast-forward to the play with manim's animation-number
+  skipping (same seed, same construct code, so the same state) and render
+  only their range;
+* the partial movies are concatenated with an ffmpeg stream copy.
+
+Updaters that integrate ``dt`` themselves (rather than reading a tracker)
+receive the skipped time as one step, so they are only exact when they do
+not depend on the step size.
+"""
+
+import argparse
+import math
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import get_context
+from pathlib import Path
+
+from . import REPO_ROOT
+from .discovery import scenes_in_file
+from .render import QUALITIES, RenderOptions, render_scene
+
+SEED = 0
+
+
+@dataclass(frozen=True)
+class PlayInfo:
+    index: int
+    duration: float
+    # Static waits are written as one frozen frame and cannot be split
+    frozen: bool
+
+
+def _seed():
+    import numpy as np
+
+    random.seed(SEED)
+    np.random.seed(SEED)
+
+
+def _probe_job(path, name, options):
+    from manim import Scene
+
+    plays = []
+    original = Scene.compile_animation_data
+
+    def recording(scene, *args, **kwargs):
+        result = original(scene, *args, **kwargs)
+        frozen = scene.is_current_animation_frozen_frame() if result is not None else True
+        plays.append(PlayInfo(scene.renderer.num_plays, scene.duration, frozen))
+        return result
+
+    Scene.compile_animation_data = recording
+    try:
+        _seed()
+        # save_last_frame makes the renderer skip every animation
+        probe = RenderOptions(
+            quality=options.quality,
+            media_dir=options.media_dir,
+            overrides=(("write_to_movie", False), ("save_last_frame", True)),
+        )
+        render_scene(path, name, probe)
+    finally:
+        Scene.compile_animation_data = original
+    return plays
+
+
+def _segment_job(path, name, options, play_index, start, stop, segment):
+    from manim import Scene
+    from tqdm import tqdm
+
+    original = Scene.get_time_progression
+
+    def segmented(scene, run_time, *args, **kwargs):
+        progression = original(scene, run_time, *args, **kwargs)
+        if scene.renderer.num_plays != play_index or scene.renderer.skip_animations:
+            return progression
+        times = [t for t in progression.iterable if start <= t < stop]
+        progression.close()
+        return tqdm(times, disable=True)
+
+    Scene.get_time_progression = segmented
+    try:
+        _seed()
+        scene = render_scene(path, name, options)
+    finally:
+        Scene.get_time_progression = original
+
+    writer = scene.renderer.file_writer
+    partials = [f for section in writer.sections for f in section.partial_movie_files]
+    return segment, partials, str(writer.movie_file_path)
+
+
+def frame_ranges(duration, frame_rate, parts):
+    """Split a play's frame times into `parts` contiguous [start, stop) windows."""
+    # Same count as manim's np.arange(0, run_time, 1 / frame_rate)
+    num_frames = math.ceil(duration * frame_rate - 1e-9)
+    parts = max(1, min(parts, num_frames))
+    bounds = [round(num_frames * k / parts) for k in range(parts + 1)]
+    # Half a frame of slack so float frame times land in exactly one window
+    edges = [(b - 0.5) / frame_rate for b in bounds]
+    edges[0], edges[-1] = float("-inf"), float("inf")
+    return list(zip(edges[:-1], edges[1:]))
+
+
+def stitch(files, output):
+    """Concatenate movies with identical encoding without re-encoding."""
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise RuntimeError("ffmpeg is needed to stitch the segments")
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as listing:
+        for file in files:
+            listing.write(f"file '{Path(file).as_posix()}'\n")
+    try:
+        subprocess.run(
+            [ffmpeg, "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+             "-i", listing.name, "-c", "copy", "-movflags", "+faststart", str(output)],
+            check=True,
+        )
+    finally:
+        Path(listing.name).unlink()
+
+
+def render_segmented(path, name, quality="l", jobs=4, play=None, media_dir=str(REPO_ROOT / "media"), log=print):
+    from manim.constants import QUALITIES as MANIM_QUALITIES
+
+    frame_rate = MANIM_QUALITIES[QUALITIES[quality]]["frame_rate"]
+    options = RenderOptions(quality=quality, media_dir=media_dir)
+    context = get_context("spawn")
+    start_time = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+        plays = pool.submit(_probe_job, path, name, options).result()
+    candidates = [p for p in plays if not p.frozen]
+    if play is None:
+        if not candidates:
+            raise ValueError(f"{name} has no animated plays to split")
+        target = max(candidates, key=lambda p: p.duration)
+    else:
+        target = next((p for p in candidates if p.index == play), None)
+        if target is None:
+            raise ValueError(f"play {play} of {name} is not an animated play")
+
+    windows = frame_ranges(target.duration, frame_rate, jobs)
+    log(f"play {target.index} ({target.duration:g}s) split into {len(windows)} segments")
+
+    scratch = Path(media_dir) / "segments" / name
+    results = {}
+    with ProcessPoolExecutor(max_workers=len(windows), mp_context=context, max_tasks_per_child=1) as pool:
+        futures = []
+        for segment, (start, stop) in enumerate(windows):
+            overrides = {
+                # Predictable partial movie names, never reused across runs
+                "disable_caching": True,
+                "partial_movie_dir": str(scratch / str(segment)),
+            }
+            if segment > 0:
+                overrides.update({
+                    "from_animation_number": target.index,
+                    "upto_animation_number": target.index,
+                    "output_file": f"{name}_segment{segment}",
+                })
+            segment_options = RenderOptions(quality, media_dir, tuple(overrides.items()))
+            futures.append(pool.submit(
+                _segment_job, path, name, segment_options, target.index, start, stop, segment,
+            ))
+        for future in futures:
+            segment, partials, movie = future.result()
+            results[segment] = (partials, movie)
+            log(f"{time.perf_counter() - start_time:8.1f}s  segment {segment} done")
+
+    # Worker 0's partial movies, with the split play expanded into all segments
+    partials, movie = results[0]
+    files = []
+    for index, file in enumerate(partials):
+        if index == target.index:
+            files.extend(results[segment][0][index] for segment in sorted(results))
+        elif file and Path(file).exists():
+            files.append(file)
+    stitch(files, movie)
+
+    for segment in sorted(results)[1:]:
+        Path(results[segment][1]).unlink(missing_ok=True)
+    shutil.rmtree(scratch, ignore_errors=True)
+    log(f"{time.perf_counter() - start_time:8.1f}s  total -> {movie}")
+    return movie
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m blog_anim.segments", description=__doc__.splitlines()[0])
+    parser.add_argument("file", help="scene file")
+    parser.add_argument("scene", nargs="?", help="scene class (default: the only one in the file)")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="l")
+    parser.add_argument("-j", "--jobs", type=int, default=4, help="segments to render in parallel")
+    parser.add_argument("--play", type=int, help="animation number to split (default: the longest)")
+    parser.add_argument("--media-dir", default=str(REPO_ROOT / "media"))
+    args = parser.parse_args(argv)
+
+    name = args.scene
+    if name is None:
+        names = [scene.name for scene in scenes_in_file(args.file)]
+        if len(names) != 1:
+            parser.error(f"pick one of: {', '.join(names)}")
+        name = names[0]
+    render_segmented(Path(args.file).resolve(), name, args.quality, args.jobs, args.play, args.media_dir)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
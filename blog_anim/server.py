@@ -0,0 +1,316 @@
+"""A warm render server: manim loaded once, a forked worker per scene.
+
+    python -m blog_anim.server start --detach           # start in the background
+    python -m blog_anim.server render SaddlePoint       # render through it
+    python -m blog_anim.server render -q h Maxima-minima/
+    python -m blog_anim.server ping
+    python -m blog_anim.server stop
+
+Every ``manim`` run, and every worker of blog_anim.render, first pays for
+``from manim import *``, font discovery, the LaTeX template and Cairo setup
+before ``construct`` starts; for the still bowl figures that is most of the
+wall time. The server does all of it once, then listens on a Unix socket.
+Each job gets a ``fork()`` of the warm process, so it starts with everything
+loaded, and a scene's module and the repo helpers are imported fresh in the
+worker, so edits are always picked up. Workers stream JSON events back to
+the client: when the scene starts, after every ``play`` and when its files
+are written. Results go through the same render cache as blog_anim.render.
+"""
+
+import argparse
+import hashlib
+import importlib
+import json
+import os
+import socket
+import sys
+import tempfile
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from . import REPO_ROOT
+from .discovery import find_scenes, select_scenes
+from .render import QUALITIES, STILL_FORMATS
+
+# One server per checkout; Unix socket paths are limited to ~100 characters
+DEFAULT_SOCKET = Path(tempfile.gettempdir()) / (
+    "blog-anim-" + hashlib.sha1(str(REPO_ROOT).encode()).hexdigest()[:10] + ".sock"
+)
+DEFAULT_LOG = REPO_ROOT / "media" / "render-server.log"
+
+# A client has this long to send its request line before it is dropped
+REQUEST_TIMEOUT = 5.0
+# How often the accept loop wakes up to reap finished workers when idle
+REAP_INTERVAL = 1.0
+
+
+def warm_up():
+    """Import and initialize what every render needs, once, before forking."""
+    from manim import Camera, Dot, Text, config
+
+    # Loaded only so that every worker inherits them already imported
+    for module in ("numpy", "sympy"):
+        importlib.import_module(module)
+
+    # Font discovery happens on the first Text, the template is parsed on
+    # first access, and the first frame sets up Cairo
+    Text("warm up")
+    config.tex_template.body
+    camera = Camera()
+    camera.capture_mobjects([Dot()])
+
+
+def _send(conn, **event):
+    conn.sendall((json.dumps(event) + "\n").encode())
+
+
+def _fresh_tooling():
+    # The server imported blog_anim's render tooling before forking; a job
+    # re-imports it so edits since the server started count
+    for name in list(sys.modules):
+        if name.startswith("blog_anim.") and name != __name__:
+            del sys.modules[name]
+
+
+def _store(media_dir, label, key, outputs, seconds):
+    """Record a render in the manifest; jobs finish concurrently, so under a lock."""
+    import fcntl
+
+    from .cache import MANIFEST_NAME, RenderCache
+
+    lock_path = Path(media_dir) / (MANIFEST_NAME + ".lock")
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        cache = RenderCache(media_dir)
+        cache.store(label, key, outputs, seconds)
+        cache.save()
+
+
+def run_job(conn, request):
+    """Render one scene in a forked worker and stream its progress over `conn`."""
+    _fresh_tooling()
+    from manim.renderer.cairo_renderer import CairoRenderer
+
+    from .cache import RenderCache, scene_key
+    from .discovery import scenes_in_file
+    from .render import RenderOptions, render_scene, scene_outputs
+
+    start = time.perf_counter()
+    scene = next(s for s in scenes_in_file(request["path"]) if s.name == request["name"])
+    still = request.get("still", scene.still)
+    options = request.get("options", {})
+    options = RenderOptions(**{**options, "overrides": tuple(map(tuple, options.get("overrides", ())))})
+    key = scene_key(scene, options.manim_config(scene.path, still))
+    label = options.cache_label(scene, still)
+    _send(conn, event="start", label=scene.label, estimate=scene.cost, pid=os.getpid())
+
+    if request.get("use_cache", True):
+        outputs = RenderCache(options.media_dir).lookup(label, key)
+        if outputs is not None:
+            _send(conn, event="done", label=scene.label, seconds=0.0, outputs=outputs, cached=True)
+            return
+
+    play = CairoRenderer.play
+
+    def reporting_play(renderer, *args, **kwargs):
+        play(renderer, *args, **kwargs)
+        _send(conn, event="play", label=scene.label, index=renderer.num_plays, time=round(renderer.time, 2))
+
+    # Only this worker's copy of the class is patched
+    CairoRenderer.play = reporting_play
+    outputs = scene_outputs(render_scene(scene.path, scene.name, options, still))
+    seconds = time.perf_counter() - start
+    _store(options.media_dir, label, key, outputs, seconds)
+    _send(conn, event="done", label=scene.label, seconds=round(seconds, 3), outputs=outputs, cached=False)
+
+
+def _handle(conn, listener, started):
+    """Serve one connection; returns False when the server should stop."""
+    conn.settimeout(REQUEST_TIMEOUT)
+    try:
+        request = json.loads(conn.makefile("r", encoding="utf-8").readline() or "{}")
+    except (OSError, ValueError):
+        # Timed out, disconnected or not JSON: drop it, keep serving
+        return True
+    conn.settimeout(None)
+    command = request.get("command")
+    if command == "ping":
+        _send(conn, event="pong", pid=os.getpid(), uptime=round(time.monotonic() - started, 1))
+        return True
+    if command == "stop":
+        _send(conn, event="stopping", pid=os.getpid())
+        return False
+    if command != "render":
+        _send(conn, event="error", error=f"unknown command {command!r}")
+        return True
+
+    if os.fork():
+        return True
+    # Worker: owns the connection from here on and never returns to the loop
+    listener.close()
+    code = 0
+    try:
+        run_job(conn, request)
+    except Exception:
+        _send(conn, event="error", label=f"{request.get('name')}", error=traceback.format_exc())
+        code = 1
+    finally:
+        conn.close()
+        os._exit(code)
+
+
+def _reap():
+    """Collect finished workers without blocking.
+
+    SIGCHLD is left at its default rather than ignored: an ignored SIGCHLD
+    is inherited by the workers and makes their own subprocess calls (ffmpeg,
+    latex) report exit status 0 whatever happened.
+    """
+    while True:
+        try:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            return
+        if not pid:
+            return
+
+
+def serve(socket_path=DEFAULT_SOCKET, log=print):
+    """Warm up, then accept jobs on `socket_path` until a stop request."""
+    start = time.perf_counter()
+    warm_up()
+    log(f"warmed up in {time.perf_counter() - start:.1f}s, listening on {socket_path}")
+
+    socket_path = Path(socket_path)
+    socket_path.unlink(missing_ok=True)
+    started = time.monotonic()
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as listener:
+        listener.bind(str(socket_path))
+        listener.listen()
+        listener.settimeout(REAP_INTERVAL)
+        try:
+            running = True
+            while running:
+                _reap()
+                try:
+                    conn, _ = listener.accept()
+                except socket.timeout:
+                    continue
+                with conn:
+                    running = _handle(conn, listener, started)
+        finally:
+            socket_path.unlink(missing_ok=True)
+
+
+def _detach(log_path):
+    """Daemonize: the caller returns in the parent, the server runs in a grandchild."""
+    if os.fork():
+        return False
+    os.setsid()
+    if os.fork():
+        os._exit(0)
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    log_file = open(log_path, "a", buffering=1)
+    os.dup2(log_file.fileno(), sys.stdout.fileno())
+    os.dup2(log_file.fileno(), sys.stderr.fileno())
+    return True
+
+
+def request(socket_path, message):
+    """Send one request and yield the events streamed back."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.connect(str(socket_path))
+        conn.sendall((json.dumps(message) + "\n").encode())
+        for line in conn.makefile("r", encoding="utf-8"):
+            yield json.loads(line)
+
+
+def _print_event(event):
+    kind = event["event"]
+    if kind == "start":
+        print(f"{'':8}  start   {event['label']} (~{event['estimate']:.0f}s of animation)", flush=True)
+    elif kind == "play":
+        print(f"{event['time']:7.1f}s  play {event['index']:<3} {event['label']}", flush=True)
+    elif kind == "done":
+        status = "cached" if event["cached"] else "ok"
+        print(f"{event['seconds']:8.1f}s  {status:6}  {event['label']}", flush=True)
+    elif kind == "error":
+        print(f"{'':8}  FAILED  {event.get('label', '')}\n{event['error']}", flush=True)
+    else:
+        print(json.dumps(event), flush=True)
+
+
+def submit(scenes, socket_path=DEFAULT_SOCKET, options=None, use_cache=True, still=None, jobs=None):
+    """Render `scenes` through the server, at most `jobs` at a time; True if all succeeded."""
+
+    def one(scene):
+        message = {
+            "command": "render",
+            "path": str(scene.path),
+            "name": scene.name,
+            "options": options or {},
+            "use_cache": use_cache,
+        }
+        if still is not None:
+            message["still"] = still
+        ok = False
+        for event in request(socket_path, message):
+            _print_event(event)
+            ok = event["event"] == "done"
+        return ok
+
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as pool:
+        return all(pool.map(one, scenes))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m blog_anim.server", description=__doc__.splitlines()[0])
+    parser.add_argument("--socket", type=Path, default=DEFAULT_SOCKET)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    start = commands.add_parser("start", help="run the server")
+    start.add_argument("--detach", action="store_true", help=f"run in the background, logging to {DEFAULT_LOG}")
+    commands.add_parser("stop", help="stop a running server")
+    commands.add_parser("ping", help="check that the server is up")
+
+    render = commands.add_parser("render", help="render scenes through the server")
+    render.add_argument("scenes", nargs="*", help="scene names, scene files or topic folders (default: all)")
+    render.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="l")
+    render.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="scenes at a time (default: all cores)")
+    render.add_argument("--media-dir", default=str(REPO_ROOT / "media"))
+    render.add_argument("--still", action="store_true", help="render the end state only, even of animations")
+    render.add_argument("--format", choices=STILL_FORMATS, default="png", help="still image format (default: png)")
+    render.add_argument("--force", action="store_true", help="re-render scenes even if they are cached")
+    args = parser.parse_args(argv)
+
+    if args.command == "start":
+        if args.detach and not _detach(DEFAULT_LOG):
+            print(f"render server starting in the background, log: {DEFAULT_LOG}")
+            return 0
+        serve(args.socket, log=lambda line: print(line, flush=True))
+        return 0
+
+    try:
+        if args.command in ("stop", "ping"):
+            for event in request(args.socket, {"command": args.command}):
+                print(json.dumps(event))
+            return 0
+
+        scenes = select_scenes(find_scenes(), args.scenes)
+        if not scenes:
+            parser.error(f"no scenes match {' '.join(args.scenes)}")
+        options = {"quality": args.quality, "media_dir": args.media_dir, "still_format": args.format}
+        ok = submit(
+            scenes, args.socket, options, use_cache=not args.force, still=True if args.still else None, jobs=args.jobs
+        )
+        return 0 if ok else 1
+    except (FileNotFoundError, ConnectionRefusedError):
+        print(f"no render server on {args.socket}; start one with `python -m blog_anim.server start --detach`")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+"""Render still figures, and batches of their variants, straight to images.
+
+    python -m blog_anim.stills                               # every still scene
+    python -m blog_anim.stills Maxima-minima/bowl_shapes.py  # one file, plus its VARIANTS
+    python -m blog_anim.stills --no-variants Maxima-minima/  # the scenes only
+    python -m blog_anim.stills --format svg SquareDerivative # an animation's end state, as SVG
+
+A still scene never plays or waits (or sets ``still = True``): its output is
+its last frame, written as a PNG with the movie writer off, so no partial
+movie files and no ffmpeg. ``blog_anim.render`` already renders still scenes
+that way; this tool renders only them, plus the function variants a scene
+file lists in a module-level ``VARIANTS``, all in one process pool. Each
+variant is a Scene class the file builds from a shared figure, e.g.
+``bowl_variant("ShiftedBowl", "(x - 1)**2 + 1", 1)``. Scenes named by class
+on the command line are rendered as stills even if they animate: the image
+is their end state. ``--format svg`` writes vector files instead of PNGs
+(2D scenes only, see blog_anim.svg_export).
+"""
+
+import argparse
+import ast
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import replace
+from multiprocessing import get_context
+
+from . import REPO_ROOT
+from .discovery import find_scenes, load_scene_module, select_scenes
+from .render import (
+    QUALITIES,
+    STILL_FORMATS,
+    RenderOptions,
+    RenderResult,
+    _log_result,
+    build_scene,
+    render_all,
+    scene_outputs,
+)
+
+
+def has_variants(path):
+    """Whether the scene file assigns a module-level VARIANTS."""
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    return any(
+        isinstance(node, ast.Assign)
+        and any(isinstance(target, ast.Name) and target.id == "VARIANTS" for target in node.targets)
+        for node in tree.body
+    )
+
+
+def variant_classes(module):
+    """The module's VARIANTS by class name."""
+    return {scene_cls.__name__: scene_cls for scene_cls in getattr(module, "VARIANTS", ())}
+
+
+def variant_names(path):
+    # Variants are built when the module runs, so listing them imports it
+    return list(variant_classes(load_scene_module(path)))
+
+
+def render_variant(path, name, options):
+    """Render the last frame of the variant `name` of the file at `path`."""
+    from manim import tempconfig
+
+    scene_cls = variant_classes(load_scene_module(path))[name]
+    with tempconfig(options.manim_config(path, still=True)):
+        scene = build_scene(scene_cls, options, still=True)
+        scene.render()
+    return scene
+
+
+def _variant_job(path, name, options):
+    label = f"{path.parent.name}/{path.name}:{name}"
+    start = time.perf_counter()
+    try:
+        outputs = scene_outputs(render_variant(path, name, options))
+    except Exception:
+        return RenderResult(label, time.perf_counter() - start, error=traceback.format_exc())
+    return RenderResult(label, time.perf_counter() - start, outputs)
+
+
+def render_variants(paths, options, jobs=None, log=print):
+    """Render every variant of the files in `paths` in a process pool.
+
+    Variants are not cached: they are cheap, and their source is the code
+    that builds them rather than a class body the render cache can hash.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    pending = [(path, name) for path in paths for name in variant_names(path)]
+    results = []
+    if not pending:
+        return results
+    # Spawned like blog_anim.render's workers: manim's config is global state
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(pending)),
+        mp_context=get_context("spawn"),
+        max_tasks_per_child=1,
+    ) as pool:
+        futures = [pool.submit(_variant_job, path, name, options) for path, name in pending]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            _log_result(result, log)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m blog_anim.stills", description=__doc__.splitlines()[0])
+    parser.add_argument("scenes", nargs="*", help="scene names, scene files or topic folders (default: all)")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="l")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="worker processes (default: all cores)")
+    parser.add_argument("--media-dir", default=str(REPO_ROOT / "media"))
+    parser.add_argument("--format", choices=STILL_FORMATS, default="png", help="image format (default: png)")
+    parser.add_argument("--no-variants", action="store_true", help="skip the VARIANTS of the selected files")
+    parser.add_argument("--force", action="store_true", help="re-render scenes even if they are cached")
+    args = parser.parse_args(argv)
+
+    scenes = [
+        scene for scene in select_scenes(find_scenes(), args.scenes)
+        if scene.still or scene.name in args.scenes
+    ]
+    if not scenes:
+        parser.error(f"no still scenes match {' '.join(args.scenes)}")
+    if args.format == "svg" and any(scene.is_3d for scene in scenes):
+        parser.error("SVG export only supports 2D scenes")
+
+    options = RenderOptions(quality=args.quality, media_dir=args.media_dir, still_format=args.format)
+    # Named animated scenes render their end state like any still
+    scenes = [replace(scene, still=True) for scene in scenes]
+    results = render_all(scenes, options, jobs=args.jobs, use_cache=not args.force)
+    if not args.no_variants:
+        paths = [path for path in dict.fromkeys(scene.path for scene in scenes) if has_variants(path)]
+        results += render_variants(paths, options, jobs=args.jobs)
+    return 1 if any(r.error for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
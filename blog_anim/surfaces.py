@@ -0,0 +1,285 @@
+"""Surfaces built from one NumPy evaluation of the whole grid.
+
+``Surface`` lays its faces out in uv space and then maps every Bezier point
+through the Python function with ``np.apply_along_axis``, one ``axes.c2p``
+call per point, and sets the checkerboard colour face by face. Here the
+function receives 2D arrays of u and v, the anchors and tangent handles of
+every face come from a handful of whole-grid evaluations, and faces are
+cloned from a styled template per checkerboard colour. The result is an ordinary
+``Surface`` (same faces, ``u_index``/``v_index``, fills and strokes), so
+Create, ``set_fill_by_checkerboard`` and the 3D camera treat it as before.
+``AdaptiveSurface`` spends its faces where the surface bends instead of on
+a fixed grid, for scenes where the camera depth-sorts every face per frame.
+
+    surface = graph_surface(axes, lambda x, y: x**2 - y**2,
+                            u_range=[-2.5, 2.5], v_range=[-2.5, 2.5],
+                            resolution=(200, 200))
+"""
+
+import copy
+import heapq
+import math
+from collections import defaultdict
+
+import numpy as np
+from manim import Surface, ThreeDVMobject, config
+
+from .coords import coords_to_points
+from .polyline import corners_to_bezier
+
+
+def _cloner(template):
+    """A fast factory of copies of a childless mobject.
+
+    A deepcopy per face costs more than building it; a shallow copy with its
+    own arrays and lists is all a face with no submobjects needs.
+    """
+    mutable = [
+        name for name, value in vars(template).items()
+        if isinstance(value, (np.ndarray, list, dict))
+    ]
+
+    def clone():
+        face = copy.copy(template)
+        for name in mutable:
+            value = getattr(template, name)
+            setattr(face, name, value.copy())
+        return face
+
+    return clone
+
+
+class VectorizedSurface(Surface):
+    """A Surface whose `func(U, V)` maps arrays of parameters to points.
+
+    `func` gets 2D arrays of u and v and returns points of shape
+    ``U.shape + (3,)``; it must also work on scalars, which is what
+    ``Surface.func`` and ``set_fill_by_value`` pass it.
+    """
+
+    def __init__(self, func, u_range=[0, 1], v_range=[0, 1], resolution=32, **kwargs):
+        # Surface.__init__ maps the uv layout through func point by point
+        # right after _setup_in_uv_space; the faces built below are already
+        # in scene space, so that one call is skipped
+        self._skip_uv_mapping = True
+        super().__init__(func, u_range=u_range, v_range=v_range, resolution=resolution, **kwargs)
+
+    def apply_function(self, function, **kwargs):
+        if self._skip_uv_mapping:
+            self._skip_uv_mapping = False
+            return self
+        return super().apply_function(function, **kwargs)
+
+    def _setup_in_uv_space(self):
+        u_values, v_values = self._get_u_values_and_v_values()
+        num_u, num_v = len(u_values) - 1, len(v_values) - 1
+
+        face_points = self._face_points(u_values, v_values).reshape(num_u * num_v, 16, 3)
+        # u-major like Surface, so face k is (k // num_v, k % num_v)
+        self._add_faces(
+            (points, i, j, u_values[i], u_values[i + 1], v_values[j], v_values[j + 1])
+            for (i, j), points in zip(np.ndindex(num_u, num_v), face_points)
+        )
+
+    def _add_faces(self, patches):
+        """Add one face per (points, u_index, v_index, u1, u2, v1, v2)."""
+        template = ThreeDVMobject()
+        template.set_fill(color=self.fill_color, opacity=self.fill_opacity)
+        template.set_stroke(color=self.stroke_color, width=self.stroke_width, opacity=self.stroke_opacity)
+        colors = self.checkerboard_colors or [self.fill_color]
+        clones = [_cloner(template.copy().set_fill(color)) for color in colors]
+
+        faces = []
+        for points, u_index, v_index, u1, u2, v1, v2 in patches:
+            face = clones[(u_index + v_index) % len(clones)]()
+            face.points = points
+            face.u_index, face.v_index = u_index, v_index
+            face.u1, face.u2, face.v1, face.v2 = u1, u2, v1, v2
+            faces.append(face)
+        self.add(*faces)
+
+    def _face_points(self, u_values, v_values):
+        """Bezier points of every face, shape (num_u, num_v, 16, 3).
+
+        Each face is the loop (u1,v1) -> (u2,v1) -> (u2,v2) -> (u1,v2) of four
+        cubics. Like VMobject.apply_function, a handle is its anchor plus
+        the image of the uv handle offset pulled in by a small factor and
+        scaled back out, so handles follow the surface's tangents.
+        """
+        func = self._func
+        factor = self.pre_function_handle_to_anchor_scale_factor
+        u, v = np.meshgrid(u_values, v_values, indexing="ij")
+        anchors = np.broadcast_to(np.asarray(func(u, v), dtype=float), u.shape + (3,))
+
+        # Handles sit a third of a cell away from their anchor in uv space
+        du = np.diff(u_values)[:, None] / 3
+        dv = np.diff(v_values)[None, :] / 3
+        lo, hi = slice(0, -1), slice(1, None)
+
+        def handle(rows, cols, step_u, step_v):
+            base = anchors[rows, cols]
+            shifted = func(u[rows, cols] + factor * step_u, v[rows, cols] + factor * step_v)
+            return base + (np.asarray(shifted, dtype=float) - base) / factor
+
+        return np.stack([
+            anchors[lo, lo], handle(lo, lo, du, 0), handle(hi, lo, -du, 0), anchors[hi, lo],
+            anchors[hi, lo], handle(hi, lo, 0, dv), handle(hi, hi, 0, -dv), anchors[hi, hi],
+            anchors[hi, hi], handle(hi, hi, -du, 0), handle(lo, hi, du, 0), anchors[lo, hi],
+            anchors[lo, hi], handle(lo, hi, 0, -dv), handle(lo, lo, 0, dv), anchors[lo, lo],
+        ], axis=2)
+
+
+# Relative difference under which two leaves' deviations count as one level
+TIE_TOLERANCE = 0.05
+
+
+class AdaptiveSurface(VectorizedSurface):
+    """A VectorizedSurface tessellated finer only where it bends.
+
+    `resolution` is the root grid, which also sets the checkerboard: every
+    face keeps the ``u_index``/``v_index`` of its root cell. Root cells are
+    split as quadtrees up to `max_depth` times, worst first, by how far a
+    leaf's centre and edge midpoints stray from the bilinear patch through
+    its corners, until that deviation is under `tolerance` pixels or the
+    next split would exceed `face_budget`. Deviations are measured in
+    scene units, which bound their projection under any camera rotation,
+    and converted to pixels at the camera's `zoom`; leaves that would
+    project smaller than `min_face_pixels` across are not split.
+
+    Leaves within `TIE_TOLERANCE` of the worst deviation are split as one
+    batch or not at all, so the budget cuts between error levels and never
+    through one level in heap order. A surface of constant curvature (any
+    quadratic) has one error level per depth and refines uniformly; a
+    plain VectorizedSurface at the same grid is the better fit there.
+
+    Faces are straight-edged polygons through their corners plus every
+    corner of a finer neighbour lying on their edges, so neighbours of
+    different depths share one boundary and leave no cracks.
+    """
+
+    def __init__(
+        self,
+        func,
+        u_range=[0, 1],
+        v_range=[0, 1],
+        resolution=8,
+        max_depth=3,
+        face_budget=None,
+        tolerance=0.5,
+        zoom=1.0,
+        min_face_pixels=4,
+        **kwargs,
+    ):
+        self.max_depth = max_depth
+        self.face_budget = face_budget
+        self.tolerance = tolerance
+        self.zoom = zoom
+        self.min_face_pixels = min_face_pixels
+        super().__init__(func, u_range=u_range, v_range=v_range, resolution=resolution, **kwargs)
+
+    def _setup_in_uv_space(self):
+        u_values, v_values = self._get_u_values_and_v_values()
+        root_size = 2 ** self.max_depth
+        leaves = self._leaves(len(u_values) - 1, len(v_values) - 1, root_size)
+
+        # Leaf corners by lattice line, to find T-junctions on each edge
+        on_row, on_col = defaultdict(set), defaultdict(set)
+        for i, j, size in leaves:
+            for u, v in ((i, j), (i + size, j), (i, j + size), (i + size, j + size)):
+                on_row[v].add(u)
+                on_col[u].add(v)
+        on_row = {v: np.array(sorted(us)) for v, us in on_row.items()}
+        on_col = {u: np.array(sorted(vs)) for u, vs in on_col.items()}
+
+        def inside(line, low, high):
+            return line[np.searchsorted(line, low, "right"):np.searchsorted(line, high, "left")]
+
+        samples = self._samples
+        patches = []
+        for i, j, size in leaves:
+            i2, j2 = i + size, j + size
+            # Counter-clockwise in uv like Surface, with T-junctions on the way
+            bottom = inside(on_row[j], i, i2)
+            right = inside(on_col[i2], j, j2)
+            top = inside(on_row[j2], i, i2)[::-1]
+            left = inside(on_col[i], j, j2)[::-1]
+            us = np.concatenate([
+                [i], bottom, [i2], np.full(len(right), i2),
+                [i2], top, [i], np.full(len(left), i), [i],
+            ]).astype(int)
+            vs = np.concatenate([
+                [j], np.full(len(bottom), j), [j], right,
+                [j2], np.full(len(top), j2), [j2], left, [j],
+            ]).astype(int)
+            patches.append((
+                corners_to_bezier(samples[2 * us, 2 * vs]),
+                i // root_size, j // root_size,
+                self._u_lattice[2 * i], self._u_lattice[2 * i2],
+                self._v_lattice[2 * j], self._v_lattice[2 * j2],
+            ))
+        self._add_faces(patches)
+
+    def _leaves(self, roots_u, roots_v, root_size):
+        """Quadtree leaves as (i, j, size) in units of the finest cell."""
+        # Sampled at half the finest cell, so every possible leaf has its
+        # corners, edge midpoints and centre on the lattice
+        self._u_lattice = np.linspace(*self.u_range, 2 * roots_u * root_size + 1)
+        self._v_lattice = np.linspace(*self.v_range, 2 * roots_v * root_size + 1)
+        u, v = np.meshgrid(self._u_lattice, self._v_lattice, indexing="ij")
+        samples = np.broadcast_to(np.asarray(self._func(u, v), dtype=float), u.shape + (3,))
+        self._samples = samples
+        pixels_per_unit = config.pixel_width / config.frame_width * self.zoom
+
+        def entry(i, j, size):
+            # Negated pixel deviation, so the heap pops the worst leaf first
+            rows = 2 * i + np.array([0, size, 2 * size])
+            cols = 2 * j + np.array([0, size, 2 * size])
+            patch = samples[np.ix_(rows, cols)]
+            corners = patch[::2, ::2]
+            diagonal = np.linalg.norm(corners[1, 1] - corners[0, 0]) * pixels_per_unit
+            if size == 1 or diagonal / 2 < self.min_face_pixels:
+                return (0.0, i, j, size)
+            bilinear = np.empty_like(patch)
+            bilinear[::2, ::2] = corners
+            bilinear[1, ::2] = corners.mean(axis=0)
+            bilinear[::2, 1] = corners.mean(axis=1)
+            bilinear[1, 1] = corners.mean(axis=(0, 1))
+            deviation = np.linalg.norm(patch - bilinear, axis=-1).max() * pixels_per_unit
+            return (-deviation, i, j, size)
+
+        heap = [
+            entry(ri * root_size, rj * root_size, root_size)
+            for ri, rj in np.ndindex(roots_u, roots_v)
+        ]
+        heapq.heapify(heap)
+        budget = self.face_budget or math.inf
+        count = len(heap)
+        while heap and -heap[0][0] > self.tolerance:
+            floor = max(-heap[0][0] * (1 - TIE_TOLERANCE), self.tolerance)
+            batch = []
+            while heap and -heap[0][0] >= floor:
+                batch.append(heapq.heappop(heap))
+            if count + 3 * len(batch) > budget:
+                heap.extend(batch)
+                break
+            for _, i, j, size in batch:
+                half = size // 2
+                for ci, cj in ((i, j), (i + half, j), (i, j + half), (i + half, j + half)):
+                    heapq.heappush(heap, entry(ci, cj, half))
+            count += 3 * len(batch)
+        return sorted((i, j, size) for _, i, j, size in heap)
+
+
+def graph_surface(axes, func, u_range, v_range, adaptive=False, **kwargs):
+    """The graph z = func(x, y) over `axes`, with `func` vectorized over arrays.
+
+    `adaptive` builds an AdaptiveSurface, which takes its extra keyword
+    arguments (max_depth, face_budget, tolerance, zoom, ...).
+    """
+    surface_class = AdaptiveSurface if adaptive else VectorizedSurface
+    return surface_class(
+        lambda x, y: coords_to_points(axes, x, y, func(x, y)),
+        u_range=u_range,
+        v_range=v_range,
+        **kwargs,
+    )
@@ -0,0 +1,312 @@
+"""Write the final state of a 2D scene as an SVG, without rasterizing.
+
+The blog figures are vector paths all the way down, but the Cairo camera
+turns them into pixels, and a still of the end state is just one more PNG.
+``SVGRenderer`` plays a scene with every animation skipped and no frame ever
+drawn, then serializes the mobjects on screen at the end: each VMobject
+becomes a ``<path>`` with its fill and stroke, in the camera's drawing order
+and pixel coordinates. Outlines that repeat up to position and size (the
+glyphs of Text and MathTex, an axis's tick marks, same-sized dots) are
+written once under ``<defs>`` and placed with ``<use>``, so every "x" in a
+figure shares one definition. Straight segments are written as lines rather
+than cubic curves.
+
+    python -m blog_anim.stills --format svg                   # still scenes as SVG
+    python -m blog_anim.stills --format svg SquareDerivative  # an animated scene's end state
+"""
+
+import math
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+from manim import PMobject, VMobject, config
+from manim.constants import CapStyleType, LineJointType
+from manim.mobject.types.image_mobject import AbstractImageMobject
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils.iterables import list_update
+
+JOINTS = {LineJointType.ROUND: "round", LineJointType.BEVEL: "bevel", LineJointType.MITER: "miter"}
+CAPS = {CapStyleType.ROUND: "round", CapStyleType.BUTT: "butt", CapStyleType.SQUARE: "square"}
+
+# Shapes are compared after scaling to a unit box, to this many decimals
+SHAPE_DECIMALS = 3
+
+
+def _format(value, decimals):
+    text = f"{value:.{decimals}f}".rstrip("0").rstrip(".")
+    return "0" if text in ("", "-0") else text
+
+
+def _hex(rgba):
+    return "#" + "".join(f"{round(float(c) * 255):02x}" for c in rgba[:3])
+
+
+def _is_straight(curve, tol):
+    """Whether a cubic's handles lie on the chord between its anchors."""
+    p0, p1, p2, p3 = curve
+    chord = p3 - p0
+    length = math.hypot(*chord)
+    if length < tol:
+        return np.all(np.abs(curve - p0) < tol)
+    for handle in (p1, p2):
+        offset = handle - p0
+        if abs(chord[0] * offset[1] - chord[1] * offset[0]) / length > tol:
+            return False
+        if not -tol <= (chord @ offset) / length <= length + tol:
+            return False
+    return True
+
+
+def path_data(subpaths, decimals):
+    """SVG path data for subpaths of cubic Bézier points, each (4k, 2) plus a closed flag."""
+    tol = 0.5 * 10 ** -decimals
+    parts = []
+    for points, closed in subpaths:
+        fmt = [_format(v, decimals) for v in points.ravel()]
+        parts.append(f"M{fmt[0]} {fmt[1]}")
+        command = None
+        for k, curve in enumerate(points.reshape(-1, 4, 2)):
+            base = 8 * k
+            if _is_straight(curve, tol):
+                coords = fmt[base + 6:base + 8]
+                letter = "L"
+            else:
+                coords = fmt[base + 2:base + 8]
+                letter = "C"
+            parts.append((letter if letter != command else " ") + " ".join(coords))
+            command = letter
+        if closed:
+            parts.append("Z")
+    return "".join(parts)
+
+
+class _Shape:
+    """One VMobject's outline in pixels, and where it sits: `origin` and `size`."""
+
+    def __init__(self, subpaths):
+        corners = np.concatenate([points for points, _ in subpaths])
+        self.origin = corners.min(axis=0)
+        self.size = float(np.ptp(corners, axis=0).max()) or 1.0
+        self.subpaths = subpaths
+        unit = [(np.round((points - self.origin) / self.size, SHAPE_DECIMALS), closed) for points, closed in subpaths]
+        self.key = tuple((points.tobytes(), len(points), closed) for points, closed in unit)
+
+
+class SVGBuilder:
+    """Collects the paths of a scene's final frame and writes them as one SVG document.
+
+    `decimals` is the precision of coordinates in pixels.
+    """
+
+    def __init__(self, camera, decimals=2):
+        self.camera = camera
+        self.decimals = decimals
+        self.width = config.pixel_width
+        self.height = config.pixel_height
+        self.scale = (self.width / camera.frame_width, self.height / camera.frame_height)
+        self.items = []
+        self.gradients = []
+
+    def to_pixels(self, points):
+        center = self.camera.frame_center
+        points = np.asarray(points)
+        x = (points[:, 0] - center[0]) * self.scale[0] + self.width / 2
+        y = self.height / 2 - (points[:, 1] - center[1]) * self.scale[1]
+        return np.column_stack([x, y])
+
+    def _paint(self, rgbas, vmobject):
+        """A color, or a reference to a linear gradient like the camera's."""
+        if len(rgbas) == 1:
+            return _hex(rgbas[0]), float(rgbas[0][3])
+        start, end = self.to_pixels(
+            self.camera.transform_points_pre_display(vmobject, vmobject.get_gradient_start_and_end_points())
+        )
+        stops = "".join(
+            f'<stop offset="{_format(offset, 3)}" stop-color="{_hex(rgba)}"'
+            + (f' stop-opacity="{_format(rgba[3], 3)}"' if rgba[3] < 1 else "")
+            + "/>"
+            for offset, rgba in zip(np.linspace(0, 1, len(rgbas)), rgbas)
+        )
+        ident = f"gr{len(self.gradients)}"
+        x1, y1, x2, y2 = (_format(v, self.decimals) for v in (*start, *end))
+        self.gradients.append(
+            f'<linearGradient id="{ident}" gradientUnits="userSpaceOnUse" '
+            f'x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}">{stops}</linearGradient>'
+        )
+        return f"url(#{ident})", 1.0
+
+    def _stroke_style(self, vmobject, background=False):
+        width = vmobject.get_stroke_width(background)
+        rgbas = self.camera.get_stroke_rgbas(vmobject, background=background)
+        if width == 0 or not np.any(rgbas[:, 3] > 0):
+            return None
+        paint, opacity = self._paint(rgbas, vmobject)
+        style = {
+            "stroke": paint,
+            "stroke-width": width * self.camera.cairo_line_width_multiple * self.scale[0],
+        }
+        if opacity < 1:
+            style["stroke-opacity"] = opacity
+        if vmobject.joint_type in JOINTS:
+            style["stroke-linejoin"] = JOINTS[vmobject.joint_type]
+        if vmobject.cap_style in CAPS:
+            style["stroke-linecap"] = CAPS[vmobject.cap_style]
+        return style
+
+    def add(self, vmobject):
+        if isinstance(vmobject, (PMobject, AbstractImageMobject)):
+            raise TypeError(f"{type(vmobject).__name__} has no vector form; only VMobjects can be exported to SVG")
+        if not isinstance(vmobject, VMobject):
+            # Plain Mobjects such as a ValueTracker draw nothing, as in Camera.display_funcs
+            return
+        points = self.camera.transform_points_pre_display(vmobject, vmobject.points)
+        subpaths = [
+            (self.to_pixels(subpath), vmobject.consider_points_equals_2d(subpath[0], subpath[-1]))
+            for subpath in vmobject.gen_subpaths_from_points_2d(points)
+            if len(subpath) >= vmobject.n_points_per_cubic_curve
+        ]
+        if not subpaths:
+            return
+
+        fill_rgbas = self.camera.get_fill_rgbas(vmobject)
+        fill = self._paint(fill_rgbas, vmobject) if np.any(fill_rgbas[:, 3] > 0) else None
+        # Drawn like Camera.display_vectorized: background stroke, fill, stroke
+        background = self._stroke_style(vmobject, background=True)
+        stroke = self._stroke_style(vmobject)
+        shape = _Shape(subpaths)
+        if background:
+            self.items.append((shape, {"fill": "none", **background}))
+        if fill or stroke:
+            style = {"fill": fill[0] if fill else "none"}
+            if fill and fill[1] < 1:
+                style["fill-opacity"] = fill[1]
+            self.items.append((shape, {**style, **(stroke or {})}))
+
+    def _attributes(self, style, scale=1.0):
+        """Style attributes; `scale` is the transform of a <use>, which also scales its stroke."""
+        out = []
+        for name, value in style.items():
+            if name == "stroke-width":
+                value = _format(value / scale, self.decimals + max(0, math.ceil(math.log10(scale))))
+            elif isinstance(value, float):
+                value = _format(value, 3)
+            out.append(f'{name}="{value}"')
+        return " ".join(out)
+
+    def document(self):
+        """The SVG text of everything added so far."""
+        # Gradients are positioned in scene space, so those paths stay inline
+        counts = Counter(
+            shape.key
+            for shape, style in self.items
+            if not any(str(value).startswith("url(") for value in style.values())
+        )
+        definitions = {}
+        defs = list(self.gradients)
+        body = []
+        for shape, style in self.items:
+            if counts[shape.key] < 2:
+                body.append(f'<path d="{path_data(shape.subpaths, self.decimals)}" {self._attributes(style)}/>')
+                continue
+            if shape.key not in definitions:
+                ident = definitions[shape.key] = f"p{len(definitions)}"
+                # The unit-box outline, precise enough for the largest instance
+                decimals = self.decimals + max(0, math.ceil(math.log10(shape.size)))
+                unit = [((points - shape.origin) / shape.size, closed) for points, closed in shape.subpaths]
+                defs.append(f'<path id="{ident}" d="{path_data(unit, decimals)}"/>')
+            x, y = (_format(v, self.decimals) for v in shape.origin)
+            size = _format(shape.size, self.decimals + 2)
+            body.append(
+                f'<use href="#{definitions[shape.key]}" transform="translate({x} {y}) scale({size})" '
+                f"{self._attributes(style, shape.size)}/>"
+            )
+
+        background = ""
+        if self.camera.background_opacity > 0:
+            opacity = self.camera.background_opacity
+            background = f'<rect width="100%" height="100%" fill="{_hex(self.camera.background_color.to_rgb())}"' + (
+                f' fill-opacity="{_format(opacity, 3)}"/>' if opacity < 1 else "/>"
+            )
+        return "".join([
+            f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {self.width} {self.height}" '
+            f'width="{self.width}" height="{self.height}" stroke-miterlimit="10">',
+            f"<defs>{''.join(defs)}</defs>" if defs else "",
+            background,
+            *body,
+            "</svg>\n",
+        ])
+
+
+def scene_to_svg(scene, camera=None, decimals=2):
+    """SVG text of what `scene` shows now, as its camera would draw it."""
+    camera = camera or scene.renderer.camera
+    builder = SVGBuilder(camera, decimals)
+    for mobject in camera.get_mobjects_to_display(list_update(scene.mobjects, scene.foreground_mobjects)):
+        builder.add(mobject)
+    return builder.document()
+
+
+class SVGFileWriter(SceneFileWriter):
+    """Writes nothing but ``<images_dir>/<Scene>.svg``."""
+
+    def init_output_directories(self, scene_name):
+        super().init_output_directories(scene_name)
+        image_path = getattr(self, "image_file_path", None)
+        self.svg_file_path = Path(image_path).with_suffix(".svg") if image_path else None
+
+    def save_svg(self, text):
+        if config["dry_run"] or self.svg_file_path is None:
+            return
+        self.svg_file_path.write_text(text, encoding="utf-8")
+        self.print_file_ready_message(self.svg_file_path)
+
+
+class FastForwardRenderer(CairoRenderer):
+    """Runs a scene to its end with every animation skipped and no frame drawn.
+
+    Pass it to the scene, e.g. ``SceneClass(renderer=FastForwardRenderer())``,
+    under a config with ``write_to_movie`` off.
+    """
+
+    def __init__(self, camera_class=None, **kwargs):
+        super().__init__(camera_class=camera_class, skip_animations=True, **kwargs)
+        self._default_camera = camera_class is None
+
+    def init_scene(self, scene):
+        # The camera the scene asked Scene.__init__ for (ThreeDScene's,
+        # OrbitMixin's, ...) unless one was passed in
+        if self._default_camera:
+            self.camera = scene.camera_class()
+        super().init_scene(scene)
+
+    # Skipped plays still refresh the static frame and draw the scene once
+    # per wait in CairoRenderer; nothing is ever rasterized here
+    def update_frame(self, scene, mobjects=None, include_submobjects=True, ignore_skipping=True, **kwargs):
+        pass
+
+    def render(self, scene, time, moving_mobjects):
+        pass
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        self.static_image = None
+        return None
+
+    def freeze_current_frame(self, duration):
+        pass
+
+    def scene_finished(self, scene):
+        pass
+
+
+class SVGRenderer(FastForwardRenderer):
+    """Fast-forwards a scene and saves its end state as SVG. Only 2D scenes are supported."""
+
+    def __init__(self, decimals=2, **kwargs):
+        kwargs.setdefault("file_writer_class", SVGFileWriter)
+        super().__init__(**kwargs)
+        self.decimals = decimals
+
+    def scene_finished(self, scene):
+        self.file_writer.save_svg(scene_to_svg(scene, self.camera, self.decimals))
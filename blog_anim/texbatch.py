@@ -0,0 +1,317 @@
+"""Typeset every LaTeX expression of a set of scenes in a few batched runs.
+
+On a cold tex cache every MathTex (and every axis number, DecimalNumber, ...)
+costs its own latex run and its own dvisvgm run, one after the other inside
+the scene's process. The pre-pass here first fast-forwards each scene (every
+animation skipped, no frame drawn) with LaTeX swapped for placeholder glyphs,
+which records each expression the scene asks for. Expressions that share a
+preamble are then typeset together as the pages of one standalone document
+per chunk, chunks in parallel, and dvisvgm splits each document into one SVG
+per page, saved under the name manim gives that expression in the tex
+folder. When the scenes render for real, all their LaTeX is cached.
+
+    python -m blog_anim.texbatch                 # every scene
+    python -m blog_anim.texbatch Maxima-minima/  # one folder
+
+blog_anim.render runs the pre-pass by itself for scenes it has not rendered
+before.
+"""
+
+import argparse
+import hashlib
+import math
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from multiprocessing import get_context
+from pathlib import Path
+
+from .cache import module_dependencies
+from .discovery import find_scenes, load_scene_module, select_scenes
+
+# Scene sources that can reach LaTeX; other scenes are not fast-forwarded
+TEX_HINTS = re.compile(r"\b(MathTex|Tex|Axes|NumberLine|NumberPlane|DecimalNumber|Integer|Variable|BarChart)\b")
+
+# Each expression is one of these environments, one page of the batch
+PAGE_ENVIRONMENT = "texbatchpage"
+STANDALONE_CLASS = re.compile(r"\\documentclass\[([^\]]*)\]\{standalone\}")
+
+# Rounds of compile-and-record for a scene whose fast-forward trips over a
+# placeholder (e.g. indexes the glyphs of an expression)
+MAX_ROUNDS = 3
+
+
+@dataclass(frozen=True)
+class TexJob:
+    """One expression's full .tex source and the SVG manim will look for."""
+
+    svg_path: str
+    tex_code: str
+    compiler: str
+    output_format: str
+
+    @property
+    def preamble(self):
+        return self.tex_code.split(r"\begin{document}", 1)[0]
+
+    @property
+    def body(self):
+        return self.tex_code.split(r"\begin{document}", 1)[1].rsplit(r"\end{document}", 1)[0]
+
+
+def uses_tex(path):
+    """Whether the scene file or a repo module it imports mentions a LaTeX mobject."""
+    return any(
+        TEX_HINTS.search(source.read_text(encoding="utf-8"))
+        for source in (Path(path), *module_dependencies(path))
+    )
+
+
+_placeholder_dir = None
+
+
+def _placeholder(expression):
+    """An SVG of one box per (roughly) typeset glyph of `expression`."""
+    global _placeholder_dir
+    if _placeholder_dir is None:
+        _placeholder_dir = Path(tempfile.mkdtemp(prefix="texbatch-"))
+    glyphs = max(1, len(re.findall(r"\\[A-Za-z]+|[^\s{}^_&\\]", expression)))
+    path = _placeholder_dir / f"{glyphs}.svg"
+    if not path.exists():
+        boxes = "".join(f'<path d="M{10 * k} 0h8v10h-8z"/>' for k in range(glyphs))
+        path.write_text(f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {10 * glyphs} 10">{boxes}</svg>')
+    return path
+
+
+def record_tex(scene_cls):
+    """Fast-forward `scene_cls` and return (TexJobs it needs, whether it ran to the end).
+
+    Call inside the scene's tempconfig. Expressions whose SVG is already in
+    the tex folder are not returned.
+    """
+    import manim.mobject.text.tex_mobject as tex_mobject
+    from manim import config
+    from manim.utils.tex_file_writing import tex_hash
+
+    from .svg_export import FastForwardRenderer
+
+    jobs = {}
+
+    def tex_to_svg_file(expression, environment=None, tex_template=None):
+        template = tex_template or config["tex_template"]
+        if environment is not None:
+            tex_code = template.get_texcode_for_expression_in_env(expression, environment)
+        else:
+            tex_code = template.get_texcode_for_expression(expression)
+        svg_path = config.get_dir("tex_dir") / (tex_hash(tex_code) + ".svg")
+        if svg_path.exists():
+            return svg_path
+        jobs[svg_path] = TexJob(str(svg_path), tex_code, template.tex_compiler, template.output_format)
+        return _placeholder(expression)
+
+    real = tex_mobject.tex_to_svg_file
+    tex_mobject.tex_to_svg_file = tex_to_svg_file
+    try:
+        scene = scene_cls(renderer=FastForwardRenderer())
+        scene.render()
+        finished = True
+    except Exception:
+        finished = False
+    finally:
+        tex_mobject.tex_to_svg_file = real
+    return list(jobs.values()), finished
+
+
+def scene_tex_jobs(path, name, options):
+    """Every uncached expression of one scene.
+
+    A fast-forward that fails on a placeholder is retried after compiling
+    what it recorded so far, so the expressions after the failure are found.
+    """
+    from manim import tempconfig
+
+    scene_cls = getattr(load_scene_module(path), name)
+    overrides = {**options.manim_config(path), "dry_run": True, "write_to_movie": False, "save_last_frame": False}
+    found = []
+    with tempconfig(overrides):
+        for _ in range(MAX_ROUNDS):
+            jobs, finished = record_tex(scene_cls)
+            if finished or not jobs:
+                return found + jobs
+            compile_jobs(jobs, workers=1)
+            found += jobs
+    return found
+
+
+def _collect_job(scene, options):
+    # Runs in a worker process, like blog_anim.render's jobs
+    try:
+        return scene.label, scene_tex_jobs(scene.path, scene.name, options), ""
+    except Exception:
+        return scene.label, [], traceback.format_exc()
+
+
+def _run(command, cwd):
+    return subprocess.run(command, cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode == 0
+
+
+def _typeset(tex_file, compiler, output_format, page_pattern):
+    """latex then dvisvgm on `tex_file`; the SVG pages produced, in order."""
+    from manim.utils.tex_file_writing import make_tex_compilation_command
+
+    tex_dir = tex_file.parent
+    if not _run(make_tex_compilation_command(compiler, output_format, tex_file, tex_dir), tex_dir):
+        return []
+    command = [
+        "dvisvgm",
+        *(["--pdf"] if output_format == ".pdf" else []),
+        "--page=1-",
+        "--no-fonts",
+        "--verbosity=0",
+        f"--output={page_pattern}",
+        tex_file.with_suffix(output_format).as_posix(),
+    ]
+    _run(command, tex_dir)
+    stem = Path(page_pattern.replace("%p", "")).stem
+    pages = sorted(tex_dir.glob(f"{stem}*.svg"), key=lambda p: int(p.stem[len(stem):] or 0))
+    return pages
+
+
+def _cleanup(tex_file):
+    # Keeps what manim keeps after its own runs
+    for leftover in tex_file.parent.glob(tex_file.stem + ".*"):
+        if leftover.suffix not in (".svg", ".tex"):
+            leftover.unlink(missing_ok=True)
+
+
+def _compile_one(job):
+    """Typeset one expression on its own, as manim would."""
+    svg_path = Path(job.svg_path)
+    tex_file = svg_path.with_suffix(".tex")
+    tex_file.write_text(job.tex_code, encoding="utf-8")
+    pages = _typeset(tex_file, job.compiler, job.output_format, f"{svg_path.stem}-%p.svg")
+    if pages:
+        pages[0].replace(svg_path)
+    for extra in pages[1:]:
+        extra.unlink(missing_ok=True)
+    return svg_path.exists()
+
+
+def compile_chunk(jobs):
+    """Typeset jobs sharing one preamble as pages of one document; returns how many failed.
+
+    Templates that are not a standalone class, and chunks whose batch run
+    fails or yields the wrong number of pages, fall back to one run per
+    expression, so a bad expression fails on its own (and manim reports it
+    properly when the scene renders).
+    """
+    first = jobs[0]
+    Path(first.svg_path).parent.mkdir(parents=True, exist_ok=True)
+    match = STANDALONE_CLASS.search(first.preamble)
+    if match and len(jobs) > 1:
+        options = ",".join(filter(None, [match.group(1), f"multi={PAGE_ENVIRONMENT}"]))
+        preamble = (
+            first.preamble[:match.start()]
+            + rf"\documentclass[{options}]{{standalone}}"
+            + first.preamble[match.end():]
+            + rf"\newenvironment{{{PAGE_ENVIRONMENT}}}{{}}{{}}" + "\n"
+        )
+        pages = "".join(rf"\begin{{{PAGE_ENVIRONMENT}}}{job.body}\end{{{PAGE_ENVIRONMENT}}}" + "\n" for job in jobs)
+        source = preamble + "\\begin{document}\n" + pages + "\\end{document}\n"
+        tex_dir = Path(first.svg_path).parent
+        stem = "batch-" + hashlib.sha256(source.encode()).hexdigest()[:16]
+        tex_file = tex_dir / f"{stem}.tex"
+        tex_file.write_text(source, encoding="utf-8")
+        svgs = _typeset(tex_file, first.compiler, first.output_format, f"{stem}-%p.svg")
+        _cleanup(tex_file)
+        tex_file.unlink(missing_ok=True)
+        if len(svgs) == len(jobs):
+            for svg, job in zip(svgs, jobs):
+                svg.replace(job.svg_path)
+            return 0
+        for svg in svgs:
+            svg.unlink(missing_ok=True)
+    failed = 0
+    for job in jobs:
+        if not _compile_one(job):
+            failed += 1
+        _cleanup(Path(job.svg_path))
+    return failed
+
+
+def compile_jobs(jobs, workers=None):
+    """Typeset `jobs` in batches by preamble, split over `workers` threads.
+
+    Returns (number of latex documents, number of expressions that failed).
+    """
+    workers = workers or os.cpu_count() or 1
+    jobs = [job for job in {job.svg_path: job for job in jobs}.values() if not Path(job.svg_path).exists()]
+    groups = {}
+    for job in jobs:
+        groups.setdefault((job.preamble, job.compiler, job.output_format), []).append(job)
+
+    # latex and dvisvgm are separate processes, so threads keep them all busy
+    chunks = []
+    for group in groups.values():
+        size = math.ceil(len(group) / max(1, workers // len(groups)))
+        chunks += [group[i:i + size] for i in range(0, len(group), size)]
+    if not chunks:
+        return 0, 0
+    with ThreadPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+        failed = sum(pool.map(compile_chunk, chunks))
+    return len(chunks), failed
+
+
+def prepare_tex(scenes, options, jobs=None, log=print):
+    """Collect the LaTeX of `scenes` in a process pool and typeset it in batches."""
+    jobs = jobs or os.cpu_count() or 1
+    start = time.perf_counter()
+    scenes = [scene for scene in scenes if uses_tex(scene.path)]
+    if not scenes:
+        return []
+
+    tex_jobs = []
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(scenes)),
+        mp_context=get_context("spawn"),
+        max_tasks_per_child=1,
+    ) as pool:
+        futures = [pool.submit(_collect_job, scene, options) for scene in scenes]
+        for future in as_completed(futures):
+            label, found, error = future.result()
+            if error:
+                # The render itself will fail and report it; LaTeX is just not prepared
+                log(f"LaTeX pre-pass skipped {label}:\n{error}")
+            tex_jobs += found
+
+    documents, failed = compile_jobs(tex_jobs, workers=jobs)
+    expressions = len({job.svg_path for job in tex_jobs})
+    log(f"{time.perf_counter() - start:8.1f}s  LaTeX: {expressions} expressions from {len(scenes)} scenes "
+        f"in {documents} documents" + (f", {failed} failed" if failed else ""))
+    return tex_jobs
+
+
+def main(argv=None):
+    from .render import RenderOptions
+
+    parser = argparse.ArgumentParser(prog="python -m blog_anim.texbatch", description=__doc__.splitlines()[0])
+    parser.add_argument("scenes", nargs="*", help="scene names, scene files or topic folders (default: all)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="worker processes (default: all cores)")
+    parser.add_argument("--media-dir", default=str(RenderOptions.media_dir))
+    args = parser.parse_args(argv)
+
+    scenes = select_scenes(find_scenes(), args.scenes)
+    if not scenes:
+        parser.error(f"no scenes match {' '.join(args.scenes)}")
+    prepare_tex(scenes, RenderOptions(media_dir=args.media_dir), jobs=args.jobs)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,31 @@
+"""Build each distinct label string once.
+
+Creating a ``Text`` runs a Pango layout and parses the resulting SVG, which is
+far too slow to do on every frame of an updater. Labels that cycle through a
+handful of strings (a rounded speed, a step counter) can ask the cache
+instead and only pay for strings they have not shown before.
+
+    speed_labels = TextCache(font_size=16, color=RED)
+    label = speed_labels("Speed: 72 km/h").copy()
+    ...
+    label.become(speed_labels("Speed: 18 km/h"))  # in an updater
+"""
+
+from manim import Text
+
+
+class TextCache:
+    def __init__(self, mobject_class=Text, **kwargs):
+        self.mobject_class = mobject_class
+        self.kwargs = kwargs
+        self._mobjects = {}
+
+    def __call__(self, text):
+        """The cached mobject for `text`; copy it before changing it."""
+        mobject = self._mobjects.get(text)
+        if mobject is None:
+            mobject = self._mobjects[text] = self.mobject_class(text, **self.kwargs)
+        return mobject
+
+    def __len__(self):
+        return len(self._mobjects)
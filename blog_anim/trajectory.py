@@ -0,0 +1,140 @@
+"""A whole descent path drawn in one ``play``.
+
+The learning-rate scenes used to draw each step with its own
+``self.play(Create(line), FadeIn(new_dot))`` and ``self.wait(...)``, two
+partial movie files (and two ffmpeg runs) per step. ``Trajectory`` holds the
+segments of a precomputed path as one polyline plus a dot per step, and
+``TrajectoryAnimation`` replays the same per-step timing in a single
+animation: each step grows its segment and fades in its dot over
+`step_time`, then holds for `pause`. ``TrajectoryBundle`` does the same for
+many trajectories stepping together, as one path of trails and one of
+heads.
+
+    trajectory = Trajectory(points, color=YELLOW, dot_color=RED, dot_radius=0.08)
+    self.play(TrajectoryAnimation(trajectory, step_time=0.4, pause=0.2))
+"""
+
+import numpy as np
+from manim import YELLOW, Animation, Dot, VGroup, VMobject, linear, smooth
+
+from .polyline import corners_to_bezier
+
+
+class Trajectory(VGroup):
+    """Segments through `points` (n, 3) and a dot at every point after the first.
+
+    ``line`` is one VMobject for all segments; ``dots`` holds the n - 1 dots,
+    in step order. Fully drawn as built. While partly drawn, ``dots`` holds
+    the dots reached so far merged into one VMobject, plus the one fading
+    in, so a frame draws three paths however many steps are shown.
+    """
+
+    def __init__(self, points, color=YELLOW, stroke_width=2, dot_color=YELLOW, dot_radius=0.08, **kwargs):
+        super().__init__(**kwargs)
+        self.corners = np.asarray(points, dtype=float).reshape(-1, 3)
+        self.line = VMobject(color=color, stroke_width=stroke_width)
+        self._all_dots = [Dot(point, color=dot_color, radius=dot_radius) for point in self.corners[1:]]
+        self.dots = VGroup(*self._all_dots)
+        # Every dot has the same outline, so the reached ones are one path
+        template = Dot(color=dot_color, radius=dot_radius)
+        self._outline = template.points - template.get_center()
+        self._reached = template
+        self.add(self.line, self.dots)
+        self.set_progress(self.num_steps)
+
+    @property
+    def num_steps(self):
+        return len(self.corners) - 1
+
+    def set_progress(self, steps, fraction=0.0):
+        """Show `steps` whole steps, and `fraction` of the next one."""
+        steps = min(steps, self.num_steps)
+        corners = self.corners[:steps + 1]
+        if steps < self.num_steps and fraction > 0:
+            start, end = self.corners[steps], self.corners[steps + 1]
+            corners = np.concatenate([corners, [start + fraction * (end - start)]])
+        if len(corners) < 2:
+            corners = np.repeat(corners[:1], 2, axis=0)
+        self.line.points = corners_to_bezier(corners)
+
+        if steps == self.num_steps:
+            self.dots.submobjects = list(self._all_dots)
+            for dot in self._all_dots:
+                if dot.get_fill_opacity() != 1.0:
+                    dot.set_fill(opacity=1.0)
+            return self
+
+        self._reached.points = (self.corners[1:steps + 1, None] + self._outline).reshape(-1, 3)
+        self.dots.submobjects = [self._reached]
+        if fraction > 0:
+            fading = self._all_dots[steps]
+            fading.set_fill(opacity=fraction)
+            self.dots.submobjects.append(fading)
+        return self
+
+
+class TrajectoryBundle(VGroup):
+    """Many trajectories stepping together, drawn as two paths in all.
+
+    `points` is (steps + 1, n, 3), one column per trajectory. ``lines`` holds
+    every trail as subpaths of one VMobject and ``heads`` a dot at the front
+    of each trail, also as one VMobject; a frame redraws the two whatever n
+    is. Works with TrajectoryAnimation like a single Trajectory.
+    """
+
+    def __init__(self, points, color=YELLOW, stroke_width=2, head_color=YELLOW, head_radius=0.05, **kwargs):
+        super().__init__(**kwargs)
+        self.corners = np.asarray(points, dtype=float)
+        self.lines = VMobject(color=color, stroke_width=stroke_width)
+        self.heads = Dot(color=head_color, radius=head_radius)
+        self._outline = self.heads.points - self.heads.get_center()
+        self.add(self.lines, self.heads)
+        self.set_progress(self.num_steps)
+
+    @property
+    def num_steps(self):
+        return len(self.corners) - 1
+
+    def set_progress(self, steps, fraction=0.0):
+        """Show `steps` whole steps of every trail, and `fraction` of the next."""
+        steps = min(steps, self.num_steps)
+        corners = self.corners[:steps + 1]
+        if steps < self.num_steps and fraction > 0:
+            front = corners[-1] + fraction * (self.corners[steps + 1] - corners[-1])
+            corners = np.concatenate([corners, front[None]])
+        if len(corners) < 2:
+            corners = np.repeat(corners[:1], 2, axis=0)
+        self.lines.points = corners_to_bezier(np.swapaxes(corners, 0, 1)).reshape(-1, 3)
+        self.heads.points = (corners[-1][:, None] + self._outline).reshape(-1, 3)
+        return self
+
+
+class TrajectoryAnimation(Animation):
+    """Draw a Trajectory (or bundle) step by step: `step_time` to draw, then `pause`.
+
+    `step_rate_func` shapes each step (like the rate func of the Create and
+    FadeIn it replaces); the run time is the sum of all steps and pauses.
+    """
+
+    def __init__(self, trajectory, step_time=0.4, pause=0.2, step_rate_func=smooth, **kwargs):
+        self.step_time = step_time
+        self.pause = pause
+        self.step_rate_func = step_rate_func
+        # Length of the original timeline of plays and waits
+        self.duration = trajectory.num_steps * (step_time + pause)
+        kwargs.setdefault("run_time", self.duration)
+        super().__init__(trajectory, rate_func=linear, introducer=True, **kwargs)
+
+    def interpolate_mobject(self, alpha):
+        num_steps = self.mobject.num_steps
+        period = self.step_time + self.pause
+        # alpha * duration // period can land just short of num_steps at the
+        # end (50 * 0.3 / 0.3 is 49.99...), which would leave the last step
+        # half drawn
+        if alpha >= 1 or period <= 0:
+            self.mobject.set_progress(num_steps, 1.0)
+            return
+        t = alpha * self.duration
+        step = min(int(t // period), num_steps)
+        local = (t - step * period) / self.step_time if self.step_time > 0 else 1.0
+        self.mobject.set_progress(step, self.step_rate_func(min(local, 1.0)))
@@ -0,0 +1,291 @@
+"""Re-render scenes as their source changes, with a live preview page.
+
+    python -m blog_anim.watch Gradient-Descent/learning_rate.py
+    python -m blog_anim.watch Gradient/ --port 8100
+    python -m blog_anim.watch                    # every scene
+
+The scene files and the repo helpers they import are polled for changes.
+An edit only re-renders the Scene classes whose render cache key changed
+(their class body, the module-level code around it or a helper they
+import), at preview quality. manim's own partial movie cache stays on, so
+inside a re-rendered scene every ``play`` whose hash did not change is
+reused from the last run rather than drawn again. If a render server is
+running (see blog_anim.server) the scenes go to its warm workers, otherwise
+to a process pool like blog_anim.render.
+
+The newest output of every watched scene is shown on a local page, at
+http://localhost:8000/preview/ by default, which reloads each video or image
+when it is re-rendered.
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import quote
+
+from . import REPO_ROOT
+from .cache import RenderCache, module_dependencies, scene_key
+from .discovery import find_scenes, scenes_in_file, select_scenes
+from .render import QUALITIES, RenderOptions, render_all
+
+# Segments of unchanged plays must survive many edit-render rounds; manim
+# deletes the oldest partial movie files past this many per scene
+MAX_FILES_CACHED = 1000
+
+PREVIEW_PAGE = """<!doctype html>
+<meta charset="utf-8">
+<title>blog_anim preview</title>
+<style>
+  body { background: #111; color: #ddd; font: 14px sans-serif; margin: 1em; }
+  section { margin-bottom: 2em; }
+  video, img { max-width: 100%; background: #000; }
+  .time { color: #888; }
+</style>
+<main id="scenes">Waiting for the first render...</main>
+<script>
+let version = null;
+async function refresh() {
+  try {
+    const state = await (await fetch("state.json", {cache: "no-store"})).json();
+    if (state.version === version) return;
+    version = state.version;
+    const main = document.getElementById("scenes");
+    main.textContent = "";
+    for (const scene of state.scenes) {
+      const section = document.createElement("section");
+      section.innerHTML = `<h3>${scene.label} <span class="time">${scene.updated}</span></h3>`;
+      for (const url of scene.outputs) {
+        const media = document.createElement(/\\.(mp4|mov|webm)$/.test(url) ? "video" : "img");
+        media.src = `${url}?v=${scene.version}`;
+        if (media.tagName === "VIDEO") Object.assign(media, {controls: true, autoplay: true, loop: true, muted: true});
+        section.appendChild(media);
+      }
+      main.appendChild(section);
+    }
+  } catch (error) {}
+}
+refresh();
+setInterval(refresh, 1000);
+</script>
+"""
+
+
+class Preview:
+    """The preview page in <media_dir>/preview and the state it polls."""
+
+    def __init__(self, media_dir):
+        self.media_dir = Path(media_dir).resolve()
+        self.folder = self.media_dir / "preview"
+        self.folder.mkdir(parents=True, exist_ok=True)
+        (self.folder / "index.html").write_text(PREVIEW_PAGE, encoding="utf-8")
+        self.scenes = {}
+        self.save()
+
+    def _url(self, output):
+        output = Path(output).resolve()
+        if not output.is_relative_to(self.media_dir):
+            return None
+        return "/" + quote(output.relative_to(self.media_dir).as_posix())
+
+    def update(self, label, outputs):
+        urls = [url for url in map(self._url, outputs) if url]
+        self.scenes[label] = {
+            "label": label,
+            "outputs": urls,
+            "version": time.time_ns(),
+            "updated": time.strftime("%H:%M:%S"),
+        }
+        self.save()
+
+    def save(self):
+        # Most recently rendered first
+        scenes = sorted(self.scenes.values(), key=lambda scene: scene["version"], reverse=True)
+        state = {"version": time.time_ns(), "scenes": scenes}
+        tmp = self.folder / "state.json.tmp"
+        tmp.write_text(json.dumps(state), encoding="utf-8")
+        tmp.replace(self.folder / "state.json")
+
+    def serve(self, port):
+        """Serve the media folder on `port` from a background thread."""
+
+        class QuietHandler(SimpleHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+        handler = partial(QuietHandler, directory=str(self.media_dir))
+        server = ThreadingHTTPServer(("localhost", port), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return f"http://localhost:{port}/preview/"
+
+
+class Watcher:
+    """Scene files, the helpers they import, and the last seen key of each scene."""
+
+    def __init__(self, selectors, options):
+        self.selectors = selectors
+        self.options = options
+        self.paths = set()
+        self.mtimes = {}
+        self.keys = {}
+
+    def scenes(self):
+        return select_scenes(find_scenes(), self.selectors)
+
+    def key(self, scene):
+        return scene_key(scene, self.options.manim_config(scene.path, scene.still))
+
+    def watched_files(self, scenes):
+        files = set()
+        for path in {scene.path for scene in scenes}:
+            files.add(path)
+            files.update(module_dependencies(path))
+        return files
+
+    def snapshot(self, files):
+        mtimes = {}
+        for path in files:
+            try:
+                mtimes[path] = path.stat().st_mtime_ns
+            except FileNotFoundError:
+                pass
+        return mtimes
+
+    def start(self):
+        scenes = self.scenes()
+        self.paths = {scene.path for scene in scenes}
+        self.keys = {scene.label: self.key(scene) for scene in scenes}
+        self.mtimes = self.snapshot(self.watched_files(scenes))
+        return scenes
+
+    def changed(self):
+        """Scenes whose key changed since the last call (empty if no file did)."""
+        mtimes = self.snapshot(self.mtimes)
+        if mtimes == self.mtimes:
+            return []
+        # Deleted or renamed scene files are dropped; their mtimes already are
+        self.paths = {path for path in self.paths if path in mtimes}
+        edited = {path for path in self.mtimes.keys() | mtimes.keys() if self.mtimes.get(path) != mtimes.get(path)}
+
+        # Only files that could define or feed a scene are re-parsed
+        scenes = []
+        for path in sorted(self.paths):
+            if path in edited or edited & module_dependencies(path):
+                scenes.extend(scenes_in_file(path))
+        scenes = select_scenes(scenes, self.selectors) if self.selectors else scenes
+
+        changed = []
+        for scene in scenes:
+            key = self.key(scene)
+            if self.keys.get(scene.label) != key:
+                self.keys[scene.label] = key
+                changed.append(scene)
+        # New helper imports are watched from now on
+        self.mtimes = self.snapshot(self.mtimes.keys() | self.watched_files(scenes))
+        return changed
+
+
+def _render(scenes, options, jobs):
+    """Render `scenes` through the render server if one is up, else in a pool."""
+    from . import server
+
+    try:
+        for _ in server.request(server.DEFAULT_SOCKET, {"command": "ping"}):
+            pass
+    except (FileNotFoundError, ConnectionRefusedError):
+        render_all(scenes, options, jobs=jobs)
+        return
+    server.submit(
+        scenes,
+        options={
+            "quality": options.quality,
+            "media_dir": options.media_dir,
+            "overrides": [list(item) for item in options.overrides],
+        },
+        jobs=jobs,
+    )
+
+
+def _lookup(cache, options, scene, keys):
+    return cache.lookup(options.cache_label(scene, scene.still), keys[scene.label])
+
+
+def _show(preview, options, scenes, keys):
+    """Point the preview at the cached outputs of `scenes`, where there are any."""
+    cache = RenderCache(options.media_dir)
+    for scene in scenes:
+        outputs = _lookup(cache, options, scene, keys)
+        if outputs:
+            preview.update(scene.label, outputs)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m blog_anim.watch", description=__doc__.splitlines()[0])
+    parser.add_argument("scenes", nargs="*", help="scene names, scene files or topic folders (default: all)")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="l")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="scenes at a time (default: all cores)")
+    parser.add_argument("--media-dir", default=str(REPO_ROOT / "media"))
+    parser.add_argument("--interval", type=float, default=0.5, help="seconds between polls (default: 0.5)")
+    parser.add_argument("--port", type=int, default=8000, help="preview page port (default: 8000)")
+    parser.add_argument("--no-preview", action="store_true", help="do not serve the preview page")
+    args = parser.parse_args(argv)
+
+    options = RenderOptions(
+        quality=args.quality,
+        media_dir=args.media_dir,
+        overrides=(("max_files_cached", MAX_FILES_CACHED),),
+    )
+    watcher = Watcher(args.scenes, options)
+    scenes = watcher.start()
+    if not scenes:
+        parser.error(f"no scenes match {' '.join(args.scenes)}")
+
+    preview = None
+    if not args.no_preview:
+        preview = Preview(args.media_dir)
+        # Scenes already rendered at this quality are shown straight away
+        _show(preview, options, scenes, watcher.keys)
+        print(f"preview at {preview.serve(args.port)}")
+    print(f"watching {len(scenes)} scenes in {len(watcher.mtimes)} files, Ctrl-C to stop")
+
+    # Scenes edited since their last render (or never rendered) are brought
+    # up to date once, so the preview shows what was asked for
+    cache = RenderCache(args.media_dir)
+    stale = [scene for scene in scenes if _lookup(cache, options, scene, watcher.keys) is None]
+    if stale:
+        print(f"{time.strftime('%H:%M:%S')}  out of date: {', '.join(scene.name for scene in stale)}")
+        _render(stale, options, args.jobs)
+        if preview:
+            _show(preview, options, stale, watcher.keys)
+
+    try:
+        while True:
+            time.sleep(args.interval)
+            try:
+                changed = watcher.changed()
+            except (SyntaxError, OSError) as error:
+                # Mid-edit, or a file was moved while being read; the next
+                # save will parse
+                if isinstance(error, SyntaxError):
+                    print(f"{error.filename}:{error.lineno}: {error.msg}")
+                else:
+                    print(f"{error.filename}: {error.strerror}")
+                watcher.mtimes = watcher.snapshot(watcher.mtimes)
+                continue
+            if not changed:
+                continue
+            print(f"{time.strftime('%H:%M:%S')}  changed: {', '.join(scene.name for scene in changed)}")
+            _render(changed, options, args.jobs)
+            if preview:
+                _show(preview, options, changed, watcher.keys)
+    except KeyboardInterrupt:
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())